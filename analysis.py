@@ -0,0 +1,111 @@
+# import necessary modules
+import logging
+import re
+from fields import DistanceField
+from grid import LEFT, RIGHT, TOP, BOTTOM
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# translation table from the wall flags of a cell to its number of open sides
+OPEN_SIDES = bytes(4 - bin(flags & 15).count("1") for flags in range(256))
+
+# translation tables from the wall flags of a cell to 1 if one wall is open, else 0
+OPEN_MASKS = {wall: bytes(0 if flags & wall else 1 for flags in range(256)) for wall in (LEFT, RIGHT, TOP, BOTTOM)}
+
+# pattern matching an open outer wall in a mask
+OPEN_WALL = re.compile(b"\x01")
+
+# define the MazeAnalysis class, the structural metrics of a maze
+class MazeAnalysis:
+    def __init__(self, num_cells, dead_ends, corridors, three_way, four_way, edges, reachable, solution_length, tortuosity, diameter):
+        self.num_cells = num_cells # total number of cells
+        self.dead_ends = dead_ends # cells with one open side
+        self.corridors = corridors # cells with two open sides
+        self.three_way = three_way # junctions with three open sides
+        self.four_way = four_way # junctions with four open sides
+        self.edges = edges # open walls between neighbouring cells
+        self.reachable = reachable # cells reachable from the entrance
+        self.solution_length = solution_length # steps on a shortest path from entrance to exit, -1 if there is none
+        self.tortuosity = tortuosity # solution length over the manhattan distance from entrance to exit
+        self.diameter = diameter # steps on the longest shortest path between two cells
+
+    # property to count the junctions, cells with more than two open sides
+    @property
+    def junctions(self):
+        return self.three_way + self.four_way
+
+    # property to average the new branches on offer at each junction
+    @property
+    def branching_factor(self):
+        return (2 * self.three_way + 3 * self.four_way) / self.junctions if self.junctions else 0.0
+
+    # property to check if the maze is perfect, with exactly one path between any two cells
+    @property
+    def is_perfect(self):
+        return self.reachable == self.num_cells and self.edges == self.num_cells - 1
+
+    # method to return the metrics as a plain dictionary
+    def as_dict(self):
+        return {
+            "num_cells": self.num_cells,
+            "dead_ends": self.dead_ends,
+            "corridors": self.corridors,
+            "three_way": self.three_way,
+            "four_way": self.four_way,
+            "junctions": self.junctions,
+            "branching_factor": self.branching_factor,
+            "edges": self.edges,
+            "reachable": self.reachable,
+            "is_perfect": self.is_perfect,
+            "solution_length": self.solution_length,
+            "tortuosity": self.tortuosity,
+            "diameter": self.diameter,
+        }
+
+    def __repr__(self):
+        return (f"MazeAnalysis(dead_ends={self.dead_ends}, junctions={self.junctions}, "
+                f"solution_length={self.solution_length}, tortuosity={self.tortuosity:.3f}, diameter={self.diameter})")
+
+# helper to count the open sides of every cell, leaving out the openings in the outer wall
+def _open_sides(grid, walls):
+    num_cols = grid.num_cols
+    sides = bytearray(walls.translate(OPEN_SIDES))
+
+    # the outer wall is only open at a few cells, such as the entrance and exit
+    last_row = (grid.num_rows - 1) * num_cols
+    outer = (
+        (walls[:num_cols], TOP, 0, 1),
+        (walls[last_row:], BOTTOM, last_row, 1),
+        (walls[::num_cols], LEFT, 0, num_cols),
+        (walls[num_cols - 1::num_cols], RIGHT, num_cols - 1, num_cols),
+    )
+    for edge, wall, first, step in outer:
+        for match in OPEN_WALL.finditer(edge.translate(OPEN_MASKS[wall])):
+            sides[first + match.start() * step] -= 1
+    return sides
+
+# function to measure a maze in linear time: two breadth-first searches plus bulk counts over the walls
+def analyze(grid, entrance=0, exit=None):
+    if exit is None:
+        exit = grid.num_cells - 1
+
+    walls = grid.wall_bytes()
+    sides = _open_sides(grid, bytes(walls))
+    edges = sum(count * sides.count(count) for count in range(1, 5)) // 2
+
+    # the search from the entrance gives the solution, and its farthest cell is one end of the diameter
+    field = DistanceField(grid, entrance)
+    distances = field.distances
+    solution_length = distances[exit]
+    entrance_col, entrance_row = grid.position(entrance)
+    exit_col, exit_row = grid.position(exit)
+    manhattan = abs(exit_col - entrance_col) + abs(exit_row - entrance_row)
+    tortuosity = solution_length / manhattan if solution_length > 0 and manhattan else 0.0
+
+    # a second search from that cell reaches the other end, exact on a perfect maze and a lower bound otherwise
+    farthest = distances.index(max(distances))
+    diameter = max(DistanceField(grid, farthest).distances)
+
+    return MazeAnalysis(grid.num_cells, sides.count(1), sides.count(2), sides.count(3), sides.count(4),
+                        edges, field.reached, solution_length, tortuosity, diameter)
@@ -0,0 +1,101 @@
+# import necessary modules
+import logging
+import math
+import time
+from collections import deque
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# define the FrameScheduler class, which plays queued draw steps back at a target frame rate
+class FrameScheduler:
+    # initialize the scheduler for a window
+    def __init__(self, window, fps=60, time_budget=None):
+        self.__window = window # reference to the window object
+        self.__frame_time = 1 / fps # seconds between frames
+        self.__time_budget = time_budget # maximum seconds to play back a backlog, or None
+        self.__steps = deque() # queued (step delay, operations) pairs
+        self.__operations = [] # operations of the step being recorded
+        self.__credit = 0.0 # playback time earned but not yet spent on steps
+        self.__deadline = None # time by which the backlog must be played back
+        self.__active = False # flag to track if a frame callback is scheduled
+
+    # property to count the queued steps
+    @property
+    def pending(self):
+        return len(self.__steps) + (1 if self.__operations else 0)
+
+    # method to set the overall time budget for playing back a backlog
+    def set_time_budget(self, time_budget):
+        self.__time_budget = time_budget
+        if self.__active:
+            self.__deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+    # method to add a draw operation to the step being recorded
+    def schedule(self, operation):
+        self.__operations.append(operation)
+        self.__start()
+
+    # method to close the step being recorded, which takes step_delay seconds to play back
+    def end_step(self, step_delay):
+        self.__steps.append((step_delay, self.__operations))
+        self.__operations = []
+        self.__start()
+
+    # method to play back every queued step immediately
+    def flush(self):
+        self.__close_step()
+        while self.__steps:
+            self.__run_step()
+        self.__window.redraw()
+
+    # private method to move trailing operations into a step of their own
+    def __close_step(self):
+        if self.__operations:
+            self.__steps.append((0, self.__operations))
+            self.__operations = []
+
+    # private method to run the operations of the oldest step
+    def __run_step(self):
+        _, operations = self.__steps.popleft()
+        for operation in operations:
+            operation()
+
+    # private method to start the frame callbacks when a backlog begins
+    def __start(self):
+        if self.__active:
+            return
+        self.__active = True
+        self.__credit = 0.0
+        self.__deadline = None if self.__time_budget is None else time.perf_counter() + self.__time_budget
+        self.__window.after(max(1, round(self.__frame_time * 1000)), self.__tick)
+
+    # private method to play back one frame worth of steps
+    def __tick(self):
+        self.__close_step()
+        self.__credit += self.__frame_time
+
+        # play back the steps whose delays fit in the time earned so far
+        count = 0
+        for step_delay, _ in self.__steps:
+            if step_delay > self.__credit:
+                break
+            self.__credit -= step_delay
+            count += 1
+
+        # play back extra steps if the backlog would otherwise overrun the time budget
+        if self.__deadline is not None:
+            remaining = self.__deadline - time.perf_counter()
+            if remaining <= self.__frame_time:
+                count = len(self.__steps)
+            else:
+                count = max(count, math.ceil(len(self.__steps) * self.__frame_time / remaining))
+
+        for _ in range(min(count, len(self.__steps))):
+            self.__run_step()
+
+        # keep ticking until the backlog is played back
+        if self.__steps:
+            self.__window.after(max(1, round(self.__frame_time * 1000)), self.__tick)
+        else:
+            self.__active = False
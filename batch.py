@@ -0,0 +1,71 @@
+# import necessary modules
+import json
+import logging
+import multiprocessing
+import random
+import time
+from maze import Maze
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# function to derive a reproducible seed for one maze of a batch
+def derive_seed(base_seed, index):
+    # string seeds are hashed with SHA-512, so the result is the same in every process
+    return random.Random(f"{base_seed}:{index}").getrandbits(63)
+
+# function to generate and solve, or analyze, a single maze of a batch, run inside a worker process
+def run_job(job):
+    index, seed, num_cols, num_rows, generator, algorithm, analyze = job
+
+    # generate the maze headless
+    start_time = time.perf_counter()
+    maze = Maze(0, 0, num_rows, num_cols, 1, 1, seed=seed, generator=generator)
+    generate_time = time.perf_counter() - start_time
+    record = {
+        "index": index,
+        "seed": seed,
+        "num_cols": num_cols,
+        "num_rows": num_rows,
+        "generator": generator,
+    }
+
+    # score the maze for filtering, which covers the solution length without running a solver
+    if analyze:
+        start_time = time.perf_counter()
+        record.update(maze.analyze().as_dict())
+        record["generate_time"] = generate_time
+        record["analyze_time"] = time.perf_counter() - start_time
+        return record
+
+    # solve it and report the result
+    result = maze.search(algorithm)
+    record.update({
+        "algorithm": algorithm,
+        "path_length": len(result.path),
+        "nodes_expanded": result.nodes_expanded,
+        "peak_frontier": result.peak_frontier,
+        "generate_time": generate_time,
+        "solve_time": result.elapsed_time,
+    })
+    return record
+
+# function to generate and solve (or analyze) a batch of mazes across a process pool, streaming JSONL records
+def run_batch(output, count, num_cols, num_rows, base_seed=0, workers=None, generator="backtracker", algorithm="dfs", analyze=False):
+    jobs = ((index, derive_seed(base_seed, index), num_cols, num_rows, generator, algorithm, analyze) for index in range(count))
+    workers = workers or multiprocessing.cpu_count()
+
+    # a single worker runs in this process to skip the pool start-up cost
+    if workers == 1:
+        for record in map(run_job, jobs):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+        return count
+
+    # hand out jobs in chunks so each worker stays busy, and write records in batch order as they finish
+    chunksize = max(1, count // (workers * 4))
+    with multiprocessing.Pool(workers) as pool:
+        for record in pool.imap(run_job, jobs, chunksize):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    return count
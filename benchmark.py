@@ -0,0 +1,345 @@
+# import necessary modules
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import platform
+import tracemalloc
+from datetime import datetime, timezone
+from generators import GENERATORS, make_rng, random_weights
+from graphics import Window
+from maze import Maze
+from solvers import SOLVERS, path_cost
+from standins import StandInRoot, StandInCanvas
+from tiled import TILE_SIZE, generate_tiled
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# default grid sizes (columns x rows) to benchmark
+DEFAULT_SIZES = [(10, 10), (50, 50), (100, 100), (250, 250), (500, 500)]
+
+# function to time headless maze generation for a single grid size
+def benchmark_generation(num_cols, num_rows, repeats=1, seed=0, generator="backtracker"):
+    # record the best time across all repeats
+    best_time = None
+    for repeat in range(repeats):
+        start_time = time.perf_counter()
+        Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed + repeat, generator=generator)
+        elapsed_time = time.perf_counter() - start_time
+
+        # keep the fastest run
+        if best_time is None or elapsed_time < best_time:
+            best_time = elapsed_time
+
+    # return the best time and the matching throughput
+    num_cells = num_cols * num_rows
+    return best_time, num_cells / best_time
+
+# function to measure the memory held by a headless maze for a single grid size
+def benchmark_memory(num_cols, num_rows, seed=0, generator="backtracker"):
+    # trace allocations while the maze is built
+    tracemalloc.start()
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed, generator=generator)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # return the retained and peak bytes per cell
+    num_cells = num_cols * num_rows
+    return current / num_cells, peak / num_cells
+
+# function to compare loading a saved maze against generating it again
+def benchmark_load(num_cols, num_rows, seed=0, generator="backtracker"):
+    # generate the maze once and save it to a temporary file
+    start_time = time.perf_counter()
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed, generator=generator)
+    generate_time = time.perf_counter() - start_time
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.bin")
+        maze.save(path)
+        file_size = os.path.getsize(path)
+
+        # time opening the saved maze
+        start_time = time.perf_counter()
+        Maze.load(path)
+        load_time = time.perf_counter() - start_time
+
+    return generate_time, load_time, file_size
+
+# generators compared on time and peak memory, the original backtracker first as the baseline
+COMPARED_GENERATORS = ["backtracker", "kruskal", "wilsons"]
+
+# function to time each generator at one grid size and trace its peak memory
+def benchmark_generators(num_cols, num_rows, generators=None, repeats=1, seed=0):
+    rows = []
+    for generator in generators or COMPARED_GENERATORS:
+        elapsed_time, _ = benchmark_generation(num_cols, num_rows, repeats, seed, generator)
+        _, peak = benchmark_memory(num_cols, num_rows, seed, generator)
+        rows.append((generator, elapsed_time, peak))
+    return rows
+
+# function to time tiled generation of one maze for each worker count, against generating it on one core
+def benchmark_tiled(num_cols, num_rows, worker_counts, tile_size=TILE_SIZE, seed=0, generator="backtracker"):
+    baseline_time, _ = benchmark_generation(num_cols, num_rows, 1, seed, generator)
+    rows = []
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        generate_tiled(num_cols, num_rows, seed, workers, tile_size, generator)
+        rows.append((workers, time.perf_counter() - start_time))
+    return baseline_time, rows
+
+# solvers compared on braided, weighted grids, the existing DFS first as the baseline
+WEIGHTED_ALGORITHMS = ["dfs", "bfs", "astar", "dijkstra", "weighted_astar"]
+
+# function to time each solver on the same braided maze with random cell weights
+def benchmark_weighted(num_cols, num_rows, braid=0.5, max_weight=9, repeats=1, seed=0, generator="backtracker"):
+    maze = Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed, generator=generator, braid=braid)
+    maze.set_weights(random_weights(num_cols * num_rows, make_rng(seed), max_weight))
+
+    # keep the fastest run of each solver, with the cost of the path it found
+    rows = []
+    for algorithm in WEIGHTED_ALGORITHMS:
+        best = None
+        for repeat in range(repeats):
+            result = maze.search(algorithm)
+            if best is None or result.elapsed_time < best.elapsed_time:
+                best = result
+        rows.append((algorithm, best.elapsed_time, best.nodes_expanded, path_cost(maze.grid, best.path)))
+    return rows
+
+# script run in a fresh interpreter to time importing maze and building a small headless maze
+STARTUP_SCRIPT = """
+import json, sys, time
+start_time = time.perf_counter()
+from maze import Maze
+import_time = time.perf_counter() - start_time
+start_time = time.perf_counter()
+Maze(0, 0, 10, 10, 10, 10, seed=0)
+print(json.dumps({"import_time": import_time, "maze_time": time.perf_counter() - start_time, "tkinter_loaded": "tkinter" in sys.modules}))
+"""
+
+# function to time a cold start of the headless maze module without a display
+def benchmark_startup(repeats=5):
+    # run each start in a fresh interpreter with no display available
+    env = dict(os.environ)
+    env.pop("DISPLAY", None)
+    runs = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                env=env, capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output))
+
+    # return the median times and whether any run loaded tkinter
+    return (statistics.median(run["import_time"] for run in runs),
+            statistics.median(run["maze_time"] for run in runs),
+            any(run["tkinter_loaded"] for run in runs))
+
+# grid sizes (columns x rows) covered by the full suite
+SUITE_SIZES = [(10, 10), (100, 100), (1000, 1000)]
+
+# function to pick the value at a percentile of a list of measurements
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+# function to time an operation, then trace one more run for its peak memory
+def measure(operation, repeats, num_cells):
+    times = []
+    for repeat in range(repeats):
+        start_time = time.perf_counter()
+        operation(repeat)
+        times.append(time.perf_counter() - start_time)
+
+    # tracing slows allocation down, so peak memory comes from a separate run
+    tracemalloc.start()
+    operation(0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = percentile(times, 0.5)
+    return {
+        "repeats": repeats,
+        "min": min(times),
+        "p50": median,
+        "p90": percentile(times, 0.9),
+        "p99": percentile(times, 0.99),
+        "max": max(times),
+        "mean": statistics.fmean(times),
+        "cells_per_second": num_cells / median if median > 0 else None,
+        "peak_memory": peak,
+    }
+
+# function to run the full suite of generation, solving and rendering benchmarks
+def run_suite(sizes, repeats=5, seed=0, generators=None, algorithms=None):
+    results = []
+    for num_cols, num_rows in sizes:
+        num_cells = num_cols * num_rows
+        size = f"{num_cols}x{num_rows}"
+
+        # helper to record the measurements of one benchmark
+        def record(benchmark, variant, operation):
+            logging.info(f"Benchmarking {benchmark} {variant} at {size}...")
+            results.append(dict(benchmark=benchmark, variant=variant, size=size, cells=num_cells,
+                                **measure(operation, repeats, num_cells)))
+
+        # headless construction with each generator
+        for generator in generators or sorted(GENERATORS):
+            record("generate", generator, lambda repeat, generator=generator:
+                   Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed + repeat, generator=generator))
+
+        # each solver on the same maze
+        maze = Maze(0, 0, num_rows, num_cols, 10, 10, seed=seed)
+        for algorithm in algorithms or sorted(SOLVERS):
+            record("solve", algorithm, lambda repeat, algorithm=algorithm: maze.search(algorithm))
+
+        # a bulk render pass into a fresh stand-in canvas
+        record("render", "draw_grid", lambda repeat:
+               Window(800, 600, StandInRoot(), StandInCanvas()).draw_grid(maze.grid, 0, 0, 10, 10))
+
+    return results
+
+# function to describe the machine and commit a suite ran on
+def suite_metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+# function to compare a suite against an earlier one, returning (key, old p50, new p50, ratio) rows
+def compare_suites(old, new):
+    old_results = {(result["benchmark"], result["variant"], result["size"]): result for result in old["results"]}
+    rows = []
+    for result in new["results"]:
+        key = (result["benchmark"], result["variant"], result["size"])
+        if key in old_results and old_results[key]["p50"] > 0:
+            rows.append((key, old_results[key]["p50"], result["p50"], result["p50"] / old_results[key]["p50"]))
+    return rows
+
+# function to parse a grid size such as "100x100"
+def parse_size(text):
+    num_cols, num_rows = text.lower().split("x")
+    return int(num_cols), int(num_rows)
+
+# main function
+def main(argv=None):
+    # parse command line arguments
+    parser = argparse.ArgumentParser(description="Benchmark headless maze generation.")
+    parser.add_argument("sizes", nargs="*", type=parse_size, help="grid sizes as COLSxROWS")
+    parser.add_argument("--repeats", type=int, default=1, help="number of runs per size")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for generation")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="backtracker", help="generation algorithm")
+    parser.add_argument("--memory", action="store_true", help="report bytes per cell instead of throughput")
+    parser.add_argument("--startup", action="store_true", help="report headless import and first maze time")
+    parser.add_argument("--load", action="store_true", help="compare loading a saved maze against generating it")
+    parser.add_argument("--generators", action="store_true", help="compare the time and peak memory of the spanning tree generators against the backtracker")
+    parser.add_argument("--tiled", action="store_true", help="time tiled generation across 1, 2, 4... worker processes against one core")
+    parser.add_argument("--tile-size", type=int, default=TILE_SIZE, help="tile width and height in cells for --tiled")
+    parser.add_argument("--weighted", action="store_true", help="time the solvers on braided mazes with random cell weights")
+    parser.add_argument("--braid", type=float, default=0.5, help="fraction of dead ends removed for --weighted")
+    parser.add_argument("--max-weight", type=int, default=9, help="largest random cell weight for --weighted")
+    parser.add_argument("--suite", action="store_true", help="run the full suite and write JSON results")
+    parser.add_argument("--output", default="-", help="JSON output file for --suite (default: stdout)")
+    parser.add_argument("--compare", metavar="JSON", help="earlier --suite output to compare the new results against")
+    args = parser.parse_args(argv)
+
+    # run the full suite and write machine-readable results
+    if args.suite:
+        suite = {"metadata": suite_metadata(), "results": run_suite(args.sizes or SUITE_SIZES, args.repeats, args.seed)}
+        text = json.dumps(suite, indent=2)
+        if args.output == "-":
+            print(text)
+        else:
+            with open(args.output, "w") as file:
+                file.write(text + "\n")
+
+        # report how the median times moved since the earlier run
+        if args.compare:
+            with open(args.compare) as file:
+                old = json.load(file)
+            for (benchmark, variant, size), old_p50, new_p50, ratio in compare_suites(old, suite):
+                flag = "  REGRESSION" if ratio > 1.1 else ""
+                logging.info(f"{benchmark:>8} {variant:>14} {size:>10}: {old_p50:.6f}s -> {new_p50:.6f}s ({ratio:.2f}x){flag}")
+        return
+
+    # report each generator's time and peak memory against the backtracker at the same sizes
+    if args.generators:
+        print(f"{'size':>12} {'generator':>12} {'seconds':>10} {'vs backtracker':>15} {'peak/cell':>10}")
+        for num_cols, num_rows in args.sizes or DEFAULT_SIZES:
+            rows = benchmark_generators(num_cols, num_rows, None, args.repeats, args.seed)
+            baseline_time = rows[0][1]
+            size = f"{num_cols}x{num_rows}"
+            for generator, elapsed_time, peak in rows:
+                print(f"{size:>12} {generator:>12} {elapsed_time:>10.3f} {elapsed_time / baseline_time:>14.2f}x {peak:>10.2f}")
+        return
+
+    # report how tiled generation scales with the number of worker processes
+    if args.tiled:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= os.cpu_count():
+            worker_counts.append(worker_counts[-1] * 2)
+        print(f"{'size':>12} {'workers':>8} {'seconds':>10} {'vs one core':>12}")
+        for num_cols, num_rows in args.sizes or DEFAULT_SIZES:
+            baseline_time, rows = benchmark_tiled(num_cols, num_rows, worker_counts, args.tile_size, args.seed, args.generator)
+            size = f"{num_cols}x{num_rows}"
+            print(f"{size:>12} {'maze':>8} {baseline_time:>10.3f} {1:>11.2f}x")
+            for workers, elapsed_time in rows:
+                print(f"{size:>12} {workers:>8} {elapsed_time:>10.3f} {baseline_time / elapsed_time:>11.2f}x")
+        return
+
+    # report each solver's time and path cost against DFS on the same weighted grids
+    if args.weighted:
+        print(f"{'size':>12} {'algorithm':>16} {'seconds':>10} {'vs dfs':>8} {'expanded':>10} {'path cost':>10}")
+        for num_cols, num_rows in args.sizes or DEFAULT_SIZES:
+            rows = benchmark_weighted(num_cols, num_rows, args.braid, args.max_weight, args.repeats, args.seed, args.generator)
+            dfs_time = rows[0][1]
+            size = f"{num_cols}x{num_rows}"
+            for algorithm, elapsed_time, nodes_expanded, cost in rows:
+                print(f"{size:>12} {algorithm:>16} {elapsed_time:>10.4f} {elapsed_time / dfs_time:>7.2f}x {nodes_expanded:>10} {cost:>10}")
+        return
+
+    # report load time against generation time for each grid size
+    if args.load:
+        print(f"{'size':>12} {'file bytes':>12} {'generate s':>12} {'load s':>12}")
+        for num_cols, num_rows in args.sizes or DEFAULT_SIZES:
+            generate_time, load_time, file_size = benchmark_load(num_cols, num_rows, args.seed, args.generator)
+            size = f"{num_cols}x{num_rows}"
+            print(f"{size:>12} {file_size:>12} {generate_time:>12.4f} {load_time:>12.6f}")
+        return
+
+    # report the cold start time of the headless path
+    if args.startup:
+        import_time, maze_time, tkinter_loaded = benchmark_startup(args.repeats)
+        print(f"import maze: {import_time * 1000:.1f} ms, 10x10 maze: {maze_time * 1000:.1f} ms, tkinter loaded: {tkinter_loaded}")
+        return
+
+    # report bytes per cell for each grid size
+    if args.memory:
+        print(f"{'size':>12} {'cells':>10} {'bytes/cell':>12} {'peak/cell':>12}")
+        for num_cols, num_rows in args.sizes or DEFAULT_SIZES:
+            retained, peak = benchmark_memory(num_cols, num_rows, args.seed, args.generator)
+            size = f"{num_cols}x{num_rows}"
+            print(f"{size:>12} {num_cols * num_rows:>10} {retained:>12.2f} {peak:>12.2f}")
+        return
+
+    # report cells per second for each grid size
+    print(f"{'size':>12} {'cells':>10} {'seconds':>10} {'cells/s':>12}")
+    for num_cols, num_rows in args.sizes or DEFAULT_SIZES:
+        elapsed_time, throughput = benchmark_generation(num_cols, num_rows, args.repeats, args.seed, args.generator)
+        size = f"{num_cols}x{num_rows}"
+        print(f"{size:>12} {num_cols * num_rows:>10} {elapsed_time:>10.3f} {throughput:>12.0f}")
+
+# entry point of the program
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # import necessary modules
 import logging
 from graphics import Point, Line
+from grid import LEFT, RIGHT, TOP, BOTTOM
 
 # configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -28,10 +29,7 @@ class Cell:
             raise ValueError("Window is not set for the cell.")
 
         # store the cell coordinates
-        self.__x1 = x1
-        self.__y1 = y1
-        self.__x2 = x2
-        self.__y2 = y2
+        self.set_coordinates(x1, y1, x2, y2)
 
         # check if right wall exists and draw it
         if self.has_right_wall:
@@ -65,6 +63,13 @@ class Cell:
             line = Line(Point(x1, y2), Point(x2, y2))
             self.window.draw_line(line, "white")
 
+    # method to store the cell coordinates used for drawing moves
+    def set_coordinates(self, x1, y1, x2, y2):
+        self.__x1 = x1
+        self.__y1 = y1
+        self.__x2 = x2
+        self.__y2 = y2
+
     # method to draw a move from this cell to another cell
     def draw_move(self, to_cell, undo=False):
         # if no window is set, skip drawing for testing purposes
@@ -91,4 +96,102 @@ class Cell:
         line = Line(Point(x_centre, y_centre), Point(x_centre2, y_centre2))
 
         # draw the line on the window
-        self.window.draw_line(line, fill_colour)
\ No newline at end of file
+        self.window.draw_line(line, fill_colour)
+
+# helper to create a property backed by one wall bit of a grid cell
+def _wall_property(wall):
+    # read the wall bit from the grid
+    def getter(self):
+        return bool(self.grid.walls[self.index] & wall)
+
+    # write the wall bit to the grid, leaving the neighbouring cell untouched like a Cell would
+    def setter(self, value):
+        if value:
+            self.grid.walls[self.index] |= wall
+        else:
+            self.grid.walls[self.index] &= ~wall
+
+    return property(getter, setter)
+
+# define the GridCell class, a Cell-compatible view of one cell in a packed Grid
+class GridCell(Cell):
+    # initialize the view without allocating any per-cell state in the grid
+    def __init__(self, grid, col, row, window=None):
+        self.grid = grid # reference to the grid storing the cell
+        self.index = grid.index(col, row) # index of the cell in the grid
+        self.window = window # reference to the window object
+        self.set_coordinates(-1, -1, -1, -1)
+
+    has_left_wall = _wall_property(LEFT)
+    has_right_wall = _wall_property(RIGHT)
+    has_top_wall = _wall_property(TOP)
+    has_bottom_wall = _wall_property(BOTTOM)
+
+    # property to read and write the visited flag in the grid
+    @property
+    def visited(self):
+        return bool(self.grid.visited[self.index])
+
+    @visited.setter
+    def visited(self, value):
+        self.grid.visited[self.index] = 1 if value else 0
+
+# define the GridCells class, indexed as cells[col][row] like the original list of lists
+class GridCells:
+    # initialize the view with the grid and the geometry of the maze
+    def __init__(self, grid, window=None, x1=0, y1=0, cell_size_x=0, cell_size_y=0):
+        self.grid = grid # reference to the grid storing the cells
+        self.window = window # reference to the window object
+        self.x1 = x1 # top-left x-coordinate of the maze
+        self.y1 = y1 # top-left y-coordinate of the maze
+        self.cell_size_x = cell_size_x # width of each cell
+        self.cell_size_y = cell_size_y # height of each cell
+
+    # method to create a view of the cell at a specific column and row
+    def cell(self, col, row):
+        cell = GridCell(self.grid, col, row, self.window)
+        x1 = self.x1 + col * self.cell_size_x
+        y1 = self.y1 + row * self.cell_size_y
+        cell.set_coordinates(x1, y1, x1 + self.cell_size_x, y1 + self.cell_size_y)
+        return cell
+
+    # method to copy the cell at a specific column and row into a standalone Cell
+    def snapshot(self, col, row):
+        cell = Cell(self.window)
+        walls = self.grid.walls[self.grid.index(col, row)]
+        cell.has_left_wall = bool(walls & LEFT)
+        cell.has_right_wall = bool(walls & RIGHT)
+        cell.has_top_wall = bool(walls & TOP)
+        cell.has_bottom_wall = bool(walls & BOTTOM)
+        x1 = self.x1 + col * self.cell_size_x
+        y1 = self.y1 + row * self.cell_size_y
+        cell.set_coordinates(x1, y1, x1 + self.cell_size_x, y1 + self.cell_size_y)
+        return cell
+
+    def __len__(self):
+        return self.grid.num_cols
+
+    def __getitem__(self, col):
+        # support negative indices and stop iteration at the last column
+        if col < 0:
+            col += self.grid.num_cols
+        if not 0 <= col < self.grid.num_cols:
+            raise IndexError("column index out of range")
+        return _GridColumn(self, col)
+
+# define the _GridColumn class, a single column of cell views
+class _GridColumn:
+    def __init__(self, cells, col):
+        self.__cells = cells # reference to the grid cells view
+        self.__col = col # column of the grid this view covers
+
+    def __len__(self):
+        return self.__cells.grid.num_rows
+
+    def __getitem__(self, row):
+        # support negative indices and stop iteration at the last row
+        if row < 0:
+            row += self.__cells.grid.num_rows
+        if not 0 <= row < self.__cells.grid.num_rows:
+            raise IndexError("row index out of range")
+        return self.__cells.cell(self.__col, row)
@@ -0,0 +1,38 @@
+# import necessary modules
+import logging
+from array import array
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# define the DisjointSet class, a union-find over integers 0..size-1 held in flat arrays
+class DisjointSet:
+    def __init__(self, size):
+        self.parents = array("i", range(size)) # parent of each element, roots are their own parent
+        self.ranks = bytearray(size) # upper bound on the height of each root's tree
+        self.count = size # number of disjoint sets
+
+    # method to find the root of an element's set, halving the path on the way up
+    def find(self, element):
+        parents = self.parents
+        while parents[element] != element:
+            parents[element] = parents[parents[element]]
+            element = parents[element]
+        return element
+
+    # method to merge the sets of two elements by rank, returning False if they were already joined
+    def union(self, a, b):
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+
+        # hang the shallower tree under the deeper one
+        ranks = self.ranks
+        if ranks[a] < ranks[b]:
+            a, b = b, a
+        self.parents[b] = a
+        if ranks[a] == ranks[b]:
+            ranks[a] += 1
+        self.count -= 1
+        return True
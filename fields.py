@@ -0,0 +1,118 @@
+# import necessary modules
+import logging
+from array import array
+from collections import OrderedDict, deque
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# default memory budget for cached distance fields, in bytes
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# define the DistanceField class, the BFS distance and parent of every cell from one source
+class DistanceField:
+    def __init__(self, grid, source):
+        self.source = source # index of the source cell
+        self.distances = array("i", [-1]) * grid.num_cells # steps from the source, -1 if unreachable
+        self.parents = array("i", [-1]) * grid.num_cells # previous cell on a shortest path, -1 for the source
+        self.reached = 0 # number of cells reachable from the source
+        self.edges = 0 # number of open walls between reachable cells
+
+        # breadth-first search over the whole grid
+        distances = self.distances
+        parents = self.parents
+        open_neighbours = grid.open_neighbours
+        distances[source] = 0
+        frontier = deque([source])
+        degrees = 0
+        while frontier:
+            cell = frontier.popleft()
+            distance = distances[cell] + 1
+            neighbours = open_neighbours(cell)
+            degrees += len(neighbours)
+            for next_cell in neighbours:
+                if distances[next_cell] < 0:
+                    distances[next_cell] = distance
+                    parents[next_cell] = cell
+                    frontier.append(next_cell)
+            self.reached += 1
+        self.edges = degrees // 2
+
+    # property to report the memory held by the field
+    @property
+    def nbytes(self):
+        return (len(self.distances) + len(self.parents)) * self.distances.itemsize
+
+    # method to check if the reachable cells form a tree, with exactly one path between any two
+    def is_tree(self):
+        return self.edges == self.reached - 1
+
+    # method to list the cells from the source to a target, empty if unreachable
+    def path_to(self, target):
+        if self.distances[target] < 0:
+            return []
+        path = [target]
+        parents = self.parents
+        while target != self.source:
+            target = parents[target]
+            path.append(target)
+        path.reverse()
+        return path
+
+    # method to list the cells between two targets through their lowest common ancestor, for tree fields
+    def tree_path(self, a, b):
+        distances = self.distances
+        parents = self.parents
+        if distances[a] < 0 or distances[b] < 0:
+            return []
+
+        # climb from the deeper cell until both are at the same depth, then climb together
+        up_from_a = [a]
+        up_from_b = [b]
+        while distances[a] > distances[b]:
+            a = parents[a]
+            up_from_a.append(a)
+        while distances[b] > distances[a]:
+            b = parents[b]
+            up_from_b.append(b)
+        while a != b:
+            a = parents[a]
+            b = parents[b]
+            up_from_a.append(a)
+            up_from_b.append(b)
+
+        # join the two climbs at the common ancestor
+        up_from_b.pop()
+        up_from_b.reverse()
+        return up_from_a + up_from_b
+
+# define the FieldCache class, keeping recently used distance fields within a memory budget
+class FieldCache:
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes # memory budget for the cached fields
+        self.nbytes = 0 # memory held by the cached fields
+        self.__fields = OrderedDict() # fields keyed by source, least recently used first
+
+    def __len__(self):
+        return len(self.__fields)
+
+    # method to return the field for a source, building it on a miss
+    def get(self, grid, source):
+        field = self.__fields.get(source)
+        if field is not None:
+            self.__fields.move_to_end(source)
+            return field
+
+        # build the field and evict the least recently used ones until it fits, always keeping the newest
+        field = DistanceField(grid, source)
+        self.__fields[source] = field
+        self.nbytes += field.nbytes
+        while self.nbytes > self.max_bytes and len(self.__fields) > 1:
+            _, evicted = self.__fields.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return field
+
+    # method to drop every cached field, such as after the walls change
+    def clear(self):
+        self.__fields.clear()
+        self.nbytes = 0
@@ -0,0 +1,379 @@
+# import necessary modules
+import logging
+import random
+from array import array
+from disjoint_set import DisjointSet
+from grid import LEFT, RIGHT, TOP, BOTTOM
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# define the NumpyRandom class, adapting a NumPy Generator to the random.Random methods the generators use
+class NumpyRandom:
+    def __init__(self, generator):
+        self.generator = generator # the wrapped numpy.random.Generator
+
+    # method to draw a random integer in range(stop)
+    def randrange(self, stop):
+        return int(self.generator.integers(stop))
+
+    # method to pick a random item of a sequence
+    def choice(self, seq):
+        return seq[int(self.generator.integers(len(seq)))]
+
+    # method to draw an integer with k random bits
+    def getrandbits(self, k):
+        return int.from_bytes(self.generator.bytes((k + 7) // 8), "little") & ((1 << k) - 1)
+
+# function to turn a seed or an injected random source into one the generators can use
+def make_rng(seed=None, rng=None):
+    # build a private random.Random so the global random module is never touched
+    if rng is None:
+        return random.Random(seed)
+
+    # wrap NumPy generators, which have no getrandbits
+    if not hasattr(rng, "getrandbits"):
+        return NumpyRandom(rng)
+    return rng
+
+# helper to remove the wall between a cell and the neighbour to its right
+def _carve_right(walls, index, on_carve):
+    walls[index] &= ~RIGHT
+    walls[index + 1] &= ~LEFT
+    if on_carve is not None:
+        on_carve(index, index + 1)
+
+# helper to remove the wall between a cell and the neighbour below it
+def _carve_down(walls, index, num_cols, on_carve):
+    walls[index] &= ~BOTTOM
+    walls[index + num_cols] &= ~TOP
+    if on_carve is not None:
+        on_carve(index, index + num_cols)
+
+# helper to remove one wall of a cell in any direction, carving from the cell left of or above it
+def _carve_wall(walls, index, wall, num_cols, on_carve):
+    if wall == LEFT:
+        _carve_right(walls, index - 1, on_carve)
+    elif wall == RIGHT:
+        _carve_right(walls, index, on_carve)
+    elif wall == TOP:
+        _carve_down(walls, index - num_cols, num_cols, on_carve)
+    else:
+        _carve_down(walls, index, num_cols, on_carve)
+
+# helper to shuffle a sequence in place with randrange only, so NumPy-backed sources work too
+def _shuffle(seq, rng):
+    for i in range(len(seq) - 1, 0, -1):
+        j = rng.randrange(i + 1)
+        seq[i], seq[j] = seq[j], seq[i]
+
+# helper to draw one random bit per column of a row in a single call
+def _row_bits(rng, num_cols):
+    return rng.getrandbits(num_cols) if num_cols > 0 else 0
+
+# recursive backtracker using an explicit stack, the original generator
+def generate_backtracker(grid, rng, start=0, on_carve=None, on_backtrack=None, on_frontier=None):
+    # work directly on the packed grid using flat cell indices
+    walls = grid.walls
+    visited = grid.visited
+    num_cols = grid.num_cols
+    last_index = grid.num_cells - num_cols
+
+    # mark the starting cell as visited and push it onto the stack
+    visited[start] = 1
+    stack = [start]
+
+    while stack:
+        # continue from the cell on top of the stack
+        index = stack[-1]
+        col = index % num_cols
+
+        # create list of unvisited neighbors
+        unvisited_neighbors = []
+
+        # check left neighbor
+        if col > 0 and not visited[index - 1]:
+            unvisited_neighbors.append((index - 1, LEFT, RIGHT))
+
+        # check right neighbor
+        if col < num_cols - 1 and not visited[index + 1]:
+            unvisited_neighbors.append((index + 1, RIGHT, LEFT))
+
+        # check top neighbor
+        if index >= num_cols and not visited[index - num_cols]:
+            unvisited_neighbors.append((index - num_cols, TOP, BOTTOM))
+
+        # check bottom neighbor
+        if index < last_index and not visited[index + num_cols]:
+            unvisited_neighbors.append((index + num_cols, BOTTOM, TOP))
+
+        # no unvisited neighbors, backtrack
+        if not unvisited_neighbors:
+            if on_backtrack is not None:
+                on_backtrack(index)
+            stack.pop()
+            if on_frontier is not None:
+                on_frontier(len(stack))
+            continue
+
+        # choose a random neighbor to visit
+        next_index, wall, opposite_wall = rng.choice(unvisited_neighbors)
+
+        # break the wall between the current cell and the chosen neighbor
+        walls[index] &= ~wall
+        walls[next_index] &= ~opposite_wall
+        if on_carve is not None:
+            on_carve(index, next_index)
+
+        # mark the chosen neighbor as visited and visit it next
+        visited[next_index] = 1
+        stack.append(next_index)
+        if on_frontier is not None:
+            on_frontier(len(stack))
+
+# binary tree, carving each cell either up or left using one batch of random bits per row
+def generate_binary_tree(grid, rng, start=0, on_carve=None, on_backtrack=None, on_frontier=None):
+    walls = grid.walls
+    num_cols = grid.num_cols
+
+    # the top row can only carve left, so it becomes a single corridor
+    for col in range(1, num_cols):
+        _carve_right(walls, col - 1, on_carve)
+
+    for row in range(1, grid.num_rows):
+        # the first column can only carve up, every other cell picks a side from its bit
+        bits = _row_bits(rng, num_cols)
+        base = row * num_cols
+        _carve_down(walls, base - num_cols, num_cols, on_carve)
+        for col in range(1, num_cols):
+            index = base + col
+            if bits >> col & 1:
+                _carve_down(walls, index - num_cols, num_cols, on_carve)
+            else:
+                _carve_right(walls, index - 1, on_carve)
+
+# sidewinder, building horizontal runs and carving up from one random cell of each run
+def generate_sidewinder(grid, rng, start=0, on_carve=None, on_backtrack=None, on_frontier=None):
+    walls = grid.walls
+    num_cols = grid.num_cols
+
+    # the top row becomes a single corridor
+    for col in range(1, num_cols):
+        _carve_right(walls, col - 1, on_carve)
+
+    for row in range(1, grid.num_rows):
+        # decide for the whole row where runs continue to the right
+        bits = _row_bits(rng, num_cols)
+        base = row * num_cols
+        run_start = 0
+        for col in range(num_cols):
+            index = base + col
+
+            # extend the run to the right unless the row ends or the bit closes it
+            if col < num_cols - 1 and bits >> col & 1:
+                _carve_right(walls, index, on_carve)
+                continue
+
+            # close the run by carving up from a random cell in it
+            up = base + run_start + rng.randrange(col - run_start + 1)
+            _carve_down(walls, up - num_cols, num_cols, on_carve)
+            run_start = col + 1
+
+# core of Eller's algorithm, yielding a bytearray of RIGHT and BOTTOM openings for each row
+def ellers_rows(num_cols, num_rows, rng):
+    # each cell of the current row belongs to a set, tracked with the columns it holds
+    sets = list(range(num_cols))
+    members = {col: [col] for col in range(num_cols)}
+    next_set = num_cols
+
+    for row in range(num_rows):
+        openings = bytearray(num_cols)
+        last_row = row == num_rows - 1
+
+        # join neighbouring cells of different sets, always on the last row
+        bits = _row_bits(rng, num_cols)
+        for col in range(num_cols - 1):
+            left_set = sets[col]
+            right_set = sets[col + 1]
+            if left_set == right_set or not (last_row or bits >> col & 1):
+                continue
+            openings[col] |= RIGHT
+
+            # merge the smaller set into the larger one
+            if len(members[left_set]) < len(members[right_set]):
+                left_set, right_set = right_set, left_set
+            moved = members.pop(right_set)
+            for member in moved:
+                sets[member] = left_set
+            members[left_set].extend(moved)
+
+        if last_row:
+            yield openings
+            return
+
+        # carve down from at least one random cell of every set
+        bits = _row_bits(rng, num_cols)
+        for cols in members.values():
+            openings[cols[rng.randrange(len(cols))]] |= BOTTOM
+            for col in cols:
+                if bits >> col & 1:
+                    openings[col] |= BOTTOM
+
+        # cells carved down keep their set, the others start a new one
+        members = {}
+        for col in range(num_cols):
+            if openings[col] & BOTTOM:
+                set_id = sets[col]
+            else:
+                set_id = next_set
+                next_set += 1
+                sets[col] = set_id
+            members.setdefault(set_id, []).append(col)
+
+        yield openings
+
+# Eller's algorithm, building the maze one row at a time
+def generate_ellers(grid, rng, start=0, on_carve=None, on_backtrack=None, on_frontier=None):
+    walls = grid.walls
+    num_cols = grid.num_cols
+    base = 0
+    for openings in ellers_rows(num_cols, grid.num_rows, rng):
+        for col in range(num_cols):
+            if openings[col] & RIGHT:
+                _carve_right(walls, base + col, on_carve)
+            if openings[col] & BOTTOM:
+                _carve_down(walls, base + col, num_cols, on_carve)
+        base += num_cols
+
+# Kruskal's algorithm, carving the walls in a random order whenever they join two separate regions
+def generate_kruskal(grid, rng, start=0, on_carve=None, on_backtrack=None, on_frontier=None):
+    walls = grid.walls
+    num_cols = grid.num_cols
+    num_cells = grid.num_cells
+
+    # every inner wall as one int, twice the index of the cell left of or above it plus 1 for a wall below
+    last_index = num_cells - num_cols
+    edges = array("i", (2 * index + below for index in range(num_cells) for below in (0, 1)
+                        if (index < last_index if below else index % num_cols < num_cols - 1)))
+
+    _shuffle(edges, rng)
+
+    # a spanning tree is complete once it has one edge fewer than it has cells
+    regions = DisjointSet(num_cells)
+    union = regions.union
+    remaining = num_cells - 1
+    for edge in edges:
+        if not remaining:
+            break
+        index = edge >> 1
+        if edge & 1:
+            if union(index, index + num_cols):
+                _carve_down(walls, index, num_cols, on_carve)
+                remaining -= 1
+        elif union(index, index + 1):
+            _carve_right(walls, index, on_carve)
+            remaining -= 1
+
+# Wilson's algorithm, joining loop-erased random walks to a growing tree to draw a uniform spanning tree
+def generate_wilsons(grid, rng, start=0, on_carve=None, on_backtrack=None, on_frontier=None):
+    walls = grid.walls
+    visited = grid.visited
+    num_cols = grid.num_cols
+    num_cells = grid.num_cells
+    last_index = num_cells - num_cols
+    getrandbits = rng.getrandbits
+
+    # the last direction the walk left each cell in, overwriting it erases any loop through that cell
+    exits = bytearray(num_cells)
+    visited[start] = 1
+
+    for first in range(num_cells):
+        if visited[first]:
+            continue
+
+        # walk at random until the walk runs into the tree, redrawing steps off the edge of the grid
+        index = first
+        while not visited[index]:
+            direction = 1 << getrandbits(2)
+            if direction == LEFT:
+                if index % num_cols == 0:
+                    continue
+                next_index = index - 1
+            elif direction == RIGHT:
+                if index % num_cols == num_cols - 1:
+                    continue
+                next_index = index + 1
+            elif direction == TOP:
+                if index < num_cols:
+                    continue
+                next_index = index - num_cols
+            else:
+                if index >= last_index:
+                    continue
+                next_index = index + num_cols
+            exits[index] = direction
+            index = next_index
+
+        # follow the remembered exits from the first cell, adding the loop-erased path to the tree
+        index = first
+        while not visited[index]:
+            visited[index] = 1
+            direction = exits[index]
+            if direction == LEFT:
+                next_index = index - 1
+            elif direction == RIGHT:
+                next_index = index + 1
+            elif direction == TOP:
+                next_index = index - num_cols
+            else:
+                next_index = index + num_cols
+            _carve_wall(walls, index, direction, num_cols, on_carve)
+            index = next_index
+
+# function to braid a maze, joining a fraction of its dead ends to a neighbour to add loops
+def braid(grid, rng, fraction, on_carve=None):
+    if not 0 <= fraction <= 1:
+        raise ValueError("Braid fraction must be between 0 and 1.")
+    walls = grid.walls
+    open_neighbours = grid.open_neighbours
+    dead_ends = [index for index in range(grid.num_cells) if len(open_neighbours(index)) == 1]
+
+    _shuffle(dead_ends, rng)
+
+    removed = 0
+    for index in dead_ends[:round(fraction * len(dead_ends))]:
+        # an earlier removal may already have joined this cell
+        if len(open_neighbours(index)) != 1:
+            continue
+
+        # knock through to a walled-off neighbour, preferring one that is a dead end too
+        closed = []
+        for wall in (LEFT, RIGHT, TOP, BOTTOM):
+            next_index = grid.neighbour(index, wall)
+            if next_index is not None and walls[index] & wall:
+                closed.append((next_index, wall))
+        if not closed:
+            continue
+        candidates = [(next_index, wall) for next_index, wall in closed if len(open_neighbours(next_index)) == 1] or closed
+        next_index, wall = candidates[rng.randrange(len(candidates))]
+        _carve_wall(walls, index, wall, grid.num_cols, on_carve)
+        removed += 1
+    return removed
+
+# function to draw a compact per-cell weight between 1 and max_weight for every cell
+def random_weights(num_cells, rng, max_weight=9):
+    if not 1 <= max_weight <= 255:
+        raise ValueError("Maximum weight must be between 1 and 255.")
+    # one random byte per cell folded into range, slightly favouring low weights unless max_weight divides 256
+    table = bytes(1 + value % max_weight for value in range(256))
+    return bytearray(rng.getrandbits(8 * num_cells).to_bytes(num_cells, "little").translate(table)) if num_cells else bytearray()
+
+# registry of the available generators by name
+GENERATORS = {
+    "backtracker": generate_backtracker,
+    "binary_tree": generate_binary_tree,
+    "sidewinder": generate_sidewinder,
+    "ellers": generate_ellers,
+    "kruskal": generate_kruskal,
+    "wilsons": generate_wilsons,
+}
@@ -1,19 +1,101 @@
 # import necessary modules
+import asyncio
 import logging
 import time
-from tkinter import Canvas, Tk, BOTH
+from grid import LEFT, RIGHT, TOP, BOTTOM
 
 # configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# helper to build a translation table mapping wall flags to a 0/1 mask for one wall
+def _wall_mask_table(wall):
+  return bytes(1 if flags & wall else 0 for flags in range(256))
+
+# translation tables for each wall
+WALL_MASKS = {wall: _wall_mask_table(wall) for wall in (LEFT, RIGHT, TOP, BOTTOM)}
+
+# helper to combine two 0/1 masks of equal length
+def _mask_or(mask1, mask2):
+  return (int.from_bytes(mask1, "big") | int.from_bytes(mask2, "big")).to_bytes(len(mask1), "big")
+
+# helper to walk every wall once as a depth-first tour of the grid corners, returning one path of corners per
+# connected group of walls; a path doubles back over the walls it has drawn, so a perfect maze needs at most two paths
+def _wall_paths(horizontal, vertical, num_cols, num_rows):
+  paths = []
+  while True:
+    # start each path at any wall not drawn yet, horizontal masks indexed by row boundary, vertical by column boundary
+    index = horizontal.find(1)
+    if index >= 0:
+      corner = (index % num_cols, index // num_cols)
+    else:
+      index = vertical.find(1)
+      if index < 0:
+        return paths
+      corner = (index // num_rows, index % num_rows)
+
+    stack = [corner]
+    path = [corner]
+    last_step = None
+    end = 1 # length of the path up to its last new wall, dropping the final walk back
+    while stack:
+      col, row = stack[-1]
+
+      # take a wall at this corner not drawn yet, clearing it from its mask
+      if col < num_cols and horizontal[row * num_cols + col]:
+        horizontal[row * num_cols + col] = 0
+        step = (1, 0)
+      elif col > 0 and horizontal[row * num_cols + col - 1]:
+        horizontal[row * num_cols + col - 1] = 0
+        step = (-1, 0)
+      elif row < num_rows and vertical[col * num_rows + row]:
+        vertical[col * num_rows + row] = 0
+        step = (0, 1)
+      elif row > 0 and vertical[col * num_rows + row - 1]:
+        vertical[col * num_rows + row - 1] = 0
+        step = (0, -1)
+
+      # walk back to the previous corner once every wall here is drawn
+      else:
+        stack.pop()
+        if stack:
+          step = (stack[-1][0] - col, stack[-1][1] - row)
+          if step == last_step:
+            path[-1] = stack[-1]
+          else:
+            path.append(stack[-1])
+            last_step = step
+        continue
+
+      # extend a straight run in place rather than adding a corner
+      corner = (col + step[0], row + step[1])
+      stack.append(corner)
+      if step == last_step:
+        path[-1] = corner
+      else:
+        path.append(corner)
+        last_step = step
+      end = len(path)
+    paths.append(path[:end])
+
 # define the Window class
 class Window:
-  def __init__(self, width, height):
-    self.__root = Tk() # create the main window
+  def __init__(self, width, height, root=None, canvas=None):
+    # import tkinter only when it is needed, so headless mazes never load it
+    if root is None:
+      from tkinter import Tk
+      root = Tk() # create the main window
+    self.__root = root # reference to the main window
     self.__root.title("Maze Solver") # set the window title
-    self.__canvas = Canvas(self.__root, width=width, height=height, bg="white") # create a canvas
-    self.__canvas.pack(fill=BOTH, expand=1) # pack the canvas to fill the window
+    if canvas is None:
+      from tkinter import Canvas, BOTH
+      canvas = Canvas(self.__root, width=width, height=height, bg="white") # create a canvas
+      canvas.pack(fill=BOTH, expand=1) # pack the canvas to fill the window
+    self.__canvas = canvas # canvas the window draws on
+    self.__grid_items = [] # canvas items reused by bulk grid drawing
+    self.__grid_colour = None # fill colour of the bulk grid items
+    self.__line_items = {} # [canvas item, fill colour] of each line drawn, keyed by its end points
     self.__running = False # flag to control the main loop
+    self.__closed = False # flag set once the window is closed, ending any event pumping
     self.__root.protocol("WM_DELETE_WINDOW", self.close) # handle window close event
     self.__key_pressed = False # flag to track key press
     self.__root.focus_set() # ensure the window can receive key events
@@ -24,79 +106,198 @@ class Window:
     self.__canvas.update_idletasks()
     self.__canvas.update()
 
-  # method to wait for the window to close
+  # method to run a callback after a delay in milliseconds, without blocking the event loop
+  def after(self, delay_ms, callback):
+    return self.__root.after(delay_ms, callback)
+
+  # method to wait for the window to close, idling in the Tk event loop instead of polling
   def wait_for_close(self):
-    # start the main loop
+    # start the main loop, which close ends
+    if self.__closed:
+      return
     self.__running = True
-    while self.__running:
-      # handle events and update the window
+    try:
+      self.__root.mainloop()
+
+    # catch exceptions to handle window closure
+    except Exception as e:
+      logging.error(f"Error occurred: {e}")
+
+    # handle window closure
+    self.__running = False
+
+  # coroutine to process window events between asyncio tasks until a condition holds or the window closes
+  async def pump_events(self, until=None, interval=1 / 60):
+    while not self.__closed and (until is None or not until()):
+      # handle events and update the window, including any frame callbacks that are due
       try:
-        # update the window
-        self.__root.update_idletasks()
         self.__root.update()
-      
+
       # catch exceptions to handle window closure
       except Exception as e:
         logging.error(f"Error occurred: {e}")
+        break
+
+      # yield to other tasks until the next frame
+      await asyncio.sleep(interval)
 
-        # handle window closure
-        self.__running = False
+  # coroutine to wait for the window to close without blocking the asyncio loop
+  async def wait_for_close_async(self, interval=1 / 60):
+    self.__running = True
+    await self.pump_events(lambda: not self.__running, interval)
+    self.__running = False
+
+  # property to count the canvas items the window holds
+  @property
+  def item_count(self):
+    return len(self.__line_items) + len(self.__grid_items)
 
-  # method to draw a line on the canvas
+  # method to draw a line on the canvas, reusing the item already drawn between the same end points
   def draw_line(self, line, fill_colour="black"):
-    # draw a line on the canvas
-    line.draw(self.__canvas, fill_colour)
+    # key the line by its end points in either order
+    start = (line.point1.x, line.point1.y)
+    end = (line.point2.x, line.point2.y)
+    key = (start, end) if start <= end else (end, start)
 
-  # method to wait for a specific key press
-  def wait_for_key_press(self, key="space", wait_time=10):
+    # draw a new line, or recolour the existing one and bring it to the front only if its colour changed
+    entry = self.__line_items.get(key)
+    if entry is None:
+      self.__line_items[key] = [line.draw(self.__canvas, fill_colour), fill_colour]
+    elif entry[1] != fill_colour:
+      self.__canvas.itemconfig(entry[0], fill=fill_colour)
+      self.__canvas.tag_raise(entry[0])
+      entry[1] = fill_colour
+
+  # method to draw every wall of a grid in bulk, chaining the walls into one polyline per connected group of walls
+  def draw_grid(self, grid, x1, y1, cell_size_x, cell_size_y, fill_colour="black"):
+    walls = grid.wall_bytes()
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+
+    # mask the horizontal walls along each row boundary, then the vertical walls along each column boundary
+    empty_row = bytes(num_cols)
+    horizontal = bytearray()
+    for row in range(num_rows + 1):
+      below = walls[row * num_cols:(row + 1) * num_cols].translate(WALL_MASKS[TOP]) if row < num_rows else empty_row
+      above = walls[(row - 1) * num_cols:row * num_cols].translate(WALL_MASKS[BOTTOM]) if row > 0 else empty_row
+      horizontal += _mask_or(below, above)
+    empty_col = bytes(num_rows)
+    vertical = bytearray()
+    for col in range(num_cols + 1):
+      right = walls[col::num_cols].translate(WALL_MASKS[LEFT]) if col < num_cols else empty_col
+      left = walls[col - 1::num_cols].translate(WALL_MASKS[RIGHT]) if col > 0 else empty_col
+      vertical += _mask_or(right, left)
+
+    # scale the corner points of each path to canvas coordinates
+    lines = []
+    for path in _wall_paths(horizontal, vertical, num_cols, num_rows):
+      coords = []
+      for col, row in path:
+        coords += (x1 + col * cell_size_x, y1 + row * cell_size_y)
+      lines.append(coords)
+
+    # update the canvas and show the result with a single redraw
+    self.__draw_lines(lines, fill_colour)
+    self.redraw()
+
+  # private method to draw polylines, reusing the canvas items of the previous bulk draw
+  def __draw_lines(self, lines, fill_colour):
+    items = self.__grid_items
+    recolour = fill_colour != self.__grid_colour
+    self.__grid_colour = fill_colour
+
+    # move the existing items into place, creating new ones only when there are more lines
+    for i, coords in enumerate(lines):
+      if i < len(items):
+        self.__canvas.coords(items[i], *coords)
+        if recolour:
+          self.__canvas.itemconfig(items[i], fill=fill_colour)
+      else:
+        items.append(self.__canvas.create_line(*coords, fill=fill_colour, width=2))
+
+    # delete the items left over from a previous, larger draw
+    if len(items) > len(lines):
+      self.__canvas.delete(*items[len(lines):])
+      del items[len(lines):]
+
+  # private method to bind a handler that flags the key press, and optionally reacts to it
+  def __bind_key(self, key, on_match=None):
     # reset the key pressed flag
     self.__key_pressed = False
-    
+
     # key press event handler
     def on_key_press(event):
       if event.keysym.lower() == key.lower():
         self.__key_pressed = True
-    
+        if on_match is not None:
+          on_match()
+
     # bind the key press event
     self.__root.bind("<KeyPress>", on_key_press)
-    
-    # record the start time
-    start_time = time.time()
-    warning_shown = False
 
-    # wait for the key to be pressed (using a simple condition instead of __running)
-    while not self.__key_pressed:
-      try:
-        self.__root.update_idletasks()
-        self.__root.update()
-        
-        # small delay to prevent excessive CPU usage
-        time.sleep(0.01)
+  # method to wait for a specific key press, idling in the Tk event loop with timers for the inactivity messages
+  def wait_for_key_press(self, key="space", wait_time=10):
+    # stop the event loop as soon as the key is pressed
+    self.__bind_key(key, self.__root.quit)
 
-        # check for inactivity and warn the user (only once)
-        if not warning_shown and time.time() - start_time >= wait_time:
-          logging.info(f"No key press detected after {wait_time} seconds, are you still there?")
-          warning_shown = True
+    # warn the user once, then give up after twice the wait time
+    def on_warning():
+      logging.info(f"No key press detected after {wait_time} seconds, are you still there?")
 
-        # check for inactivity and exit if necessary
-        if time.time() - start_time >= wait_time * 2:
-          logging.info(f"No key press detected after {wait_time * 2} seconds of inactivity.")
-          break
+    def on_timeout():
+      logging.info(f"No key press detected after {wait_time * 2} seconds of inactivity.")
+      self.__root.quit()
 
-      except Exception as e:
-        logging.error(f"Error occurred while waiting for key press: {e}")
-        break
-    
-    # unbind the key press event
+    timers = [self.__root.after(round(wait_time * 1000), on_warning), self.__root.after(round(wait_time * 2000), on_timeout)]
+
+    # wait for the key to be pressed, the timeout or the window to close
+    try:
+      self.__root.mainloop()
+    except Exception as e:
+      logging.error(f"Error occurred while waiting for key press: {e}")
+
+    # cancel the timers and unbind the key press event
+    for timer in timers:
+      self.__root.after_cancel(timer)
     self.__root.unbind("<KeyPress>")
+    return self.__key_pressed
+
+  # coroutine to wait for a specific key press without blocking the asyncio loop
+  async def wait_for_key_press_async(self, key="space", wait_time=10, interval=1 / 60):
+    self.__bind_key(key)
+    start_time = time.monotonic()
+    warning_shown = False
+
+    # pump events until the key is pressed, checking for inactivity between frames
+    def done():
+      nonlocal warning_shown
+      if self.__key_pressed:
+        return True
+      elapsed_time = time.monotonic() - start_time
+      if not warning_shown and elapsed_time >= wait_time:
+        logging.info(f"No key press detected after {wait_time} seconds, are you still there?")
+        warning_shown = True
+      if elapsed_time >= wait_time * 2:
+        logging.info(f"No key press detected after {wait_time * 2} seconds of inactivity.")
+        return True
+      return False
+
+    try:
+      await self.pump_events(done, interval)
+    finally:
+      # unbind the key press event
+      self.__root.unbind("<KeyPress>")
+    return self.__key_pressed
 
   # method to close the window
   def close(self):
     # log the window closure
     logging.info("Closing window.")
 
-    # set the running flag to false to exit the main loop
+    # set the running flag to false and stop the event loop
     self.__running = False
+    self.__closed = True
+    self.__root.quit()
 
 class Point:
   def __init__(self, x, y):
@@ -109,4 +310,4 @@ class Line:
     self.point2 = point2
 
   def draw(self, canvas, fill_colour="black"):
-    canvas.create_line(self.point1.x, self.point1.y, self.point2.x, self.point2.y, fill=fill_colour, width=2)
\ No newline at end of file
+    return canvas.create_line(self.point1.x, self.point1.y, self.point2.x, self.point2.y, fill=fill_colour, width=2)
\ No newline at end of file
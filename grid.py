@@ -0,0 +1,117 @@
+# import necessary modules
+import logging
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# wall bit flags stored in one byte per cell
+LEFT = 1
+RIGHT = 2
+TOP = 4
+BOTTOM = 8
+ALL_WALLS = LEFT | RIGHT | TOP | BOTTOM
+
+# wall bit flag for each direction name
+DIRECTIONS = {"left": LEFT, "right": RIGHT, "top": TOP, "bottom": BOTTOM}
+
+# wall on the neighbouring cell that faces each wall
+OPPOSITE = {LEFT: RIGHT, RIGHT: LEFT, TOP: BOTTOM, BOTTOM: TOP}
+
+# outer walls tried in order when opening the entrance and the exit on a boundary cell
+ENTRANCE_WALLS = (TOP, LEFT, BOTTOM, RIGHT)
+EXIT_WALLS = (BOTTOM, RIGHT, TOP, LEFT)
+
+# function to check a (col, row) position is a cell on the boundary of a grid and return its index
+def boundary_index(num_cols, num_rows, position, name):
+    col, row = position
+    if not (0 <= col < num_cols and 0 <= row < num_rows):
+        raise ValueError(f"{name} {position} is outside the maze.")
+    if col not in (0, num_cols - 1) and row not in (0, num_rows - 1):
+        raise ValueError(f"{name} {position} is not on the boundary of the maze.")
+    return row * num_cols + col
+
+# function to find the first outer wall of a boundary cell in order of preference, such as ENTRANCE_WALLS
+def outer_wall(num_cols, num_rows, index, walls):
+    row, col = divmod(index, num_cols)
+    outer = {LEFT: col == 0, RIGHT: col == num_cols - 1, TOP: row == 0, BOTTOM: row == num_rows - 1}
+    for wall in walls:
+        if outer[wall]:
+            return wall
+
+# define the Grid class, a packed store of the walls and visited flags of every cell
+class Grid:
+    # initialize the grid with every wall in place
+    def __init__(self, num_cols, num_rows, walls=None):
+        self.num_cols = num_cols # number of columns in the grid
+        self.num_rows = num_rows # number of rows in the grid
+        self.num_cells = num_cols * num_rows # total number of cells
+        self.walls = bytearray([ALL_WALLS]) * self.num_cells if walls is None else walls # wall bit flags, row by row
+        self.visited = bytearray(self.num_cells) # visited flag of each cell, row by row
+        self.weights = None # cost of entering each cell (1-255) row by row, or None for unit costs
+
+    # method to convert a column and row to a cell index
+    def index(self, col, row):
+        return row * self.num_cols + col
+
+    # method to convert a cell index to a column and row
+    def position(self, index):
+        row, col = divmod(index, self.num_cols)
+        return col, row
+
+    # method to find the index of the neighbour behind a wall, or None at the edge of the grid
+    def neighbour(self, index, wall):
+        if wall == LEFT:
+            return index - 1 if index % self.num_cols > 0 else None
+        if wall == RIGHT:
+            return index + 1 if index % self.num_cols < self.num_cols - 1 else None
+        if wall == TOP:
+            return index - self.num_cols if index >= self.num_cols else None
+        return index + self.num_cols if index + self.num_cols < self.num_cells else None
+
+    # method to check if a cell has a wall
+    def has_wall(self, col, row, wall):
+        return bool(self.walls[row * self.num_cols + col] & wall)
+
+    # method to remove a wall from a cell and the matching wall from its neighbour
+    def remove_wall(self, col, row, wall):
+        index = row * self.num_cols + col
+        self.walls[index] &= ~wall
+        next_index = self.neighbour(index, wall)
+        if next_index is not None:
+            self.walls[next_index] &= ~OPPOSITE[wall]
+
+    # method to add a wall to a cell and the matching wall to its neighbour
+    def add_wall(self, col, row, wall):
+        index = row * self.num_cols + col
+        self.walls[index] |= wall
+        next_index = self.neighbour(index, wall)
+        if next_index is not None:
+            self.walls[next_index] |= OPPOSITE[wall]
+
+    # method to list the neighbours reachable from a cell in left, right, top, bottom order
+    def open_neighbours(self, index):
+        walls = self.walls[index]
+        num_cols = self.num_cols
+        col = index % num_cols
+        neighbours = []
+        if not walls & LEFT and col > 0:
+            neighbours.append(index - 1)
+        if not walls & RIGHT and col < num_cols - 1:
+            neighbours.append(index + 1)
+        if not walls & TOP and index >= num_cols:
+            neighbours.append(index - num_cols)
+        if not walls & BOTTOM and index + num_cols < self.num_cells:
+            neighbours.append(index + num_cols)
+        return neighbours
+
+    # method to return the walls of every cell as one byte per cell, unpacking walls stored another way, such as a loaded maze, in one go
+    def wall_bytes(self):
+        return self.walls if isinstance(self.walls, (bytes, bytearray)) else self.walls[:]
+
+    # method to return the walls of one row of cells
+    def row(self, row):
+        return bytes(self.walls[row * self.num_cols:(row + 1) * self.num_cols])
+
+    # method to reset the visited flag of every cell
+    def reset_visited(self):
+        self.visited = bytearray(self.num_cells)
@@ -0,0 +1,116 @@
+# import necessary modules
+import heapq
+import logging
+import math
+import time
+from solvers import SolveResult
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# define the LifelongPlanner class, an LPA* search that repairs its path after wall edits
+class LifelongPlanner:
+    # initialize the planner between two cells of a grid
+    def __init__(self, grid, start, goal):
+        self.__grid = grid # reference to the grid being searched
+        self.__start = start # index of the start cell
+        self.__goal = goal # index of the goal cell
+        self.__goal_row, self.__goal_col = divmod(goal, grid.num_cols)
+        self.__g = {} # cost of the best path found to each cell
+        self.__rhs = {start: 0} # one-step lookahead cost of each cell
+        self.__queue = [] # heap of (key, counter, cell) entries, some of them stale
+        self.__queued = {} # current key of each cell in the queue
+        self.__counter = 0 # tie breaker so cells are never compared
+        self.__push(start)
+
+    # private method to estimate the remaining distance from a cell to the goal
+    def __heuristic(self, cell):
+        row, col = divmod(cell, self.__grid.num_cols)
+        return abs(col - self.__goal_col) + abs(row - self.__goal_row)
+
+    # private method to compute the queue key of a cell
+    def __key(self, cell):
+        cost = min(self.__g.get(cell, math.inf), self.__rhs.get(cell, math.inf))
+        return (cost + self.__heuristic(cell), cost)
+
+    # private method to add a cell to the queue, replacing any earlier entry
+    def __push(self, cell):
+        key = self.__key(cell)
+        self.__queued[cell] = key
+        self.__counter += 1
+        heapq.heappush(self.__queue, (key, self.__counter, cell))
+
+    # private method to drop stale entries from the top of the queue
+    def __clean_top(self):
+        queue = self.__queue
+        while queue and self.__queued.get(queue[0][2]) != queue[0][0]:
+            heapq.heappop(queue)
+
+    # private method to recompute the lookahead cost of a cell and requeue it if inconsistent
+    def __update_vertex(self, cell):
+        if cell != self.__start:
+            g = self.__g
+            best = math.inf
+            for neighbour in self.__grid.open_neighbours(cell):
+                cost = g.get(neighbour, math.inf) + 1
+                if cost < best:
+                    best = cost
+            self.__rhs[cell] = best
+        self.__queued.pop(cell, None)
+        if self.__g.get(cell, math.inf) != self.__rhs.get(cell, math.inf):
+            self.__push(cell)
+
+    # method to tell the planner the wall between two neighbouring cells was opened or closed
+    def update_edge(self, cell, next_cell):
+        self.__update_vertex(cell)
+        self.__update_vertex(next_cell)
+
+    # method to find or repair the shortest path, expanding only cells affected by edits
+    def solve(self):
+        start_time = time.perf_counter()
+        g = self.__g
+        rhs = self.__rhs
+        goal = self.__goal
+        nodes_expanded = 0
+        peak_frontier = len(self.__queued)
+
+        while True:
+            # stop once the goal is consistent and nothing cheaper is left to expand
+            self.__clean_top()
+            if not self.__queue:
+                break
+            goal_key = self.__key(goal)
+            if self.__queue[0][0] >= goal_key and rhs.get(goal, math.inf) == g.get(goal, math.inf):
+                break
+
+            # expand the cell with the lowest key
+            _, _, cell = heapq.heappop(self.__queue)
+            del self.__queued[cell]
+            nodes_expanded += 1
+            if g.get(cell, math.inf) > rhs.get(cell, math.inf):
+                # overconsistent, the cell got cheaper so lower it and update its neighbours
+                g[cell] = rhs[cell]
+                for neighbour in self.__grid.open_neighbours(cell):
+                    self.__update_vertex(neighbour)
+            else:
+                # underconsistent, the cell got dearer so reset it and update it and its neighbours
+                g.pop(cell, None)
+                self.__update_vertex(cell)
+                for neighbour in self.__grid.open_neighbours(cell):
+                    self.__update_vertex(neighbour)
+            peak_frontier = max(peak_frontier, len(self.__queued))
+
+        return SolveResult("lpastar", self.__path(), nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+    # private method to walk back from the goal along the cheapest neighbours
+    def __path(self):
+        g = self.__g
+        cell = self.__goal
+        if g.get(cell, math.inf) == math.inf:
+            return []
+        path = [cell]
+        while cell != self.__start:
+            cell = min(self.__grid.open_neighbours(cell), key=lambda neighbour: g.get(neighbour, math.inf))
+            path.append(cell)
+        path.reverse()
+        return [self.__grid.position(cell) for cell in path]
@@ -1,16 +1,56 @@
 # import necessary modules
+import argparse
 import logging
+import sys
 import time
-from tkinter import Tk
+from batch import run_batch
+from generators import GENERATORS
 from graphics import Window, Line, Point
 from cell import Cell
 from maze import Maze
+from solvers import SOLVERS
 
 # configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# function to parse the command line arguments
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and solve mazes.")
+    parser.add_argument("--batch", type=int, metavar="N", help="generate and solve N mazes headless, streaming JSONL results")
+    parser.add_argument("--rows", type=int, default=12, help="number of rows in each batch maze")
+    parser.add_argument("--cols", type=int, default=16, help="number of columns in each batch maze")
+    parser.add_argument("--seed", type=int, default=0, help="base seed the batch seeds are derived from")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: all cores)")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="backtracker", help="generation algorithm")
+    parser.add_argument("--algorithm", choices=sorted(SOLVERS), default="dfs", help="solver algorithm")
+    parser.add_argument("--analyze", action="store_true", help="score each batch maze (dead ends, junctions, tortuosity, diameter) instead of solving it")
+    parser.add_argument("--output", default="-", help="JSONL output file (default: stdout)")
+    return parser.parse_args(argv)
+
+# function to run the headless batch mode
+def batch(args):
+    logging.info(f"Generating {args.batch} mazes of {args.cols}x{args.rows}...")
+    start_time = time.time()
+
+    # stream the records to stdout or to the output file
+    if args.output == "-":
+        run_batch(sys.stdout, args.batch, args.cols, args.rows, args.seed, args.workers, args.generator, args.algorithm, args.analyze)
+    else:
+        with open(args.output, "w") as output:
+            run_batch(output, args.batch, args.cols, args.rows, args.seed, args.workers, args.generator, args.algorithm, args.analyze)
+
+    # log the batch completion
+    elapsed_time = time.time() - start_time
+    logging.info(f"Batch complete in {elapsed_time:.2f} seconds.")
+
 # main function
-def main():
+def main(argv=None):
+    # run the batch mode if requested
+    args = parse_args(argv)
+    if args.batch is not None:
+        batch(args)
+        return
+
     # create a window instance
     logging.info("Starting Maze Solver.")
 
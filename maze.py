@@ -1,53 +1,112 @@
 # import necessary modules
+import asyncio
 import logging
-import time
-import random
-from cell import Cell
-from graphics import Point, Line
+from functools import partial
+from analysis import analyze
+from animation import FrameScheduler
+from cell import GridCells
+from generators import GENERATORS, braid, make_rng
+from grid import Grid, DIRECTIONS, ENTRANCE_WALLS, EXIT_WALLS, boundary_index, outer_wall
+from fields import FieldCache
+from incremental import LifelongPlanner
+from playback import DEFAULT_QUEUE_SIZE, Playback, SolveWorker
+from raster import MazeImage
+from solvers import SOLVERS, solve_multi_goal
+from storage import load_maze, save_grid
 
 # configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # define the Maze class
 class Maze:
-  def __init__(self, x1, y1, num_rows, num_cols, cell_size_x, cell_size_y, window=None, seed=None, animate_speed=0.02):
+  def __init__(self, x1, y1, num_rows, num_cols, cell_size_x, cell_size_y, window=None, seed=None, animate_speed=0.02, generator="backtracker", fps=60, time_budget=None, rng=None, grid=None, observers=None, entrance=(0, 0), exit=None, braid=0.0, weights=None):
     self.__x1 = x1 # top-left x-coordinate of the maze
     self.__y1 = y1 # top-left y-coordinate of the maze
     self.__num_rows = num_rows # number of rows in the maze
     self.__num_cols = num_cols # number of columns in the maze
     self.__cell_size_x = cell_size_x # width of each cell
     self.__cell_size_y = cell_size_y # height of each cell
-    self.__cells = [] # list to store the cells
     self.__window = window # reference to the window object
+    self.__grid = grid if grid is not None else Grid(num_cols, num_rows) # packed walls and visited flags of the cells
+    self.__cells = GridCells(self.__grid, window, x1, y1, cell_size_x, cell_size_y) # Cell-compatible view of the grid
     self.__animate_speed = animate_speed # animation speed for drawing
-
-    # set the random seed for reproducibility
-    if seed is not None:
-      random.seed(seed)
+    self.__generator = generator # name of the algorithm used to break walls
+    self.__braid = braid # fraction of dead ends to remove after generation, adding loops
+    self.__fps = fps # target frame rate of the animation
+    self.__scheduler = FrameScheduler(window, fps, time_budget) if window is not None else None # plays back draw steps frame by frame
+    self.__observers = list(observers or []) # observers notified of generation and solve events
+    self.__planner = None # incremental planner holding the cached solution, created on first use
+    self.__fields = FieldCache() # recently used distance fields for path queries
+    self.__is_tree = None # whether the maze is perfect, checked on the first path query
+
+    # look up the requested generator
+    if generator not in GENERATORS:
+      raise ValueError(f"Unknown generator algorithm: {generator}")
+
+    # the entrance and exit must be boundary cells, the exit defaulting to the bottom-right cell
+    if exit is None:
+      exit = (num_cols - 1, num_rows - 1)
+    self.__entrance = boundary_index(num_cols, num_rows, entrance, "Entrance") # index of the entrance cell
+    self.__exit = boundary_index(num_cols, num_rows, exit, "Exit") # index of the exit cell
+
+    # use the injected random source, or a private one seeded for reproducibility
+    self.__rng = make_rng(seed, rng)
+
+    # the weights are kept in the grid, one byte per cell
+    if weights is not None:
+      self.set_weights(weights)
+
+    # a prebuilt grid, such as a loaded maze, only needs drawing
+    if grid is not None:
+      if (grid.num_cols, grid.num_rows) != (num_cols, num_rows):
+        raise ValueError("Grid size does not match the maze size.")
+      self.__create_cells()
+      return
 
     self.__create_cells() # create the cells
-    time.sleep(0.5) # pause before breaking walls
+    self.__pause(0.5) # pause the animation before breaking walls
     self.__break_entrance_and_exit() # break the entrance and exit walls
-    self.__break_walls_recursive(0, 0) # start breaking walls from the top-left cell
+    self.__break_walls(0, 0) # start breaking walls from the top-left cell
     self.__reset_cells_visited() # reset visited status of all cells
 
+  # property to access the packed grid of walls
+  @property
+  def grid(self):
+    return self.__grid
+
+  # public method to save the maze walls to a compact binary file
+  def save(self, path):
+    save_grid(self.__grid, path, self.__entrance, self.__exit)
+
+  # public class method to load a maze saved with save, memory-mapping the walls and keeping its entrance and exit
+  @classmethod
+  def load(cls, path, x1=0, y1=0, cell_size_x=1, cell_size_y=1, window=None, **kwargs):
+    grid, entrance, exit = load_maze(path)
+
+    # the openings are part of the saved walls, so a different entrance or exit cannot be asked for
+    for name, index in (("entrance", entrance), ("exit", exit)):
+      position = grid.position(index)
+      if kwargs.get(name) is None:
+        kwargs[name] = position
+      elif tuple(kwargs[name]) != position:
+        raise ValueError(f"The {name} of the saved maze is {position}, not {kwargs[name]}.")
+    return cls(x1, y1, grid.num_rows, grid.num_cols, cell_size_x, cell_size_y, window, grid=grid, **kwargs)
+
   # private method to create the cells
   def __create_cells(self):
-    # create a 2D list of cells
-    for col in range(self.__num_cols):
-      # create a new column of cells
-      col_cells = []
-      for row in range(self.__num_rows):
-        # create a new cell and add it to the column
-        col_cells.append(Cell(self.__window))
-      # add the column to the list of cells
-      self.__cells.append(col_cells)
-
-    # only draw cells if a window is provided
+    # the grid already holds every cell with all walls in place, so only draw them if a window is provided
     if self.__window is not None:
-      for col in range(self.__num_cols):
-        for row in range(self.__num_rows):
-          self.__draw_cell(col, row)
+      self.draw()
+
+  # public method to draw every wall of the maze in one bulk pass
+  def draw(self):
+    # ensure the window is set
+    if self.__window is None:
+      raise ValueError("Window is not set for the maze.")
+
+    # play back any queued steps first so they cannot overwrite the walls drawn here
+    self.flush_animation()
+    self.__window.draw_grid(self.__grid, self.__x1, self.__y1, self.__cell_size_x, self.__cell_size_y)
 
   # private method to draw a cell at a specific column and row
   def __draw_cell(self, col, row):
@@ -57,167 +116,374 @@ class Maze:
     y1 = self.__y1 + row * self.__cell_size_y
     x2 = x1 + self.__cell_size_x
     y2 = y1 + self.__cell_size_y
-    self.__cells[col][row].draw(x1, y1, x2, y2)
+
+    # queue a copy of the cell as it is now, so playback shows this step rather than the final walls
+    if self.__scheduler is not None:
+      self.__scheduler.schedule(partial(self.__cells.snapshot(col, row).draw, x1, y1, x2, y2))
+    else:
+      self.__cells[col][row].draw(x1, y1, x2, y2)
 
     # animate the drawing
     self.__animate()
 
   # private method to animate the drawing
   def __animate(self):
-    # redraw the window if it exists
-    if self.__window is None:
+    # end the current animation step if a window exists
+    if self.__scheduler is None:
       return
 
-    self.__window.redraw()
-    time.sleep(self.__animate_speed) # adjust the sleep time for speed control
+    self.__scheduler.end_step(self.__animate_speed) # each step plays back in animate_speed seconds
+
+  # private method to hold the animation still for a number of seconds without blocking
+  def __pause(self, seconds):
+    if self.__scheduler is not None:
+      self.__scheduler.end_step(seconds)
 
   # public method to set animation speed
   def set_animate_speed(self, animate_speed):
     self.__animate_speed = animate_speed
 
+  # public method to cap the time taken to play back the queued animation
+  def set_time_budget(self, time_budget):
+    if self.__scheduler is not None:
+      self.__scheduler.set_time_budget(time_budget)
+
+  # public method to play back the queued animation immediately
+  def flush_animation(self):
+    if self.__scheduler is not None:
+      self.__scheduler.flush()
+
+  # private method to check a position is a cell of the maze and return its index
+  def __cell_index(self, position):
+    col, row = position
+    if not (0 <= col < self.__num_cols and 0 <= row < self.__num_rows):
+      raise ValueError(f"Cell {position} is outside the maze.")
+    return self.__grid.index(col, row)
+
+  # property to access the entrance cell as (col, row)
+  @property
+  def entrance(self):
+    return self.__grid.position(self.__entrance)
+
+  # property to access the exit cell as (col, row)
+  @property
+  def exit(self):
+    return self.__grid.position(self.__exit)
+
   # private method to break the entrance and exit walls
   def __break_entrance_and_exit(self):
-    # break the entrance wall (top-left cell)
-    self.__cells[0][0].has_top_wall = False
+    # break the outer wall of the entrance cell, its top wall when it has one
+    col, row = self.__grid.position(self.__entrance)
+    self.__grid.remove_wall(col, row, outer_wall(self.__num_cols, self.__num_rows, self.__entrance, ENTRANCE_WALLS))
 
     # only draw the cell if a window is provided
     if self.__window is not None:
-      self.__draw_cell(0, 0)
+      self.__draw_cell(col, row)
 
-    # break the exit wall (bottom-right cell)
-    self.__cells[self.__num_cols - 1][self.__num_rows - 1].has_bottom_wall = False
+    # break the outer wall of the exit cell, its bottom wall when it has one
+    col, row = self.__grid.position(self.__exit)
+    self.__grid.remove_wall(col, row, outer_wall(self.__num_cols, self.__num_rows, self.__exit, EXIT_WALLS))
 
     # only draw the cell if a window is provided
     if self.__window is not None:
-      self.__draw_cell(self.__num_cols - 1, self.__num_rows - 1)
-
-  # private recursive method to break walls
-  def __break_walls_recursive(self, col=0, row=0):
-    # mark the current cell as visited
-    self.__cells[col][row].visited = True
-
-    while True:
-      # create list of unvisited neighbors
-      unvisited_neighbors = []
-
-      # check left neighbor
-      if col > 0 and not self.__cells[col - 1][row].visited:
-        unvisited_neighbors.append((col - 1, row, 'left'))
-
-      # check right neighbor
-      if col < self.__num_cols - 1 and not self.__cells[col + 1][row].visited:
-        unvisited_neighbors.append((col + 1, row, 'right'))
-
-      # check top neighbor
-      if row > 0 and not self.__cells[col][row - 1].visited:
-        unvisited_neighbors.append((col, row - 1, 'top'))
-
-      # check bottom neighbor
-      if row < self.__num_rows - 1 and not self.__cells[col][row + 1].visited:
-        unvisited_neighbors.append((col, row + 1, 'bottom'))
-
-      # no unvisited neighbors, backtrack
-      if not unvisited_neighbors:
-        # only draw the cell if a window is provided
-        if self.__window is not None:
-          self.__draw_cell(col, row)
-        return
-
-      # choose a random neighbor to visit
-      next_col, next_row, direction = random.choice(unvisited_neighbors)
-
-      # break the wall between the current cell and the chosen neighbor
-      if direction == 'left':
-        self.__cells[col][row].has_left_wall = False
-        self.__cells[next_col][next_row].has_right_wall = False
-      elif direction == 'right':
-        self.__cells[col][row].has_right_wall = False
-        self.__cells[next_col][next_row].has_left_wall = False
-      elif direction == 'top':
-        self.__cells[col][row].has_top_wall = False
-        self.__cells[next_col][next_row].has_bottom_wall = False
-      elif direction == 'bottom':
-        self.__cells[col][row].has_bottom_wall = False
-        self.__cells[next_col][next_row].has_top_wall = False
-
-      # redraw the current cell and the neighbor cell if a window is provided
-      if self.__window is not None:
-        self.__draw_cell(col, row)
-        self.__draw_cell(next_col, next_row)
+      self.__draw_cell(col, row)
+
+  # public method to set the cost of entering each cell, from a bytes-like of one weight (1-255) per cell, or None for unit costs
+  def set_weights(self, weights):
+    if weights is not None:
+      weights = bytearray(weights)
+      if len(weights) != self.__grid.num_cells:
+        raise ValueError("There must be one weight per cell.")
+      if 0 in weights:
+        raise ValueError("Cell weights must be between 1 and 255.")
+    self.__grid.weights = weights
+
+  # public method to set the cost of entering one cell
+  def set_weight(self, col, row, weight):
+    if not 1 <= weight <= 255:
+      raise ValueError("Cell weights must be between 1 and 255.")
+    if self.__grid.weights is None:
+      self.__grid.weights = bytearray([1]) * self.__grid.num_cells
+    self.__grid.weights[self.__grid.index(col, row)] = weight
+
+  # public method to attach an observer to generation and solve events
+  def add_observer(self, observer):
+    self.__observers.append(observer)
+
+  # public method to detach an observer
+  def remove_observer(self, observer):
+    self.__observers.remove(observer)
+
+  # private method to call a method on every observer
+  def __notify(self, event, *args):
+    for observer in self.__observers:
+      getattr(observer, event)(*args)
+
+  # private method to break walls with the selected generator
+  def __break_walls(self, col=0, row=0):
+    # only hook into the generator if there is a window to draw on or an observer to notify
+    on_carve = on_backtrack = on_frontier = None
+    if self.__window is not None or self.__observers:
+      on_carve = self.__on_generate_carve
+      on_backtrack = self.__on_generate_backtrack
+    if self.__observers:
+      on_frontier = self.__on_generate_frontier
+
+    start = self.__grid.index(col, row)
+    self.__notify("on_phase_start", "generate")
+    self.__notify("on_cell_visited", "generate", col, row)
+    GENERATORS[self.__generator](self.__grid, self.__rng, start, on_carve, on_backtrack, on_frontier)
+    if self.__braid:
+      braid(self.__grid, self.__rng, self.__braid, on_carve)
+    self.__notify("on_phase_end", "generate")
+
+  # private method to redraw both cells either side of a broken wall
+  def __on_generate_carve(self, index, next_index):
+    col, row = self.__grid.position(index)
+    next_col, next_row = self.__grid.position(next_index)
+    if self.__window is not None:
+      self.__draw_cell(col, row)
+      self.__draw_cell(next_col, next_row)
+    for observer in self.__observers:
+      observer.on_wall_broken(col, row, next_col, next_row)
+      observer.on_cell_visited("generate", next_col, next_row)
+
+  # private method to redraw a cell the generator backtracks from
+  def __on_generate_backtrack(self, index):
+    col, row = self.__grid.position(index)
+    if self.__window is not None:
+      self.__draw_cell(col, row)
+    self.__notify("on_backtrack", "generate", col, row)
 
-      # recursively visit the chosen neighbor
-      self.__break_walls_recursive(next_col, next_row)
+  # private method to report the generator frontier size
+  def __on_generate_frontier(self, size):
+    self.__notify("on_frontier", "generate", size)
 
   # private method to reset visited status of all cells
   def __reset_cells_visited(self):
-    for col in range(self.__num_cols):
-      for row in range(self.__num_rows):
-        self.__cells[col][row].visited = False
-
-  # public method to solve the maze using DFS
-  def solve(self):
-    return self.__solve_recursive(0, 0)
-  
-  # private recursive method to solve the maze
-  def __solve_recursive(self, col, row):
-    # animate the solving process
+    self.__grid.reset_visited()
+
+  # private method to animate each cell the solver visits
+  def __on_solve_visit(self, index):
+    self.__animate()
+    if self.__observers:
+      self.__notify("on_cell_visited", "solve", *self.__grid.position(index))
+
+  # private method to report each cell the solver backtracks out of
+  def __on_solve_backtrack(self, index):
+    self.__notify("on_backtrack", "solve", *self.__grid.position(index))
+
+  # private method to report the solver frontier size
+  def __on_solve_frontier(self, size):
+    self.__notify("on_frontier", "solve", size)
+
+  # private method to draw each move the solver makes
+  def __on_solve_move(self, from_index, to_index, undo):
+    if self.__scheduler is None:
+      return
+    from_col, from_row = self.__grid.position(from_index)
+    to_col, to_row = self.__grid.position(to_index)
+    self.__scheduler.schedule(partial(self.__cells[from_col][from_row].draw_move, self.__cells[to_col][to_row], undo))
+
+  # private method to pick the solver hooks, only hooking in if there is a window to animate or an observer to notify
+  def __solve_hooks(self):
+    on_visit = on_move = on_backtrack = on_frontier = None
+    if self.__window is not None or self.__observers:
+      on_visit = self.__on_solve_visit
+      on_move = self.__on_solve_move
+    if self.__observers:
+      on_backtrack = self.__on_solve_backtrack
+      on_frontier = self.__on_solve_frontier
+    return on_visit, on_move, on_backtrack, on_frontier
+
+  # public method to search for a path from the entrance to the exit
+  def search(self, algorithm="dfs"):
+    # look up the requested solver
+    if algorithm not in SOLVERS:
+      raise ValueError(f"Unknown solver algorithm: {algorithm}")
+
+    start = self.__entrance
+    goal = self.__exit
+    self.__notify("on_phase_start", "solve")
+    result = SOLVERS[algorithm](self.__grid, start, goal, *self.__solve_hooks())
+    self.__notify("on_phase_end", "solve")
+    return result
+
+  # public method to search for the nearest of several goal cells, or all of them, in a single pass from the entrance
+  def search_goals(self, goals, find_all=False):
+    goals = [self.__cell_index(goal) for goal in goals]
+    self.__notify("on_phase_start", "solve")
+    results = solve_multi_goal(self.__grid, self.__entrance, goals, find_all, *self.__solve_hooks())
+    self.__notify("on_phase_end", "solve")
+    return results
+
+  # private method to run the work of a phase on a worker thread, letting observers such as profilers follow that thread
+  def __run_in_thread(self, phase, function, *args):
+    self.__notify("on_thread_start", phase)
+    try:
+      return function(*args)
+    finally:
+      self.__notify("on_thread_end", phase)
+
+  # public coroutine to search in a worker thread, keeping the event loop and window responsive
+  async def search_async(self, algorithm="dfs"):
+    # look up the requested solver
+    if algorithm not in SOLVERS:
+      raise ValueError(f"Unknown solver algorithm: {algorithm}")
+
+    # the worker only records the solver events, since Tk and the observers belong to this thread
+    events = []
+    def record(hook):
+      if hook is None:
+        return None
+      return lambda *args: events.append((hook, args))
+
+    # the phase covers the search in the worker as well as the replay, so observers time the solve itself
+    start = self.__entrance
+    goal = self.__exit
+    hooks = [record(hook) for hook in self.__solve_hooks()]
+    self.__notify("on_phase_start", "solve")
+    result = await asyncio.to_thread(self.__run_in_thread, "solve", SOLVERS[algorithm], self.__grid, start, goal, *hooks)
+
+    # replay the events here, queueing the animation and notifying the observers in order
+    for hook, args in events:
+      hook(*args)
+    self.__notify("on_phase_end", "solve")
+    return result
+
+  # public coroutine to wait until the queued animation has played back, processing window events meanwhile
+  async def wait_for_animation_async(self, interval=1 / 60):
+    if self.__scheduler is not None:
+      await self.__window.pump_events(lambda: not self.__scheduler.pending, interval)
+
+  # public method to search in a background thread at full speed, returning a Playback that draws the recorded events
+  def solve_in_background(self, algorithm="dfs", queue_size=DEFAULT_QUEUE_SIZE):
+    # the walls must not change until the search is done
+    start = self.__entrance
+    goal = self.__exit
+    worker = SolveWorker(self.__grid, algorithm, start, goal, queue_size,
+                         partial(self.__notify, "on_thread_start", "solve"), partial(self.__notify, "on_thread_end", "solve"))
+
+    # finish any queued animation first, so playback draws on top of the final walls
+    self.flush_animation()
+
+    # the solve phase ends with the search at full speed, and the playback phase once every event is drawn
+    self.__notify("on_phase_start", "solve")
+    self.__notify("on_phase_start", "playback")
+    playback = Playback(worker, self.__play_solve_event, self.__window, self.__animate_speed, self.__fps,
+                        partial(self.__notify, "on_phase_end", "playback"), partial(self.__notify, "on_phase_end", "solve"))
+    playback.start()
+    return playback
+
+  # private method to draw one recorded solver event on the UI thread, reporting it to the observers the first time
+  def __play_solve_event(self, event, replayed):
+    kind = event[0]
+    if kind == "move":
+      if self.__window is not None:
+        from_col, from_row = self.__grid.position(event[1])
+        to_col, to_row = self.__grid.position(event[2])
+        self.__cells[from_col][from_row].draw_move(self.__cells[to_col][to_row], event[3])
+    elif replayed:
+      return
+    elif kind == "visit":
+      self.__notify("on_cell_visited", "solve", *self.__grid.position(event[1]))
+    elif kind == "backtrack":
+      self.__notify("on_backtrack", "solve", *self.__grid.position(event[1]))
+    elif kind == "frontier":
+      self.__notify("on_frontier", "solve", event[1])
+
+  # public method to open the wall on one side of a cell, and the matching wall of its neighbour
+  def open_wall(self, col, row, direction):
+    self.__edit_wall(col, row, direction, False)
+
+  # public method to close the wall on one side of a cell, and the matching wall of its neighbour
+  def close_wall(self, col, row, direction):
+    self.__edit_wall(col, row, direction, True)
+
+  # private method to change a wall and invalidate only what depends on it
+  def __edit_wall(self, col, row, direction, closed):
+    # look up the wall for the direction name
+    if direction not in DIRECTIONS:
+      raise ValueError(f"Unknown wall direction: {direction}")
+    index = self.__cell_index((col, row))
+    wall = DIRECTIONS[direction]
+    if self.__grid.has_wall(col, row, wall) == closed:
+      return
+
+    # change the wall on both sides
+    if closed:
+      self.__grid.add_wall(col, row, wall)
+    else:
+      self.__grid.remove_wall(col, row, wall)
+
+    # redraw the cells either side of the wall if a window is provided
+    next_index = self.__grid.neighbour(index, wall)
     if self.__window is not None:
-      self.__animate()
-    
-    # mark the current cell as visited
-    self.__cells[col][row].visited = True
-    
-    # check if the exit is reached
-    if col == self.__num_cols - 1 and row == self.__num_rows - 1:
-      return True
-    
-    # check left neighbor is not visited and no wall in between
-    if col > 0 and not self.__cells[col][row].has_left_wall and not self.__cells[col - 1][row].visited:
-      # draw the move
-      self.__cells[col][row].draw_move(self.__cells[col - 1][row])
-
-      # recursively visit the left neighbor
-      if self.__solve_recursive(col - 1, row):
-        return True
-
-      # backtrack if false
-      self.__cells[col][row].draw_move(self.__cells[col - 1][row], True)
-
-    # check right neighbor is not visited and no wall in between
-    if col < self.__num_cols - 1 and not self.__cells[col][row].has_right_wall and not self.__cells[col + 1][row].visited:
-      # draw the move
-      self.__cells[col][row].draw_move(self.__cells[col + 1][row])
-
-      # recursively visit the right neighbor
-      if self.__solve_recursive(col + 1, row):
-        return True
-
-      # backtrack if false
-      self.__cells[col + 1][row].draw_move(self.__cells[col][row], True)    
-      
-    # check top neighbor is not visited and no wall in between
-    if row > 0 and not self.__cells[col][row].has_top_wall and not self.__cells[col][row - 1].visited:
-      # draw the move
-      self.__cells[col][row].draw_move(self.__cells[col][row - 1])
-
-      # recursively visit the top neighbor
-      if self.__solve_recursive(col, row - 1):
-        return True
-
-      # backtrack if false
-      self.__cells[col][row - 1].draw_move(self.__cells[col][row], True)
-
-    # check bottom neighbor is not visited and no wall in between
-    if row < self.__num_rows - 1 and not self.__cells[col][row].has_bottom_wall and not self.__cells[col][row + 1].visited:
-      # draw the move
-      self.__cells[col][row].draw_move(self.__cells[col][row + 1])
-
-      # recursively visit the bottom neighbor
-      if self.__solve_recursive(col, row + 1):
-        return True
-
-      # backtrack if false
-      self.__cells[col][row + 1].draw_move(self.__cells[col][row], True)    
-      
-    # if no solution found, return false
-    return False
+      self.__draw_cell(col, row)
+      if next_index is not None:
+        self.__draw_cell(*self.__grid.position(next_index))
+
+    # drop the distance fields built from the old walls
+    self.__fields.clear()
+    self.__is_tree = None
+
+    # let the cached solution repair the two cells on its next query
+    if self.__planner is not None and next_index is not None:
+      self.__planner.update_edge(index, next_index)
+
+  # public method to return the cached solution, repairing it after wall edits instead of searching again
+  def solution(self):
+    if self.__planner is None:
+      start = self.__entrance
+      goal = self.__exit
+      self.__planner = LifelongPlanner(self.__grid, start, goal)
+    return self.__planner.solve()
+
+  # public method to set the memory budget for cached distance fields, in bytes
+  def set_field_cache_size(self, max_bytes):
+    self.__fields.max_bytes = max_bytes
+
+  # public method to return the BFS distance and parent of every cell from a source cell, the entrance by default
+  def distance_field(self, source=None):
+    index = self.__entrance if source is None else self.__cell_index(source)
+    return self.__fields.get(self.__grid, index)
+
+  # public method to find a shortest path between any two cells as a list of (col, row)
+  def path(self, a, b):
+    a = self.__cell_index(a)
+    b = self.__cell_index(b)
+
+    # a perfect maze is a tree, so one field rooted at the entrance answers every query
+    root = self.__fields.get(self.__grid, self.__entrance)
+    if self.__is_tree is None:
+      self.__is_tree = root.is_tree() and root.reached == self.__grid.num_cells
+    if self.__is_tree:
+      path = root.tree_path(a, b)
+    else:
+      path = self.__fields.get(self.__grid, a).path_to(b)
+    return [self.__grid.position(cell) for cell in path]
+
+  # public method to render the maze offscreen to a PPM or PNG file, optionally with the moves of a search
+  def render(self, path, algorithm=None, cell_size=4):
+    image = MazeImage(self.__grid, cell_size)
+
+    # record the moves the solver would animate and draw them in the same order and colours
+    if algorithm is not None:
+      if algorithm not in SOLVERS:
+        raise ValueError(f"Unknown solver algorithm: {algorithm}")
+      moves = []
+      start = self.__entrance
+      goal = self.__exit
+      SOLVERS[algorithm](self.__grid, start, goal, on_move=lambda index, next_index, undo: moves.append((index, next_index, undo)))
+      image.draw_moves(moves)
+
+    image.save(path)
+    return image
+
+  # public method to measure the maze: dead ends, junctions, solution length, tortuosity and diameter
+  def analyze(self):
+    return analyze(self.__grid, self.__entrance, self.__exit)
+
+  # public method to solve the maze, using DFS by default
+  def solve(self, algorithm="dfs"):
+    return self.search(algorithm).found
@@ -0,0 +1,135 @@
+# import necessary modules
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import time
+from collections import Counter
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# define the MazeObserver class, the base for anything watching a maze generate and solve
+class MazeObserver:
+    # method called when a phase ("generate", "solve" or a background solve's "playback") starts
+    def on_phase_start(self, phase):
+        pass
+
+    # method called when a phase ends
+    def on_phase_end(self, phase):
+        pass
+
+    # method called on a worker thread just before it runs the work of a phase, such as a background solve
+    def on_thread_start(self, phase):
+        pass
+
+    # method called on a worker thread once the work of a phase is done
+    def on_thread_end(self, phase):
+        pass
+
+    # method called when a cell is visited
+    def on_cell_visited(self, phase, col, row):
+        pass
+
+    # method called when the generator breaks the wall between two cells
+    def on_wall_broken(self, col, row, next_col, next_row):
+        pass
+
+    # method called when the generator or solver backtracks out of a cell
+    def on_backtrack(self, phase, col, row):
+        pass
+
+    # method called when the frontier (stack or queue) changes size
+    def on_frontier(self, phase, size):
+        pass
+
+# define the StatsCollector class, counting events and timing each phase
+class StatsCollector(MazeObserver):
+    def __init__(self):
+        self.counters = Counter() # event counts keyed by (phase, event)
+        self.timings = {} # total seconds spent in each phase
+        self.peak_frontier = {} # largest frontier seen in each phase
+        self.__started = {} # start time of each running phase
+
+    def on_phase_start(self, phase):
+        self.__started[phase] = time.perf_counter()
+
+    def on_phase_end(self, phase):
+        elapsed_time = time.perf_counter() - self.__started.pop(phase)
+        self.timings[phase] = self.timings.get(phase, 0.0) + elapsed_time
+
+    def on_cell_visited(self, phase, col, row):
+        self.counters[phase, "cell_visited"] += 1
+
+    def on_wall_broken(self, col, row, next_col, next_row):
+        self.counters["generate", "wall_broken"] += 1
+
+    def on_backtrack(self, phase, col, row):
+        self.counters[phase, "backtrack"] += 1
+
+    def on_frontier(self, phase, size):
+        if size > self.peak_frontier.get(phase, 0):
+            self.peak_frontier[phase] = size
+
+    # method to return the collected statistics as a plain dictionary
+    def as_dict(self):
+        return {
+            "counters": {f"{phase}.{event}": count for (phase, event), count in sorted(self.counters.items())},
+            "timings": dict(self.timings),
+            "peak_frontier": dict(self.peak_frontier),
+        }
+
+# define the ProfileCollector class, running cProfile for the duration of each phase
+class ProfileCollector(MazeObserver):
+    def __init__(self, phases=("generate", "solve")):
+        self.phases = phases # phases to profile
+        self.profile = cProfile.Profile() # profiler shared by all phases on the calling thread
+        self.thread_profiles = [] # profiles of phase work run on worker threads
+        self.__local = threading.local() # profile running on the current worker thread
+
+    def on_phase_start(self, phase):
+        if phase in self.phases:
+            self.profile.enable()
+
+    def on_phase_end(self, phase):
+        if phase in self.phases:
+            self.profile.disable()
+
+    # cProfile only follows the thread that enables it, so work on a worker thread gets a profile of its own
+    def on_thread_start(self, phase):
+        if phase not in self.phases:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ profiles every thread from the one running profiler, which already sees this work
+            return
+        self.__local.profile = profile
+
+    def on_thread_end(self, phase):
+        profile = getattr(self.__local, "profile", None)
+        if phase in self.phases and profile is not None:
+            profile.disable()
+            self.__local.profile = None
+            self.thread_profiles.append(profile)
+
+    # private method to combine the profiles that recorded anything into one pstats object
+    def __stats(self, stream=None):
+        profiles = []
+        for profile in (self.profile, *self.thread_profiles):
+            profile.create_stats()
+            if profile.stats:
+                profiles.append(profile)
+        return pstats.Stats(*profiles, stream=stream)
+
+    # method to format the profile as a pstats report
+    def report(self, sort="cumulative", limit=20):
+        output = io.StringIO()
+        self.__stats(output).sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+    # method to save the raw profile for pstats or a profile viewer
+    def dump(self, path):
+        self.__stats().dump_stats(path)
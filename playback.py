@@ -0,0 +1,224 @@
+# import necessary modules
+import logging
+import queue
+import threading
+from solvers import SOLVERS
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# default number of solver events the queue holds before the worker waits for the UI to catch up
+DEFAULT_QUEUE_SIZE = 4096
+
+# seconds the worker waits on a full queue before checking if it was cancelled
+PUT_TIMEOUT = 0.1
+
+# raised inside the worker to abandon a cancelled search
+class _Cancelled(Exception):
+    pass
+
+# define the SolveWorker class, running a solver in a background thread and queueing its events
+class SolveWorker:
+    def __init__(self, grid, algorithm, start, goal, queue_size=DEFAULT_QUEUE_SIZE, on_thread_start=None, on_thread_end=None):
+        # look up the requested solver
+        if algorithm not in SOLVERS:
+            raise ValueError(f"Unknown solver algorithm: {algorithm}")
+        self.events = queue.Queue(queue_size) # bounded queue of ("visit" | "move" | "backtrack" | "frontier" | "done" | "error", ...) events
+        self.__solver = SOLVERS[algorithm] # solver function to run
+        self.__args = (grid, start, goal) # grid, start and goal indices for the solver
+        self.__on_thread_start = on_thread_start # callback run on the worker thread before the search, such as starting a profiler
+        self.__on_thread_end = on_thread_end # callback run on the worker thread once the search returns or fails
+        self.__cancelled = threading.Event() # set to abandon the search
+        self.__thread = threading.Thread(target=self.__run, daemon=True) # thread running the search
+
+    # method to start the search
+    def start(self):
+        self.__thread.start()
+
+    # method to abandon the search, which stops at its next event
+    def cancel(self):
+        self.__cancelled.set()
+
+    # method to wait for the search to finish
+    def join(self, timeout=None):
+        self.__thread.join(timeout)
+
+    # private method to queue an event, waiting while the queue is full unless cancelled
+    def __put(self, event):
+        while True:
+            if self.__cancelled.is_set():
+                raise _Cancelled()
+            try:
+                self.events.put(event, timeout=PUT_TIMEOUT)
+                return
+            except queue.Full:
+                pass
+
+    # private method to run the solver between the thread callbacks, queueing each event it reports
+    def __search(self):
+        put = self.__put
+        if self.__on_thread_start is not None:
+            self.__on_thread_start()
+        try:
+            return self.__solver(*self.__args,
+                on_visit=lambda index: put(("visit", index)),
+                on_move=lambda index, next_index, undo: put(("move", index, next_index, undo)),
+                on_backtrack=lambda index: put(("backtrack", index)),
+                on_frontier=lambda size: put(("frontier", size)))
+        finally:
+            if self.__on_thread_end is not None:
+                self.__on_thread_end()
+
+    # private method to run the search, queueing the result or the error at the end
+    def __run(self):
+        put = self.__put
+        try:
+            try:
+                result = self.__search()
+            except _Cancelled:
+                raise
+            except Exception as e:
+                logging.error(f"Error occurred while solving: {e}")
+                put(("error", e))
+                return
+            put(("done", result))
+        except _Cancelled:
+            # a cancelled search is never read again, so its last events are dropped
+            return
+
+# define the Playback class, recording the events of a worker and playing them back on the UI thread
+class Playback:
+    def __init__(self, worker, play_event, window=None, step_delay=0.02, fps=60, on_finish=None, on_done=None):
+        self.__worker = worker # worker producing the events
+        self.__play_event = play_event # callback drawing or reporting one event, told if it was played before
+        self.__window = window # window whose event loop drives playback, or None to only skip to the end
+        self.__step_delay = step_delay # seconds each visited cell takes to play back, 0 for as fast as possible
+        self.__frame_time = 1 / fps # seconds between frames
+        self.__on_finish = on_finish # callback run once, when every event has first been played or playback is cancelled
+        self.__on_done = on_done # callback run once, when the worker reports its result or an error, or playback is cancelled
+        self.events = [] # every event received so far, so playback never needs the search again
+        self.position = 0 # number of recorded events played so far
+        self.__played = 0 # number of recorded events ever played, so replays can be told apart
+        self.result = None # SolveResult once the search is done
+        self.__done = False # flag set once the worker has reported its last event
+        self.__finished = False # flag set once every event has been played
+        self.__credit = 0.0 # playback time earned but not yet spent on visits
+        self.__active = False # flag to track if a frame callback is scheduled
+
+    # property to check if every event has been played
+    @property
+    def finished(self):
+        return self.__finished
+
+    # method to start the worker and the frame callbacks
+    def start(self):
+        self.__worker.start()
+        self.__schedule()
+
+    # method to change the playback speed, taking effect on the next frame
+    def set_step_delay(self, step_delay):
+        self.__step_delay = step_delay
+
+    # method to wait for the search and play every remaining event at once
+    def skip_to_end(self):
+        self.__drain(block=True)
+        self.__play(len(self.events))
+        self.__check_finished()
+        if self.__window is not None:
+            self.__window.redraw()
+
+    # method to play the recording again from the start, at the current speed
+    def replay(self):
+        self.position = 0
+        self.__finished = False
+        self.__credit = 0.0
+        self.__schedule()
+
+    # method to abandon the search and stop playback, running on_finish if it has not run yet
+    def cancel(self):
+        self.__worker.cancel()
+        self.__set_done()
+        self.__finish()
+
+    # private method to move queued events into the recording, waiting for the last one if blocking
+    def __drain(self, block=False):
+        events = self.__worker.events
+        while not self.__done:
+            try:
+                event = events.get(block=block)
+            except queue.Empty:
+                return
+            if event[0] == "done":
+                self.result = event[1]
+                self.__set_done()
+            elif event[0] == "error":
+                # nothing more will be played, so finish before the error reaches the caller
+                self.__set_done()
+                self.__finish()
+                raise event[1]
+            else:
+                self.events.append(event)
+
+    # private method to mark the search done and run on_done the first time
+    def __set_done(self):
+        self.__done = True
+        if self.__on_done is not None:
+            on_done, self.__on_done = self.__on_done, None
+            on_done()
+
+    # private method to play recorded events up to an index
+    def __play(self, stop):
+        play_event = self.__play_event
+        events = self.events
+        played = self.__played
+        for position in range(self.position, stop):
+            play_event(events[position], position < played)
+        self.position = max(self.position, stop)
+        self.__played = max(played, self.position)
+
+    # private method to finish once the search is done and every event has been played
+    def __check_finished(self):
+        if self.__done and self.position == len(self.events) and not self.__finished:
+            self.__finish()
+
+    # private method to mark playback finished and run on_finish the first time
+    def __finish(self):
+        self.__finished = True
+        if self.__on_finish is not None:
+            on_finish, self.__on_finish = self.__on_finish, None
+            on_finish()
+
+    # private method to schedule the next frame callback
+    def __schedule(self):
+        if self.__window is None or self.__active:
+            return
+        self.__active = True
+        self.__window.after(max(1, round(self.__frame_time * 1000)), self.__tick)
+
+    # private method to play back one frame worth of events
+    def __tick(self):
+        self.__active = False
+        self.__drain()
+        if self.__finished:
+            return
+
+        # play events until the visits played use up the time earned, or all of them with no delay
+        self.__credit += self.__frame_time
+        stop = self.position
+        events = self.events
+        while stop < len(events):
+            if events[stop][0] == "visit" and self.__step_delay > 0:
+                if self.__step_delay > self.__credit:
+                    break
+                self.__credit -= self.__step_delay
+            stop += 1
+        self.__play(stop)
+
+        # never bank time while waiting for the worker to catch up
+        if stop == len(events):
+            self.__credit = min(self.__credit, self.__frame_time)
+
+        self.__window.redraw()
+        self.__check_finished()
+        if not self.__finished:
+            self.__schedule()
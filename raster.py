@@ -0,0 +1,246 @@
+# import necessary modules
+import logging
+import struct
+import zlib
+from grid import LEFT, RIGHT, TOP, BOTTOM
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# compressed bytes buffered before a PNG data chunk is written
+PNG_CHUNK_SIZE = 1 << 16
+
+# translation tables turning one byte per pixel (1 for a wall) into ASCII bits for packing
+PBM_BITS = bytes(b"1"[0] if value else b"0"[0] for value in range(256)) # PBM: 1 is black
+PNG_BITS = bytes(b"0"[0] if value else b"1"[0] for value in range(256)) # 1-bit greyscale PNG: 1 is white
+
+# colours of the rendered image, the same as the Tk window draws
+WHITE = b"\xff\xff\xff"
+BLACK = b"\x00\x00\x00"
+RED = b"\xff\x00\x00"
+GREY = b"\xbe\xbe\xbe"
+
+# helper to build the pixel patterns of one cell for every combination of its walls
+def wall_patterns(cell_size, wall=b"\x01", floor=b"\x00"):
+    # the boundary line above a cell: a corner pixel, then its top wall
+    top = [wall + (wall if walls & TOP else floor) * (cell_size - 1) for walls in range(16)]
+    # the lines through a cell: its left wall, then open floor
+    middle = [(wall if walls & LEFT else floor) + floor * (cell_size - 1) for walls in range(16)]
+    # the boundary line below a cell in the last row: a corner pixel, then its bottom wall
+    bottom = [wall + (wall if walls & BOTTOM else floor) * (cell_size - 1) for walls in range(16)]
+    return top, middle, bottom
+
+# helper to pack one byte per pixel into one bit per pixel, padding each line to whole bytes
+def _pack_bits(line, table):
+    padded = line + b"\x00" * (-len(line) % 8)
+    bits = padded.translate(table)
+    return int(bits, 2).to_bytes(len(padded) // 8, "big")
+
+# define the WallRasterizer class, turning rows of walls into lines of pixels with O(width) state
+class WallRasterizer:
+    def __init__(self, num_cols, num_rows, cell_size=4, wall=b"\x01", floor=b"\x00"):
+        # each cell is cell_size pixels wide with the shared wall lines between cells
+        if cell_size < 2:
+            raise ValueError("Cell size must be at least 2 pixels.")
+        self.num_cols = num_cols # number of columns in the maze
+        self.num_rows = num_rows # number of rows in the maze
+        self.cell_size = cell_size # pixels per cell along each side
+        self.width = num_cols * cell_size + 1 # image width in pixels
+        self.height = num_rows * cell_size + 1 # image height in pixels
+        self.__wall = wall # bytes of a wall pixel
+        self.__floor = floor # bytes of an open pixel
+        self.__top, self.__middle, self.__bottom = wall_patterns(cell_size, wall, floor)
+
+    # method to return the pixel lines (one byte per pixel, 1 for a wall, by default) of one row of cells
+    def lines(self, walls):
+        # the last pixel of each line is the right wall of the last cell
+        right_wall = self.__wall if walls[-1] & RIGHT else self.__floor
+        top = b"".join(map(self.__top.__getitem__, walls)) + self.__wall
+        middle = b"".join(map(self.__middle.__getitem__, walls)) + right_wall
+        return [top] + [middle] * (self.cell_size - 1)
+
+    # method to return the closing pixel line below the last row of cells
+    def closing_line(self, walls):
+        return b"".join(map(self.__bottom.__getitem__, walls)) + self.__wall
+
+# define the PBMWriter class, streaming a binary PBM image a row of cells at a time
+class PBMWriter:
+    def __init__(self, path, num_cols, num_rows, cell_size=4):
+        self.__raster = WallRasterizer(num_cols, num_rows, cell_size) # pixel layout of the image
+        self.__file = open(path, "wb") # file being written
+        self.__last = None # walls of the previous row, for the closing line
+        self.__file.write(b"P4\n%d %d\n" % (self.__raster.width, self.__raster.height))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # method to write the strip of pixel lines for the next row of cells
+    def write_row(self, walls):
+        self.__file.write(b"".join(_pack_bits(line, PBM_BITS) for line in self.__raster.lines(walls)))
+        self.__last = walls
+
+    # method to write the closing line and close the file
+    def close(self):
+        if self.__file.closed:
+            return
+        if self.__last is not None:
+            self.__file.write(_pack_bits(self.__raster.closing_line(self.__last), PBM_BITS))
+        self.__file.close()
+
+# helper to write one PNG chunk
+def _png_chunk(file, kind, data):
+    file.write(struct.pack(">I", len(data)))
+    file.write(kind)
+    file.write(data)
+    file.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+# helper to write the PNG signature and header: size, bit depth, colour type, default compression, filter and interlace
+def _png_header(file, width, height, bit_depth, colour_type):
+    file.write(b"\x89PNG\r\n\x1a\n")
+    _png_chunk(file, b"IHDR", struct.pack(">IIBBBBB", width, height, bit_depth, colour_type, 0, 0, 0))
+
+# define the PNGWriter class, streaming a 1-bit greyscale PNG a row of cells at a time
+class PNGWriter:
+    def __init__(self, path, num_cols, num_rows, cell_size=4):
+        self.__raster = WallRasterizer(num_cols, num_rows, cell_size) # pixel layout of the image
+        self.__file = open(path, "wb") # file being written
+        self.__compressor = zlib.compressobj(6) # compressor for the image data
+        self.__pending = [] # compressed data not yet written as a chunk
+        self.__pending_size = 0 # bytes of compressed data not yet written
+        self.__last = None # walls of the previous row, for the closing line
+
+        # header for a 1-bit greyscale image
+        _png_header(self.__file, self.__raster.width, self.__raster.height, 1, 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # private method to compress pixel lines, each preceded by the "no filter" byte
+    def __write_lines(self, lines):
+        data = b"".join(b"\x00" + _pack_bits(line, PNG_BITS) for line in lines)
+        self.__queue(self.__compressor.compress(data))
+
+    # private method to buffer compressed data, writing a chunk once enough has built up
+    def __queue(self, data, flush=False):
+        if data:
+            self.__pending.append(data)
+            self.__pending_size += len(data)
+        if self.__pending_size >= PNG_CHUNK_SIZE or (flush and self.__pending):
+            _png_chunk(self.__file, b"IDAT", b"".join(self.__pending))
+            self.__pending = []
+            self.__pending_size = 0
+
+    # method to write the strip of pixel lines for the next row of cells
+    def write_row(self, walls):
+        self.__write_lines(self.__raster.lines(walls))
+        self.__last = walls
+
+    # method to write the closing line, finish the image and close the file
+    def close(self):
+        if self.__file.closed:
+            return
+        if self.__last is not None:
+            self.__write_lines([self.__raster.closing_line(self.__last)])
+        self.__queue(self.__compressor.flush(), flush=True)
+        _png_chunk(self.__file, b"IEND", b"")
+        self.__file.close()
+
+# define the MazeImage class, an offscreen RGB rendering of a maze and the moves of a search
+class MazeImage:
+    # rasterize every wall of the grid in bulk, a row of cells at a time
+    def __init__(self, grid, cell_size=4):
+        self.grid = grid # reference to the grid being drawn
+        self.cell_size = cell_size # pixels per cell along each side
+        raster = WallRasterizer(grid.num_cols, grid.num_rows, cell_size, BLACK, WHITE)
+        self.width = raster.width # image width in pixels
+        self.height = raster.height # image height in pixels
+
+        walls = grid.wall_bytes()
+        num_cols = grid.num_cols
+        lines = []
+        for row in range(grid.num_rows):
+            lines.extend(raster.lines(walls[row * num_cols:(row + 1) * num_cols]))
+        lines.append(raster.closing_line(walls[(grid.num_rows - 1) * num_cols:]))
+        self.pixels = bytearray(b"".join(lines)) # RGB pixels, line by line
+        self.__colour_runs = {} # pixel runs of a move, by colour
+
+    # private method to return the horizontal run and per-channel vertical runs of a move in a colour
+    def __runs(self, colour):
+        runs = self.__colour_runs.get(colour)
+        if runs is None:
+            count = self.cell_size + 1
+            runs = (colour * count, [colour[channel:channel + 1] * count for channel in range(3)])
+            self.__colour_runs[colour] = runs
+        return runs
+
+    # method to draw a line between the centres of two neighbouring cells
+    def draw_move(self, index, next_index, colour=RED):
+        if next_index < index:
+            index, next_index = next_index, index
+        num_cols = self.grid.num_cols
+        size = self.cell_size
+        line_bytes = self.width * 3
+        row, col = divmod(index, num_cols)
+        start = (row * size + size // 2) * line_bytes + (col * size + size // 2) * 3
+        horizontal, vertical = self.__runs(colour)
+        if next_index - index != num_cols:
+            # a horizontal run is one contiguous slice
+            self.pixels[start:start + len(horizontal)] = horizontal
+        else:
+            # a vertical run sets each channel with one strided slice
+            stop = start + size * line_bytes + 3
+            for channel in range(3):
+                self.pixels[start + channel:stop:line_bytes] = vertical[channel]
+
+    # method to draw a path of (col, row) positions, red like the solver draws it
+    def draw_path(self, path, colour=RED):
+        grid = self.grid
+        for (col, row), (next_col, next_row) in zip(path, path[1:]):
+            self.draw_move(grid.index(col, row), grid.index(next_col, next_row), colour)
+
+    # method to draw recorded solver moves in order, red forward and grey when backtracking
+    def draw_moves(self, moves):
+        for index, next_index, undo in moves:
+            self.draw_move(index, next_index, GREY if undo else RED)
+
+    # method to return the pixels as a (height, width, 3) NumPy array sharing the buffer
+    def to_array(self):
+        import numpy
+        return numpy.frombuffer(self.pixels, dtype=numpy.uint8).reshape(self.height, self.width, 3)
+
+    # method to write the image as a binary PPM
+    def save_ppm(self, path):
+        with open(path, "wb") as file:
+            file.write(b"P6\n%d %d\n255\n" % (self.width, self.height))
+            file.write(self.pixels)
+
+    # method to write the image as an RGB PNG
+    def save_png(self, path):
+        # each line starts with the "no filter" byte
+        line_bytes = self.width * 3
+        pixels = self.pixels
+        compressor = zlib.compressobj(1)
+        with open(path, "wb") as file:
+            _png_header(file, self.width, self.height, 8, 2)
+            data = []
+            for start in range(0, len(pixels), line_bytes):
+                data.append(compressor.compress(b"\x00" + pixels[start:start + line_bytes]))
+            data.append(compressor.flush())
+            _png_chunk(file, b"IDAT", b"".join(data))
+            _png_chunk(file, b"IEND", b"")
+
+    # method to write the image, choosing PPM or PNG from the file extension
+    def save(self, path):
+        extension = path[path.rfind("."):].lower()
+        if extension == ".ppm":
+            self.save_ppm(path)
+        elif extension == ".png":
+            self.save_png(path)
+        else:
+            raise ValueError(f"Unknown image format: {path}")
@@ -0,0 +1,412 @@
+# import necessary modules
+import heapq
+import logging
+import time
+from array import array
+from collections import deque
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# define the SolveResult class returned by every solver
+class SolveResult:
+    def __init__(self, algorithm, path, nodes_expanded, peak_frontier, elapsed_time, cost=None):
+        self.algorithm = algorithm # name of the solver that produced the result
+        self.path = path # list of (col, row) cells from start to goal, empty if unsolved
+        self.nodes_expanded = nodes_expanded # number of cells taken off the frontier
+        self.peak_frontier = peak_frontier # largest frontier size seen during the search
+        self.elapsed_time = elapsed_time # wall time of the search in seconds
+        self.cost = cost # total weight of the cells entered along the path, for weighted solvers
+
+    # property to check if a path was found
+    @property
+    def found(self):
+        return bool(self.path)
+
+    # method to return the result as a plain dictionary
+    def as_dict(self):
+        result = {
+            "algorithm": self.algorithm,
+            "path_length": len(self.path),
+            "nodes_expanded": self.nodes_expanded,
+            "peak_frontier": self.peak_frontier,
+            "elapsed_time": self.elapsed_time,
+        }
+        if self.cost is not None:
+            result["cost"] = self.cost
+        return result
+
+    def __repr__(self):
+        return (f"SolveResult(algorithm={self.algorithm!r}, path_length={len(self.path)}, "
+                f"nodes_expanded={self.nodes_expanded}, peak_frontier={self.peak_frontier}, "
+                f"elapsed_time={self.elapsed_time:.6f})")
+
+# helper to rebuild a path of cell indices from a dictionary of parent links
+def _build_path(parents, goal):
+    path = []
+    cell = goal
+    while cell is not None:
+        path.append(cell)
+        cell = parents[cell]
+    path.reverse()
+    return path
+
+# helper to convert a path of cell indices to (col, row) positions
+def _positions(grid, path):
+    return [grid.position(cell) for cell in path]
+
+# function to total the weights of the cells entered along a path of (col, row) positions
+def path_cost(grid, path):
+    if grid.weights is None:
+        return max(len(path) - 1, 0)
+    return sum(grid.weights[grid.index(col, row)] for col, row in path[1:])
+
+# helper to report the final path of a non-backtracking search as moves
+def _draw_path(path, on_move):
+    if on_move is None:
+        return
+    for i in range(len(path) - 1):
+        on_move(path[i], path[i + 1], False)
+
+# depth-first search, visiting neighbours in the same order as the original recursive solver
+def solve_dfs(grid, start, goal, on_visit=None, on_move=None, on_backtrack=None, on_frontier=None):
+    start_time = time.perf_counter()
+
+    # visit the start cell
+    if on_visit is not None:
+        on_visit(start)
+    visited = bytearray(grid.num_cells)
+    visited[start] = 1
+    nodes_expanded = 1
+    if start == goal:
+        return SolveResult("dfs", _positions(grid, [start]), nodes_expanded, 1, time.perf_counter() - start_time)
+
+    # each stack frame holds a cell and the iterator over its remaining neighbours
+    open_neighbours = grid.open_neighbours
+    stack = [(start, iter(open_neighbours(start)))]
+    peak_frontier = 1
+    while stack:
+        cell, remaining = stack[-1]
+
+        # find the next unvisited neighbour of the current cell
+        for next_cell in remaining:
+            if not visited[next_cell]:
+                break
+        else:
+            # no unvisited neighbours left, backtrack to the previous cell
+            stack.pop()
+            if on_backtrack is not None:
+                on_backtrack(cell)
+            if on_frontier is not None:
+                on_frontier(len(stack))
+            if stack and on_move is not None:
+                on_move(stack[-1][0], cell, True)
+            continue
+
+        # move to the neighbour and visit it
+        if on_move is not None:
+            on_move(cell, next_cell, False)
+        if on_visit is not None:
+            on_visit(next_cell)
+        visited[next_cell] = 1
+        nodes_expanded += 1
+
+        # check if the goal is reached
+        if next_cell == goal:
+            path = [frame[0] for frame in stack]
+            path.append(next_cell)
+            if on_frontier is not None:
+                on_frontier(len(path))
+            return SolveResult("dfs", _positions(grid, path), nodes_expanded, max(peak_frontier, len(path)), time.perf_counter() - start_time)
+
+        stack.append((next_cell, iter(open_neighbours(next_cell))))
+        if on_frontier is not None:
+            on_frontier(len(stack))
+        peak_frontier = max(peak_frontier, len(stack))
+
+    # the goal is unreachable
+    return SolveResult("dfs", [], nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+# breadth-first search, returning a shortest path
+def solve_bfs(grid, start, goal, on_visit=None, on_move=None, on_backtrack=None, on_frontier=None):
+    start_time = time.perf_counter()
+
+    parents = {start: None}
+    frontier = deque([start])
+    nodes_expanded = 0
+    peak_frontier = 1
+    while frontier:
+        # expand the oldest cell on the frontier
+        cell = frontier.popleft()
+        if on_visit is not None:
+            on_visit(cell)
+        nodes_expanded += 1
+
+        # check if the goal is reached
+        if cell == goal:
+            path = _build_path(parents, goal)
+            _draw_path(path, on_move)
+            return SolveResult("bfs", _positions(grid, path), nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+        # add the unseen neighbours to the frontier
+        for next_cell in grid.open_neighbours(cell):
+            if next_cell not in parents:
+                parents[next_cell] = cell
+                frontier.append(next_cell)
+                if on_move is not None:
+                    on_move(cell, next_cell, True)
+        if on_frontier is not None:
+            on_frontier(len(frontier))
+        peak_frontier = max(peak_frontier, len(frontier))
+
+    # the goal is unreachable
+    return SolveResult("bfs", [], nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+# A* search with a manhattan distance heuristic, returning a shortest path
+def solve_astar(grid, start, goal, on_visit=None, on_move=None, on_backtrack=None, on_frontier=None):
+    start_time = time.perf_counter()
+    num_cols = grid.num_cols
+    goal_row, goal_col = divmod(goal, num_cols)
+
+    # helper to estimate the remaining distance to the goal
+    def heuristic(cell):
+        row, col = divmod(cell, num_cols)
+        return abs(col - goal_col) + abs(row - goal_row)
+
+    # the counter breaks ties in insertion order
+    parents = {start: None}
+    costs = {start: 0}
+    counter = 0
+    frontier = [(heuristic(start), counter, start)]
+    closed = set()
+    nodes_expanded = 0
+    peak_frontier = 1
+    while frontier:
+        # expand the cell with the lowest estimated total cost
+        _, _, cell = heapq.heappop(frontier)
+        if cell in closed:
+            continue
+        closed.add(cell)
+        if on_visit is not None:
+            on_visit(cell)
+        nodes_expanded += 1
+
+        # check if the goal is reached
+        if cell == goal:
+            path = _build_path(parents, goal)
+            _draw_path(path, on_move)
+            return SolveResult("astar", _positions(grid, path), nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+        # relax the edges to each neighbour
+        cost = costs[cell] + 1
+        for next_cell in grid.open_neighbours(cell):
+            if next_cell not in closed and cost < costs.get(next_cell, cost + 1):
+                costs[next_cell] = cost
+                parents[next_cell] = cell
+                counter += 1
+                heapq.heappush(frontier, (cost + heuristic(next_cell), counter, next_cell))
+                if on_move is not None:
+                    on_move(cell, next_cell, True)
+        if on_frontier is not None:
+            on_frontier(len(frontier))
+        peak_frontier = max(peak_frontier, len(frontier))
+
+    # the goal is unreachable
+    return SolveResult("astar", [], nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+# bidirectional breadth-first search, growing one layer at a time from the smaller side
+def solve_bidirectional(grid, start, goal, on_visit=None, on_move=None, on_backtrack=None, on_frontier=None):
+    start_time = time.perf_counter()
+
+    # check the trivial case before searching
+    if start == goal:
+        if on_visit is not None:
+            on_visit(start)
+        return SolveResult("bidirectional", _positions(grid, [start]), 1, 1, time.perf_counter() - start_time)
+
+    forward_parents = {start: None}
+    backward_parents = {goal: None}
+    forward = [start]
+    backward = [goal]
+    nodes_expanded = 0
+    peak_frontier = 2
+    meeting_cell = None
+    while forward and backward and meeting_cell is None:
+        # expand the smaller of the two frontiers by one layer
+        if len(forward) <= len(backward):
+            frontier, parents, others = forward, forward_parents, backward_parents
+        else:
+            frontier, parents, others = backward, backward_parents, forward_parents
+
+        next_layer = []
+        for cell in frontier:
+            if on_visit is not None:
+                on_visit(cell)
+            nodes_expanded += 1
+            for next_cell in grid.open_neighbours(cell):
+                if next_cell in parents:
+                    continue
+                parents[next_cell] = cell
+                next_layer.append(next_cell)
+                if on_move is not None:
+                    on_move(cell, next_cell, True)
+
+                # stop as soon as the two searches meet
+                if next_cell in others:
+                    meeting_cell = next_cell
+                    break
+            if meeting_cell is not None:
+                break
+
+        # replace the expanded frontier with the next layer
+        if frontier is forward:
+            forward = next_layer
+        else:
+            backward = next_layer
+        if on_frontier is not None:
+            on_frontier(len(forward) + len(backward))
+        peak_frontier = max(peak_frontier, len(forward) + len(backward))
+
+    # the goal is unreachable
+    if meeting_cell is None:
+        return SolveResult("bidirectional", [], nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+    # join the two half paths at the meeting cell
+    path = _build_path(forward_parents, meeting_cell)
+    cell = backward_parents[meeting_cell]
+    while cell is not None:
+        path.append(cell)
+        cell = backward_parents[cell]
+    _draw_path(path, on_move)
+    return SolveResult("bidirectional", _positions(grid, path), nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+# helper for Dijkstra and A* on cell weights, using a bucket queue since every key is a small integer
+def _bucket_search(algorithm, use_heuristic, grid, start, goal, on_visit, on_move, on_frontier):
+    start_time = time.perf_counter()
+    weights = grid.weights
+    max_weight = max(weights) if weights else 1
+    min_weight = min(weights) if weights else 1
+    num_cols = grid.num_cols
+    goal_row, goal_col = divmod(goal, num_cols)
+
+    # helper to estimate the remaining cost, never more than the cheapest cells could add up to
+    def heuristic(cell):
+        if not use_heuristic:
+            return 0
+        row, col = divmod(cell, num_cols)
+        return min_weight * (abs(col - goal_col) + abs(row - goal_row))
+
+    # queued keys never run more than one edge weight plus one heuristic step ahead of the
+    # smallest, so a ring of buckets that wide holds every live key without collisions
+    ring_size = max_weight + min_weight + 1
+    buckets = [[] for _ in range(ring_size)]
+    costs = array("i", [-1]) * grid.num_cells
+    parents = array("i", [-1]) * grid.num_cells
+    closed = bytearray(grid.num_cells)
+    costs[start] = 0
+    key = heuristic(start)
+    buckets[key % ring_size].append(start)
+    queued = 1
+    nodes_expanded = 0
+    peak_frontier = 1
+    while queued:
+        # advance to the next non-empty bucket and take its newest cell
+        bucket = buckets[key % ring_size]
+        while not bucket:
+            key += 1
+            bucket = buckets[key % ring_size]
+        cell = bucket.pop()
+        queued -= 1
+        if closed[cell]:
+            continue
+        closed[cell] = 1
+        if on_visit is not None:
+            on_visit(cell)
+        nodes_expanded += 1
+
+        # check if the goal is reached
+        if cell == goal:
+            path = [goal]
+            while path[-1] != start:
+                path.append(parents[path[-1]])
+            path.reverse()
+            _draw_path(path, on_move)
+            return SolveResult(algorithm, _positions(grid, path), nodes_expanded, peak_frontier, time.perf_counter() - start_time, costs[goal])
+
+        # relax the edges to each neighbour, entering a cell costs its weight
+        cost = costs[cell]
+        for next_cell in grid.open_neighbours(cell):
+            if closed[next_cell]:
+                continue
+            next_cost = cost + (weights[next_cell] if weights else 1)
+            if costs[next_cell] < 0 or next_cost < costs[next_cell]:
+                costs[next_cell] = next_cost
+                parents[next_cell] = cell
+                buckets[(next_cost + heuristic(next_cell)) % ring_size].append(next_cell)
+                queued += 1
+                if on_move is not None:
+                    on_move(cell, next_cell, True)
+        if on_frontier is not None:
+            on_frontier(queued)
+        peak_frontier = max(peak_frontier, queued)
+
+    # the goal is unreachable
+    return SolveResult(algorithm, [], nodes_expanded, peak_frontier, time.perf_counter() - start_time)
+
+# Dijkstra's algorithm over cell weights, returning a cheapest path
+def solve_dijkstra(grid, start, goal, on_visit=None, on_move=None, on_backtrack=None, on_frontier=None):
+    return _bucket_search("dijkstra", False, grid, start, goal, on_visit, on_move, on_frontier)
+
+# A* over cell weights, guided by the manhattan distance times the smallest weight
+def solve_weighted_astar(grid, start, goal, on_visit=None, on_move=None, on_backtrack=None, on_frontier=None):
+    return _bucket_search("weighted_astar", True, grid, start, goal, on_visit, on_move, on_frontier)
+
+# breadth-first search towards several goals at once, stopping at the nearest one or once all are reached
+def solve_multi_goal(grid, start, goals, find_all=False, on_visit=None, on_move=None, on_backtrack=None, on_frontier=None):
+    start_time = time.perf_counter()
+    remaining = set(goals)
+    results = []
+
+    parents = {start: None}
+    frontier = deque([start])
+    nodes_expanded = 0
+    peak_frontier = 1
+    while frontier and remaining:
+        # expand the oldest cell on the frontier
+        cell = frontier.popleft()
+        if on_visit is not None:
+            on_visit(cell)
+        nodes_expanded += 1
+
+        # record each goal as it is reached, nearest first, and stop unless all of them are wanted
+        if cell in remaining:
+            remaining.discard(cell)
+            path = _build_path(parents, cell)
+            _draw_path(path, on_move)
+            results.append(SolveResult("multi_goal", _positions(grid, path), nodes_expanded, peak_frontier, time.perf_counter() - start_time))
+            if not find_all:
+                break
+
+        # add the unseen neighbours to the frontier
+        for next_cell in grid.open_neighbours(cell):
+            if next_cell not in parents:
+                parents[next_cell] = cell
+                frontier.append(next_cell)
+                if on_move is not None:
+                    on_move(cell, next_cell, True)
+        if on_frontier is not None:
+            on_frontier(len(frontier))
+        peak_frontier = max(peak_frontier, len(frontier))
+
+    # goals never reached are left out
+    return results
+
+# registry of the available solvers by name
+SOLVERS = {
+    "dfs": solve_dfs,
+    "bfs": solve_bfs,
+    "astar": solve_astar,
+    "bidirectional": solve_bidirectional,
+    "dijkstra": solve_dijkstra,
+    "weighted_astar": solve_weighted_astar,
+}
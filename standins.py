@@ -0,0 +1,87 @@
+# import necessary modules
+import logging
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# stand-in for the Tk root window, so graphics can be tested and timed without a display
+class StandInRoot:
+    def __init__(self):
+        self.callbacks = [] # callbacks queued with after, run by run_callbacks
+        self.bindings = {} # event handlers by sequence
+        self.quitting = False # flag set by quit to end mainloop
+
+    def after(self, delay_ms, callback):
+        self.callbacks.append(callback)
+        return callback
+
+    def after_cancel(self, timer):
+        if timer in self.callbacks:
+            self.callbacks.remove(timer)
+
+    # helper to run the queued callbacks like one pass of the Tk event loop
+    def run_callbacks(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+        return len(callbacks)
+
+    # run the queued callbacks in order until quit is called or none are left
+    def mainloop(self):
+        self.quitting = False
+        while self.callbacks and not self.quitting:
+            self.callbacks.pop(0)()
+
+    def quit(self):
+        self.quitting = True
+
+    def title(self, text):
+        pass
+
+    def protocol(self, name, handler):
+        pass
+
+    def focus_set(self):
+        pass
+
+    def bind(self, sequence, handler):
+        self.bindings[sequence] = handler
+
+    def unbind(self, sequence):
+        self.bindings.pop(sequence, None)
+
+    def update(self):
+        self.run_callbacks()
+
+    def update_idletasks(self):
+        pass
+
+# stand-in for the Tk canvas that records its line items
+class StandInCanvas:
+    def __init__(self):
+        self.items = {} # item id to [coords, options]
+        self.created = 0 # number of create_line calls
+
+    def create_line(self, *coords, **options):
+        self.created += 1
+        self.items[self.created] = [coords, options]
+        return self.created
+
+    def coords(self, item, *coords):
+        self.items[item][0] = coords
+
+    def itemconfig(self, item, **options):
+        self.items[item][1].update(options)
+
+    def delete(self, *items):
+        for item in items:
+            del self.items[item]
+
+    def tag_raise(self, item):
+        self.items[item] = self.items.pop(item)
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
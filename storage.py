@@ -0,0 +1,168 @@
+# import necessary modules
+import logging
+import mmap
+import struct
+from grid import Grid
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# file header: magic, format version, padding, number of columns, number of rows, entrance and exit cell indices
+# (64-bit, since a grid of 32-bit columns and rows can hold more than 2^32 cells)
+MAGIC = b"MAZE"
+VERSION = 2
+HEADER = struct.Struct("<4sB3xIIQQ")
+
+# headers by format version, version 1 files having no entrance or exit
+HEADERS = {1: struct.Struct("<4sB3xII"), VERSION: HEADER}
+
+# bytes of wall data packed or unpacked at a time while saving
+CHUNK_SIZE = 1 << 20
+
+# translation tables splitting a packed byte into the walls of its two cells
+LOW_NIBBLE = bytes(value & 0x0F for value in range(256))
+HIGH_NIBBLE = bytes(value >> 4 for value in range(256))
+
+# translation table moving the walls of a cell into the high nibble
+SHIFT_HIGH = bytes((value & 0x0F) << 4 for value in range(256))
+
+# helper to pack the walls of an even number of cells into one byte per two cells
+def _pack(walls):
+    low = walls[0::2]
+    high = bytes(walls[1::2]).translate(SHIFT_HIGH)
+    return (int.from_bytes(low, "little") | int.from_bytes(high, "little")).to_bytes(len(low), "little")
+
+# helper to unpack bytes of packed walls into one byte per cell
+def _unpack(packed):
+    walls = bytearray(len(packed) * 2)
+    walls[0::2] = packed.translate(LOW_NIBBLE)
+    walls[1::2] = packed.translate(HIGH_NIBBLE)
+    return walls
+
+# define the PackedWalls class, a bytearray-like view of walls packed four bits per cell in a buffer
+class PackedWalls:
+    def __init__(self, buffer, offset, num_cells):
+        self.__buffer = buffer # buffer holding the packed walls, such as an mmap
+        self.__offset = offset # offset of the first packed byte in the buffer
+        self.__num_cells = num_cells # number of cells stored
+
+    def __len__(self):
+        return self.__num_cells
+
+    def __getitem__(self, index):
+        # unpack a range of cells in bulk
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__num_cells)
+            if step < 0 or start >= stop:
+                return bytes(self[i] for i in range(start, stop, step))
+            first = self.__offset + start // 2
+            last = self.__offset + (stop + 1) // 2
+            walls = _unpack(bytes(self.__buffer[first:last]))
+            return bytes(walls[start % 2:start % 2 + stop - start:step])
+
+        # read the nibble of a single cell
+        if index < 0:
+            index += self.__num_cells
+        if not 0 <= index < self.__num_cells:
+            raise IndexError("cell index out of range")
+        value = self.__buffer[self.__offset + index // 2]
+        return value >> 4 if index & 1 else value & 0x0F
+
+    def __setitem__(self, index, value):
+        # write the nibble of a single cell, leaving its neighbour in the same byte untouched
+        if index < 0:
+            index += self.__num_cells
+        if not 0 <= index < self.__num_cells:
+            raise IndexError("cell index out of range")
+        position = self.__offset + index // 2
+        if index & 1:
+            self.__buffer[position] = (self.__buffer[position] & 0x0F) | (value & 0x0F) << 4
+        else:
+            self.__buffer[position] = (self.__buffer[position] & 0xF0) | (value & 0x0F)
+
+    def __eq__(self, other):
+        return bytes(self[:]) == bytes(other[:])
+
+# define the MazeFileWriter class, writing a maze file from walls supplied a row (or any run of cells) at a time
+class MazeFileWriter:
+    def __init__(self, path, num_cols, num_rows, entrance=0, exit=None):
+        if exit is None:
+            exit = num_cols * num_rows - 1
+        self.__file = open(path, "wb") # file being written
+        self.__remaining = num_cols * num_rows # cells still to be written
+        self.__carry = b"" # unpaired last cell of the previous write
+        self.__file.write(HEADER.pack(MAGIC, VERSION, num_cols, num_rows, entrance, max(exit, 0)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # an error part way through already explains the missing cells, so only report them after a normal finish
+        try:
+            self.close()
+        except ValueError:
+            if exc_type is None:
+                raise
+
+    # method to append the walls of the next cells
+    def write_row(self, walls):
+        if len(walls) > self.__remaining:
+            raise ValueError("More cells written than the maze holds.")
+        self.__remaining -= len(walls)
+
+        # pack whole pairs of cells, keeping an odd one back for the next write
+        walls = self.__carry + bytes(walls)
+        paired = len(walls) - len(walls) % 2
+        self.__carry = walls[paired:]
+        if paired:
+            self.__file.write(_pack(walls[:paired]))
+
+    # method to pad the last cell and close the file
+    def close(self):
+        if self.__file.closed:
+            return
+        if self.__carry:
+            self.__file.write(_pack(self.__carry + b"\x00"))
+            self.__carry = b""
+        self.__file.close()
+        if self.__remaining:
+            raise ValueError(f"Maze file closed with {self.__remaining} cells missing.")
+
+# function to save the walls of a grid to a file, with the indices of its entrance and exit cells
+def save_grid(grid, path, entrance=0, exit=None):
+    walls = grid.walls
+    with MazeFileWriter(path, grid.num_cols, grid.num_rows, entrance, exit) as writer:
+        # pack the walls a chunk at a time to bound memory use
+        for start in range(0, grid.num_cells, CHUNK_SIZE):
+            writer.write_row(walls[start:start + CHUNK_SIZE])
+
+# function to load a grid from a file with its entrance and exit indices, mapping the walls into memory instead of reading them
+def load_maze(path):
+    with open(path, "rb") as file:
+        # check the header before mapping the file
+        header = file.read(HEADER.size)
+        if len(header) < 5 or header[:4] != MAGIC:
+            raise ValueError(f"Not a maze file: {path}")
+        version = header[4]
+        if version not in HEADERS:
+            raise ValueError(f"Unsupported maze file version: {version}")
+        header_format = HEADERS[version]
+        if len(header) < header_format.size:
+            raise ValueError(f"Not a maze file: {path}")
+        num_cols, num_rows, *openings = header_format.unpack(header[:header_format.size])[2:]
+
+        # copy-on-write mapping, so edits to the loaded maze never change the file
+        num_cells = num_cols * num_rows
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(buffer) < header_format.size + (num_cells + 1) // 2:
+            raise ValueError(f"Truncated maze file: {path}")
+
+    # version 1 files always opened the top-left and bottom-right cells
+    entrance, exit = openings or (0, num_cells - 1)
+    if num_cells and not (0 <= entrance < num_cells and 0 <= exit < num_cells):
+        raise ValueError(f"Entrance or exit outside the maze in: {path}")
+    return Grid(num_cols, num_rows, PackedWalls(buffer, header_format.size, num_cells)), entrance, exit
+
+# function to load a grid from a file, mapping the walls into memory instead of reading them
+def load_grid(path):
+    return load_maze(path)[0]
@@ -0,0 +1,108 @@
+# import necessary modules
+import argparse
+import logging
+from generators import ellers_rows, make_rng
+from grid import ALL_WALLS, ENTRANCE_WALLS, EXIT_WALLS, LEFT, RIGHT, TOP, BOTTOM, boundary_index, outer_wall
+from raster import PBMWriter, PNGWriter
+from storage import MazeFileWriter
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# image writers by file extension
+IMAGE_WRITERS = {".pbm": PBMWriter, ".png": PNGWriter}
+
+# helper to return the index and outer wall of the entrance and the exit, the exit defaulting to the bottom-right cell
+def _outer_openings(num_cols, num_rows, entrance, exit):
+    if exit is None:
+        exit = (num_cols - 1, num_rows - 1)
+    entrance = boundary_index(num_cols, num_rows, entrance, "Entrance")
+    exit = boundary_index(num_cols, num_rows, exit, "Exit")
+    return [(entrance, outer_wall(num_cols, num_rows, entrance, ENTRANCE_WALLS)),
+            (exit, outer_wall(num_cols, num_rows, exit, EXIT_WALLS))]
+
+# function to yield the walls of a perfect maze one row at a time, holding only O(width) state
+def stream_rows(num_cols, num_rows, seed=None, rng=None, entrance=(0, 0), exit=None):
+    outer = _outer_openings(num_cols, num_rows, entrance, exit)
+    rng = make_rng(seed, rng)
+    above = bytearray(num_cols) # openings of the previous row, whose bottoms are this row's tops
+    for row, openings in enumerate(ellers_rows(num_cols, num_rows, rng)):
+        walls = bytearray([ALL_WALLS]) * num_cols
+        for col in range(num_cols):
+            if openings[col] & RIGHT:
+                walls[col] &= ~RIGHT
+                walls[col + 1] &= ~LEFT
+            if openings[col] & BOTTOM:
+                walls[col] &= ~BOTTOM
+            if above[col] & BOTTOM:
+                walls[col] &= ~TOP
+
+        # break the outer walls of the entrance and exit, the same walls as a Maze breaks
+        for index, wall in outer:
+            if index // num_cols == row:
+                walls[index % num_cols] &= ~wall
+        above = openings
+        yield walls
+
+# helper to close every writer, even after one fails, returning the first error
+def _close_all(writers):
+    error = None
+    for writer in writers:
+        try:
+            writer.close()
+        except Exception as e:
+            if error is None:
+                error = e
+    return error
+
+# function to pass each row to every writer, closing them all at the end
+def stream_to(rows, writers):
+    try:
+        for walls in rows:
+            for writer in writers:
+                writer.write_row(walls)
+    except BaseException:
+        # the original error explains any cells the files are missing, so errors from closing are dropped
+        _close_all(writers)
+        raise
+
+    error = _close_all(writers)
+    if error is not None:
+        raise error
+
+# function to generate a maze straight to a maze file and optionally an image, without holding the grid
+def write_maze(path, num_cols, num_rows, seed=None, rng=None, image=None, cell_size=4, entrance=(0, 0), exit=None):
+    # check the openings and the image format before any file is created
+    (entrance_index, _), (exit_index, _) = _outer_openings(num_cols, num_rows, entrance, exit)
+    if image is not None:
+        extension = image[image.rfind("."):].lower()
+        if extension not in IMAGE_WRITERS:
+            raise ValueError(f"Unknown image format: {image}")
+
+    # close the writers already opened if a later one cannot be
+    writers = []
+    try:
+        writers.append(MazeFileWriter(path, num_cols, num_rows, entrance_index, exit_index))
+        if image is not None:
+            writers.append(IMAGE_WRITERS[extension](image, num_cols, num_rows, cell_size))
+    except BaseException:
+        _close_all(writers)
+        raise
+    stream_to(stream_rows(num_cols, num_rows, seed, rng, entrance, exit), writers)
+
+# main function to stream a large maze to disk from the command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a maze row by row straight to disk.")
+    parser.add_argument("output", help="maze file to write")
+    parser.add_argument("--cols", type=int, default=1000, help="number of columns")
+    parser.add_argument("--rows", type=int, default=1000, help="number of rows")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random number generator")
+    parser.add_argument("--image", default=None, help="also render a .pbm or .png image")
+    parser.add_argument("--cell-size", type=int, default=4, help="pixels per cell in the image")
+    args = parser.parse_args(argv)
+
+    write_maze(args.output, args.cols, args.rows, args.seed, image=args.image, cell_size=args.cell_size)
+    logging.info(f"Wrote a {args.cols}x{args.rows} maze to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,44 @@
 # import necessary modules
 import unittest
+import sys
+from functools import partial
 import time
 import logging
 from maze import Maze
 from cell import Cell
+from grid import Grid, LEFT, RIGHT, TOP, BOTTOM, ALL_WALLS
+from animation import FrameScheduler
+from standins import StandInRoot, StandInCanvas
 
 # configure logging
 logging.basicConfig(level=logging.INFO)
 
+# helper to encode the walls of a maze as one hex digit per cell (row by row)
+def wall_signature(maze, num_cols, num_rows):
+    signature = ""
+    for row in range(num_rows):
+        for col in range(num_cols):
+            cell = maze._Maze__cells[col][row]
+            signature += "%x" % (cell.has_left_wall | cell.has_right_wall << 1 | cell.has_top_wall << 2 | cell.has_bottom_wall << 3)
+    return signature
+
+# helper to check a grid is a perfect maze, a spanning tree with exactly one path between cells
+def is_perfect(grid):
+    # count the internal openings, a spanning tree has one less than the cell count
+    openings = sum(len(grid.open_neighbours(index)) for index in range(grid.num_cells)) // 2
+    if openings != grid.num_cells - 1:
+        return False
+
+    # check every cell is reachable from the first one
+    seen = {0}
+    stack = [0]
+    while stack:
+        for next_index in grid.open_neighbours(stack.pop()):
+            if next_index not in seen:
+                seen.add(next_index)
+                stack.append(next_index)
+    return len(seen) == grid.num_cells
+
 # define the test case for the Maze class
 class TestMaze(unittest.TestCase):
     # test maze creation
@@ -99,6 +130,1021 @@ class TestMaze(unittest.TestCase):
         self.assertIsInstance(elapsed_time, float)
         self.assertGreater(elapsed_time, 0)
 
+    # test generation matches the layouts produced by the original recursive generator
+    def test_generation_matches_recursive_layout(self):
+        # create seeded mazes of different shapes
+        maze = Maze(0, 0, 4, 6, 10, 10, seed=42)
+        self.assertEqual(wall_signature(maze, 6, 4), "9c65c65ca16b9c6b96dc8cc2")
+        maze = Maze(0, 0, 7, 5, 10, 10, seed=7)
+        self.assertEqual(wall_signature(maze, 5, 7), "35cc69a5ca75ad639cc235cca1ad469cca3")
+
+    # test generation of a maze larger than the recursion limit
+    def test_generation_beyond_recursion_limit(self):
+        # create a maze with more cells than the recursion limit allows frames
+        size = int(sys.getrecursionlimit() ** 0.5) * 2
+        maze = Maze(0, 0, size, size, 1, 1, seed=0)
+
+        # count the opened internal walls, a perfect maze has one less than the cell count
+        opened = 0
+        for col in range(size):
+            for row in range(size):
+                opened += not maze._Maze__cells[col][row].has_right_wall and col < size - 1
+                opened += not maze._Maze__cells[col][row].has_bottom_wall and row < size - 1
+        self.assertEqual(opened, size * size - 1)
+
+    # test every solver returns the same path on a perfect maze
+    def test_solver_algorithms(self):
+        # create a maze instance
+        maze = Maze(0, 0, 12, 15, 10, 10, seed=3)
+
+        # solve with the default DFS and check the path endpoints
+        expected = maze.search()
+        self.assertEqual(expected.path[0], (0, 0))
+        self.assertEqual(expected.path[-1], (14, 11))
+
+        # a perfect maze has a single path, so every solver must agree
+        for algorithm in ("dfs", "bfs", "astar", "bidirectional"):
+            result = maze.search(algorithm)
+            self.assertEqual(result.path, expected.path)
+            self.assertGreaterEqual(result.nodes_expanded, len(result.path))
+            self.assertGreater(result.peak_frontier, 0)
+            self.assertGreaterEqual(result.elapsed_time, 0)
+            self.assertTrue(maze.solve(algorithm))
+
+        # check unknown algorithms are rejected
+        with self.assertRaises(ValueError):
+            maze.search("teleport")
+
+    # test solving a maze whose path is longer than the recursion limit
+    def test_solving_beyond_recursion_limit(self):
+        # create a maze with more cells than the recursion limit allows frames
+        size = int(sys.getrecursionlimit() ** 0.5) * 2
+        maze = Maze(0, 0, size, size, 1, 1, seed=0)
+
+        # check each step of the path moves to an adjacent cell
+        result = maze.search("dfs")
+        for (col, row), (next_col, next_row) in zip(result.path, result.path[1:]):
+            self.assertEqual(abs(col - next_col) + abs(row - next_row), 1)
+        self.assertEqual(result.path[-1], (size - 1, size - 1))
+
+    # test the packed grid keeps both sides of a wall in step
+    def test_grid_walls(self):
+        # create a grid with every wall in place
+        grid = Grid(3, 2)
+        self.assertEqual(grid.walls, bytearray([ALL_WALLS]) * 6)
+
+        # remove and restore the wall between two cells
+        grid.remove_wall(1, 0, BOTTOM)
+        self.assertFalse(grid.has_wall(1, 0, BOTTOM))
+        self.assertFalse(grid.has_wall(1, 1, TOP))
+        self.assertEqual(grid.open_neighbours(grid.index(1, 0)), [grid.index(1, 1)])
+        grid.add_wall(1, 1, TOP)
+        self.assertTrue(grid.has_wall(1, 0, BOTTOM))
+
+        # removing an outer wall does not wrap around to another row
+        grid.remove_wall(2, 0, RIGHT)
+        self.assertTrue(grid.has_wall(0, 1, LEFT))
+        self.assertEqual(grid.open_neighbours(grid.index(2, 0)), [])
+        self.assertEqual(grid.position(grid.index(2, 1)), (2, 1))
+
+    # test the cell views read and write the packed grid
+    def test_cell_views_share_grid(self):
+        # create a maze instance
+        maze = Maze(0, 0, 3, 4, 20, 20, seed=1)
+        grid = maze._Maze__grid
+
+        # writes through a view land in the grid
+        cell = maze._Maze__cells[2][1]
+        cell.has_left_wall = True
+        self.assertTrue(grid.has_wall(2, 1, LEFT))
+        cell.visited = True
+        self.assertEqual(grid.visited[grid.index(2, 1)], 1)
+
+        # a fresh view of the same cell sees the change
+        self.assertTrue(maze._Maze__cells[2][1].visited)
+        self.assertEqual(len(maze._Maze__cells), 4)
+        self.assertEqual(len(maze._Maze__cells[-1]), 3)
+
+    # test every generator builds a seeded perfect maze that the solver accepts
+    def test_generator_algorithms(self):
+        for generator in ("backtracker", "binary_tree", "sidewinder", "ellers", "kruskal", "wilsons"):
+            # create two mazes with the same seed and one with a different seed
+            maze = Maze(0, 0, 9, 13, 10, 10, seed=5, generator=generator)
+            same = Maze(0, 0, 9, 13, 10, 10, seed=5, generator=generator)
+            other = Maze(0, 0, 9, 13, 10, 10, seed=6, generator=generator)
+
+            # check the layout is perfect and reproducible
+            self.assertTrue(is_perfect(maze._Maze__grid), generator)
+            self.assertEqual(maze._Maze__grid.walls, same._Maze__grid.walls)
+            self.assertNotEqual(maze._Maze__grid.walls, other._Maze__grid.walls)
+            self.assertTrue(maze.solve())
+
+            # check one-column and one-row grids, where the cell below is also the next index
+            for num_rows, num_cols in ((6, 1), (1, 6), (1, 1)):
+                thin = Maze(0, 0, num_rows, num_cols, 1, 1, seed=1, generator=generator)
+                self.assertTrue(is_perfect(thin._Maze__grid), (generator, num_cols, num_rows))
+                self.assertTrue(thin.solve())
+
+        # check unknown generators are rejected
+        with self.assertRaises(ValueError):
+            Maze(0, 0, 2, 2, 10, 10, generator="teleport")
+
+    # test bulk drawing chains the walls into a few polylines and reuses canvas items
+    def test_bulk_grid_drawing(self):
+        from graphics import Window
+
+        # a grid with every wall in place is one connected group of walls, so one polyline
+        canvas = StandInCanvas()
+        window = Window(200, 150, StandInRoot(), canvas)
+        window.draw_grid(Grid(4, 3), 0, 0, 10, 10)
+        self.assertEqual(len(canvas.items), 1)
+
+        # draw a generated maze, whose walls the path from entrance to exit splits into two groups, one either side
+        canvas = StandInCanvas()
+        window = Window(200, 150, StandInRoot(), canvas)
+        maze = Maze(0, 0, 6, 8, 10, 10, window, seed=2, animate_speed=0)
+        maze.draw()
+        created = canvas.created
+        grid = maze._Maze__grid
+        self.assertEqual(len(window._Window__grid_items), 2)
+
+        # check every wall in the grid is covered by a polyline and no open wall is
+        segments = set()
+        for item in window._Window__grid_items:
+            coords = canvas.items[item][0]
+            points = list(zip(coords[::2], coords[1::2]))
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                for x in range(int(min(x1, x2)), int(max(x1, x2)), 10):
+                    segments.add((x, y1, x + 10, y2))
+                for y in range(int(min(y1, y2)), int(max(y1, y2)), 10):
+                    segments.add((x1, y, x2, y + 10))
+        for col in range(8):
+            for row in range(6):
+                self.assertEqual((col * 10, row * 10, col * 10 + 10, row * 10) in segments, grid.has_wall(col, row, TOP))
+                self.assertEqual((col * 10, row * 10, col * 10, row * 10 + 10) in segments, grid.has_wall(col, row, LEFT))
+
+        # drawing again reuses the same canvas items
+        maze.draw()
+        self.assertEqual(canvas.created, created)
+
+    # test the scheduler plays back steps at the frame rate
+    def test_frame_scheduler_pacing(self):
+        from graphics import Window
+
+        # queue six steps that take two frames each at 10 frames per second
+        root = StandInRoot()
+        scheduler = FrameScheduler(Window(200, 150, root, StandInCanvas()), fps=10)
+        played = []
+        for step in range(6):
+            scheduler.schedule(partial(played.append, step))
+            scheduler.end_step(0.2)
+
+        # one callback is queued no matter how many steps are added
+        self.assertEqual(len(root.callbacks), 1)
+        root.run_callbacks()
+        self.assertEqual(played, [])
+        root.run_callbacks()
+        self.assertEqual(played, [0])
+
+        # flushing plays back the rest at once and stops the frame callbacks
+        scheduler.flush()
+        self.assertEqual(played, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(scheduler.pending, 0)
+        root.run_callbacks()
+        self.assertEqual(root.callbacks, [])
+
+    # test the time budget coalesces steps so the backlog finishes on time
+    def test_frame_scheduler_time_budget(self):
+        from graphics import Window
+
+        # queue a backlog that would take 100 seconds without a budget
+        root = StandInRoot()
+        scheduler = FrameScheduler(Window(200, 150, root, StandInCanvas()), fps=60, time_budget=0)
+        played = []
+        for step in range(1000):
+            scheduler.schedule(partial(played.append, step))
+            scheduler.end_step(0.1)
+
+        # an exhausted budget plays back everything in the next frame
+        root.run_callbacks()
+        self.assertEqual(len(played), 1000)
+        self.assertEqual(root.callbacks, [])
+
+    # test animating a maze queues its drawing instead of blocking
+    def test_maze_animation_is_queued(self):
+        from graphics import Window
+
+        # create a maze with a long animation delay, construction must still return at once
+        root = StandInRoot()
+        canvas = StandInCanvas()
+        window = Window(200, 150, root, canvas)
+        start_time = time.time()
+        maze = Maze(0, 0, 5, 5, 20, 20, window, seed=0, animate_speed=10)
+        self.assertLess(time.time() - start_time, 5)
+        created = canvas.created
+        self.assertTrue(maze._Maze__scheduler.pending)
+
+        # solving queues its moves too, and flushing draws everything
+        maze.solve()
+        self.assertEqual(canvas.created, created)
+        maze.flush_animation()
+        self.assertGreater(canvas.created, created)
+        self.assertIn("red", [options["fill"] for coords, options in canvas.items.values()])
+
+    # test redrawing cells and moves reuses canvas items, keeping their count bounded by the cells
+    def test_canvas_item_reuse(self):
+        from graphics import Window
+
+        canvas = StandInCanvas()
+        window = Window(200, 150, StandInRoot(), canvas)
+        maze = Maze(0, 0, 10, 12, 10, 10, window, seed=5)
+        maze.solve()
+        maze.flush_animation()
+
+        # each wall and each move between neighbouring cells has at most one item, plus the bulk wall runs
+        walls = 2 * 10 * 12 + 10 + 12
+        moves = 2 * 10 * 12
+        self.assertEqual(len(canvas.items), window.item_count)
+        self.assertLessEqual(window.item_count, 2 * walls + moves)
+
+        # solving again only recolours the items that changed, creating none
+        created = canvas.created
+        maze.solve()
+        maze.flush_animation()
+        self.assertEqual(canvas.created, created)
+
+        # a move recoloured grey by a backtrack is raised above the items drawn after it
+        from graphics import Line, Point
+        window.draw_line(Line(Point(1, 1), Point(5, 1)), "red")
+        window.draw_line(Line(Point(3, 0), Point(3, 2)))
+        window.draw_line(Line(Point(5, 1), Point(1, 1)), "grey")
+        self.assertEqual(canvas.created, created + 2)
+        self.assertEqual(list(canvas.items.values())[-1], [(1, 1, 5, 1), {"fill": "grey", "width": 2}])
+
+    # test solving in a background thread and playing the recorded events back at any speed
+    def test_background_solve_playback(self):
+        from unittest import mock
+        from graphics import Window
+        from observers import ProfileCollector, StatsCollector
+
+        # a tiny queue makes the worker wait for the UI thread to drain it
+        root = StandInRoot()
+        canvas = StandInCanvas()
+        stats = StatsCollector()
+        maze = Maze(0, 0, 8, 10, 10, 10, Window(200, 150, root, canvas), seed=1, observers=[stats], animate_speed=0)
+        playback = maze.solve_in_background("dfs", queue_size=2)
+        for _ in range(10000):
+            if playback.finished:
+                break
+            root.run_callbacks()
+            time.sleep(0.0005)
+        self.assertTrue(playback.finished)
+        expected = Maze(0, 0, 8, 10, 10, 10, seed=1).search("dfs")
+        self.assertEqual(playback.result.path, expected.path)
+        self.assertEqual(stats.as_dict()["counters"]["solve.cell_visited"], expected.nodes_expanded)
+        colours = [options["fill"] for coords, options in canvas.items.values()]
+        self.assertIn("red", colours)
+        self.assertIn("grey", colours)
+
+        # replaying draws from the recording without searching again, and stops the frame callbacks at the end
+        playback.replay()
+        self.assertEqual(playback.position, 0)
+        while root.run_callbacks():
+            pass
+        self.assertTrue(playback.finished)
+        self.assertEqual(playback.position, len(playback.events))
+        self.assertEqual(stats.as_dict()["counters"]["solve.cell_visited"], expected.nodes_expanded)
+
+        # the solve phase ends with the search and the playback phase once every event is drawn
+        self.assertIn("solve", stats.timings)
+        self.assertIn("playback", stats.timings)
+        self.assertEqual(stats._StatsCollector__started, {})
+
+        # skipping to the end plays everything at once, even without a window, and the profiler follows the worker thread
+        profile = ProfileCollector(phases=("solve",))
+        headless = Maze(0, 0, 8, 10, 10, 10, seed=1, observers=[profile]).solve_in_background("bfs")
+        headless.skip_to_end()
+        self.assertTrue(headless.finished)
+        self.assertEqual(headless.result.path, expected.path)
+        self.assertIn("solve_bfs", profile.report())
+
+        # a failing search still closes both phases before its error reaches the frame callback
+        def broken(*args, **hooks):
+            raise RuntimeError("solver failed")
+        stats = StatsCollector()
+        root = StandInRoot()
+        with mock.patch.dict("playback.SOLVERS", broken=broken):
+            failing = Maze(0, 0, 4, 4, 10, 10, Window(200, 150, root, StandInCanvas()), seed=1, observers=[stats]).solve_in_background("broken")
+        failing._Playback__worker.join(2)
+        with self.assertRaisesRegex(RuntimeError, "solver failed"):
+            while root.run_callbacks():
+                pass
+        self.assertTrue(failing.finished)
+        self.assertEqual(stats._StatsCollector__started, {})
+
+        # cancelling a worker stuck on a full queue ends its thread quietly, even when only the result is left to queue
+        import threading
+        from playback import Playback, SolveWorker
+        grid = Maze(0, 0, 3, 3, 1, 1, seed=1).grid
+        counter = SolveWorker(grid, "bfs", 0, 8)
+        counter.start()
+        counter.join()
+        num_events = counter.events.qsize() - 1
+        errors = []
+        hook, threading.excepthook = threading.excepthook, errors.append
+        try:
+            worker = SolveWorker(grid, "bfs", 0, 8, queue_size=num_events)
+            finished = []
+            playback = Playback(worker, lambda event, replayed: None, on_finish=lambda: finished.append(True))
+            playback.start()
+            while worker.events.qsize() < num_events:
+                time.sleep(0.001)
+            playback.cancel()
+            worker.join(2)
+        finally:
+            threading.excepthook = hook
+        self.assertEqual(errors, [])
+        self.assertTrue(playback.finished)
+        self.assertEqual(finished, [True])
+
+    # test entrances and exits on any boundary cell, and searching for several goals in one pass
+    def test_entrance_exit_and_multi_goal(self):
+        # the outer wall broken depends on the side of the maze the cell is on
+        maze = Maze(0, 0, 7, 9, 10, 10, seed=8, entrance=(0, 3), exit=(4, 0))
+        self.assertFalse(maze.grid.has_wall(0, 3, LEFT))
+        self.assertFalse(maze.grid.has_wall(4, 0, TOP))
+        self.assertTrue(maze.grid.has_wall(0, 0, TOP))
+        self.assertTrue(maze.grid.has_wall(8, 6, BOTTOM))
+        self.assertEqual((maze.entrance, maze.exit), ((0, 3), (4, 0)))
+
+        # every search runs between the configured cells
+        path = maze.search("bfs").path
+        self.assertEqual((path[0], path[-1]), ((0, 3), (4, 0)))
+        self.assertEqual(maze.search("astar").path, path)
+        self.assertEqual(maze.solution().path, path)
+
+        # cells inside the maze cannot be an entrance or exit
+        with self.assertRaises(ValueError):
+            Maze(0, 0, 7, 9, 10, 10, entrance=(3, 3))
+        with self.assertRaises(ValueError):
+            Maze(0, 0, 7, 9, 10, 10, exit=(9, 6))
+
+        # one search finds the nearest goal, expanding fewer cells than the full search for all goals
+        goals = [(8, 6), (2, 5), (7, 1), (5, 3)]
+        distances = maze.distance_field().distances
+        nearest = min(goals, key=lambda goal: distances[maze.grid.index(*goal)])
+        first = maze.search_goals(goals)
+        self.assertEqual(len(first), 1)
+        self.assertEqual(first[0].path[-1], nearest)
+        self.assertEqual(len(first[0].path) - 1, distances[maze.grid.index(*nearest)])
+
+        # asking for all goals returns one shortest path each, nearest first
+        every = maze.search_goals(goals, find_all=True)
+        self.assertEqual([result.path[-1] for result in every], sorted(goals, key=lambda goal: distances[maze.grid.index(*goal)]))
+        self.assertEqual(every[0].path, first[0].path)
+        self.assertLessEqual(first[0].nodes_expanded, every[-1].nodes_expanded)
+
+        # goals outside the maze are rejected like any other position
+        with self.assertRaises(ValueError):
+            maze.search_goals([(2, 5), (9, 0)])
+
+    # test braiding adds loops and the bucket queue solvers find the cheapest path over cell weights
+    def test_braided_weighted_solving(self):
+        import heapq
+        import random
+        from generators import random_weights
+        from solvers import path_cost
+
+        # helper to count the dead ends of a grid
+        def dead_ends(grid):
+            return sum(len(grid.open_neighbours(index)) == 1 for index in range(grid.num_cells))
+
+        # removing a fraction of the dead ends leaves roughly the rest, and every cell stays reachable
+        perfect = Maze(0, 0, 15, 20, 10, 10, seed=4)
+        braided = Maze(0, 0, 15, 20, 10, 10, seed=4, braid=0.5)
+        self.assertTrue(is_perfect(perfect.grid))
+        self.assertFalse(is_perfect(braided.grid))
+        self.assertLess(dead_ends(braided.grid), dead_ends(perfect.grid) * 0.6)
+        self.assertEqual(braided.distance_field().reached, 300)
+        self.assertEqual(dead_ends(Maze(0, 0, 15, 20, 10, 10, seed=4, braid=1).grid), 0)
+
+        # with unit costs both solvers agree with breadth-first search
+        self.assertEqual(braided.search("dijkstra").cost, len(braided.search("bfs").path) - 1)
+
+        # with random weights both find a path as cheap as a plain heap-based Dijkstra
+        weights = random_weights(300, random.Random(2), 9)
+        self.assertTrue(set(weights) <= set(range(1, 10)))
+        braided.set_weights(weights)
+        grid = braided.grid
+        best = {0: 0}
+        frontier = [(0, 0)]
+        while frontier:
+            cost, cell = heapq.heappop(frontier)
+            for next_cell in grid.open_neighbours(cell):
+                if cost + weights[next_cell] < best.get(next_cell, cost + weights[next_cell] + 1):
+                    best[next_cell] = cost + weights[next_cell]
+                    heapq.heappush(frontier, (best[next_cell], next_cell))
+        for algorithm in ("dijkstra", "weighted_astar"):
+            result = braided.search(algorithm)
+            self.assertEqual(result.cost, best[299])
+            self.assertEqual(path_cost(grid, result.path), result.cost)
+            self.assertEqual((result.path[0], result.path[-1]), ((0, 0), (19, 14)))
+
+        # weights must be one byte per cell and never zero
+        with self.assertRaises(ValueError):
+            braided.set_weights(bytes(300))
+        with self.assertRaises(ValueError):
+            braided.set_weights(weights[:10])
+
+    # test the analytics pass against per-cell counts and an all-pairs search
+    def test_maze_analysis(self):
+        import io
+        import json
+        import os
+        import tempfile
+        from batch import run_batch
+        from fields import DistanceField
+
+        maze = Maze(0, 0, 9, 11, 10, 10, seed=12, entrance=(0, 4))
+        grid = maze.grid
+        analysis = maze.analyze()
+
+        # the bulk counts match counting the open neighbours of each cell
+        degrees = [len(grid.open_neighbours(index)) for index in range(grid.num_cells)]
+        self.assertEqual(analysis.dead_ends, degrees.count(1))
+        self.assertEqual(analysis.corridors, degrees.count(2))
+        self.assertEqual(analysis.junctions, degrees.count(3) + degrees.count(4))
+        self.assertTrue(analysis.is_perfect)
+
+        # the solution and diameter match searching from the entrance and from every cell
+        path = maze.search("bfs").path
+        self.assertEqual(analysis.solution_length, len(path) - 1)
+        self.assertAlmostEqual(analysis.tortuosity, (len(path) - 1) / (10 + 4))
+        self.assertEqual(analysis.diameter, max(max(DistanceField(grid, index).distances) for index in range(grid.num_cells)))
+
+        # a loaded maze gives the same metrics
+        with tempfile.TemporaryDirectory() as directory:
+            maze.save(os.path.join(directory, "maze.bin"))
+            loaded = Maze.load(os.path.join(directory, "maze.bin"))
+            self.assertEqual(loaded.entrance, (0, 4))
+            self.assertEqual(loaded.analyze().as_dict(), analysis.as_dict())
+
+        # braiding adds edges and removes dead ends
+        braided = Maze(0, 0, 9, 11, 10, 10, seed=12, braid=1).analyze()
+        self.assertFalse(braided.is_perfect)
+        self.assertEqual(braided.dead_ends, 0)
+        self.assertGreater(braided.edges, analysis.edges)
+
+        # the batch mode scores mazes instead of solving them
+        output = io.StringIO()
+        run_batch(output, 3, 8, 6, base_seed=1, workers=1, analyze=True)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all(record["is_perfect"] and record["diameter"] >= record["solution_length"] for record in records))
+
+    # test the union-find and the spanning tree generators built on it
+    def test_spanning_tree_generators(self):
+        import random
+        from disjoint_set import DisjointSet
+        from generators import generate_kruskal, generate_wilsons
+
+        # unions merge sets once and finds agree on the root
+        regions = DisjointSet(6)
+        self.assertTrue(regions.union(0, 1))
+        self.assertTrue(regions.union(2, 3))
+        self.assertTrue(regions.union(1, 3))
+        self.assertFalse(regions.union(0, 2))
+        self.assertEqual(regions.count, 3)
+        self.assertEqual(regions.find(0), regions.find(3))
+        self.assertNotEqual(regions.find(0), regions.find(4))
+
+        # both give perfect mazes on thin and square grids, carving one wall per tree edge
+        for generate in (generate_kruskal, generate_wilsons):
+            for num_cols, num_rows in ((1, 1), (1, 7), (7, 1), (12, 9)):
+                grid = Grid(num_cols, num_rows)
+                carved = []
+                generate(grid, random.Random(3), 0, lambda index, next_index: carved.append((index, next_index)))
+                self.assertTrue(is_perfect(grid), (generate.__name__, num_cols, num_rows))
+                self.assertEqual(len(carved), grid.num_cells - 1)
+
+        # dead ends are far more common than in the backtracker's long corridors
+        backtracker = Maze(0, 0, 30, 30, 10, 10, seed=4).analyze()
+        for generator in ("kruskal", "wilsons"):
+            analysis = Maze(0, 0, 30, 30, 10, 10, seed=4, generator=generator).analyze()
+            self.assertGreater(analysis.dead_ends, backtracker.dead_ends * 2)
+
+    # test tiled generation in shared memory stitches the tiles into one perfect maze
+    def test_tiled_generation(self):
+        from generators import GENERATORS
+        from tiled import generate_tiled, tile_bounds
+
+        # tiles cover the grid, with smaller tiles along the right and bottom edges
+        self.assertEqual(tile_bounds(5, 3, 2), [(0, 0, 2, 2), (2, 0, 2, 2), (4, 0, 1, 2), (0, 2, 2, 1), (2, 2, 2, 1), (4, 2, 1, 1)])
+
+        # the maze is perfect and the same for any number of workers
+        grid = generate_tiled(23, 17, seed=8, workers=1, tile_size=5)
+        self.assertTrue(is_perfect(grid))
+        self.assertEqual(generate_tiled(23, 17, seed=8, workers=2, tile_size=5).walls, grid.walls)
+        self.assertNotEqual(generate_tiled(23, 17, seed=9, workers=1, tile_size=5).walls, grid.walls)
+
+        # every generator stitches, including one-column and one-row tiles along the edges
+        for generator in GENERATORS:
+            for num_cols, num_rows in ((9, 9), (1, 9), (9, 1)):
+                tiled = generate_tiled(num_cols, num_rows, seed=1, workers=1, tile_size=4, generator=generator)
+                self.assertTrue(is_perfect(tiled), (generator, num_cols, num_rows))
+
+        # the solver accepts it, entering at the top-left and leaving at the bottom-right
+        maze = Maze(0, 0, 17, 23, 1, 1, grid=grid)
+        self.assertFalse(grid.walls[0] & TOP)
+        self.assertFalse(grid.walls[-1] & BOTTOM)
+        self.assertTrue(maze.solve())
+        with self.assertRaises(ValueError):
+            generate_tiled(4, 4, generator="teleport")
+
+        # a custom entrance and exit open the same outer walls as a Maze does
+        custom = generate_tiled(23, 17, seed=8, workers=1, tile_size=5, entrance=(0, 3), exit=(22, 0))
+        expected = bytearray(grid.walls)
+        expected[0] |= TOP
+        expected[-1] |= BOTTOM
+        expected[3 * 23] &= ~LEFT
+        expected[22] &= ~RIGHT
+        self.assertEqual(custom.walls, expected)
+        self.assertTrue(Maze(0, 0, 17, 23, 1, 1, grid=custom, entrance=(0, 3), exit=(22, 0)).solve())
+        with self.assertRaises(ValueError):
+            generate_tiled(23, 17, seed=8, entrance=(5, 5))
+
+    # test importing the maze module and building a headless maze never touches tkinter
+    def test_headless_startup(self):
+        from benchmark import benchmark_startup
+
+        # build a small maze in a fresh interpreter without a display
+        import_time, maze_time, tkinter_loaded = benchmark_startup(repeats=1)
+        self.assertFalse(tkinter_loaded)
+        self.assertLess(maze_time, 0.5)
+
+    # test the batch mode streams reproducible results from a process pool
+    def test_batch_generation(self):
+        import io
+        import json
+        from batch import derive_seed, run_batch
+
+        # derived seeds are distinct and stable
+        self.assertEqual(derive_seed(0, 3), derive_seed(0, 3))
+        self.assertEqual(len({derive_seed(0, index) for index in range(100)}), 100)
+
+        # run the same batch serially and across two workers
+        serial = io.StringIO()
+        parallel = io.StringIO()
+        run_batch(serial, 6, 7, 5, base_seed=9, workers=1)
+        run_batch(parallel, 6, 7, 5, base_seed=9, workers=2)
+
+        # the records match apart from the timings
+        def strip_timings(output):
+            records = [json.loads(line) for line in output.getvalue().splitlines()]
+            for record in records:
+                del record["generate_time"], record["solve_time"]
+            return records
+        records = strip_timings(serial)
+        self.assertEqual(records, strip_timings(parallel))
+        self.assertEqual([record["index"] for record in records], list(range(6)))
+        self.assertTrue(all(record["path_length"] > 0 for record in records))
+
+    # test mazes built in parallel threads match mazes built serially
+    def test_thread_safe_generation(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # helper to build the walls of one seeded maze
+        def build(seed):
+            generator = ("backtracker", "binary_tree", "sidewinder", "ellers")[seed % 4]
+            return bytes(Maze(0, 0, 20, 20, 1, 1, seed=seed, generator=generator)._Maze__grid.walls)
+
+        # build the same seeds serially and across threads
+        seeds = list(range(40))
+        serial = [build(seed) for seed in seeds]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parallel = list(executor.map(build, seeds))
+        self.assertEqual(serial, parallel)
+
+    # test seeding a maze leaves the global random module alone
+    def test_private_rng(self):
+        import random
+
+        # draw from the global random module with and without building a maze in between
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        Maze(0, 0, 5, 5, 1, 1, seed=5)
+        self.assertEqual(random.random(), expected)
+
+        # an injected random source gives the same maze as the matching seed
+        maze = Maze(0, 0, 5, 5, 1, 1, rng=random.Random(5))
+        self.assertEqual(maze._Maze__grid.walls, Maze(0, 0, 5, 5, 1, 1, seed=5)._Maze__grid.walls)
+
+    # test NumPy-style generators are adapted to the generator interface
+    def test_numpy_style_rng(self):
+        import random
+
+        # stand-in exposing the two numpy.random.Generator methods the adapter uses
+        class FakeGenerator:
+            def __init__(self, seed):
+                self.random = random.Random(seed)
+
+            def integers(self, stop):
+                return self.random.randrange(stop)
+
+            def bytes(self, length):
+                return self.random.randbytes(length)
+
+        # every generator builds a perfect, reproducible maze from it
+        for generator in ("backtracker", "binary_tree", "sidewinder", "ellers", "kruskal", "wilsons"):
+            maze = Maze(0, 0, 8, 9, 1, 1, generator=generator, rng=FakeGenerator(3))
+            same = Maze(0, 0, 8, 9, 1, 1, generator=generator, rng=FakeGenerator(3))
+            self.assertTrue(is_perfect(maze._Maze__grid))
+            self.assertEqual(maze._Maze__grid.walls, same._Maze__grid.walls)
+
+    # test saving and loading a maze keeps its walls and solution
+    def test_save_and_load(self):
+        import os
+        import struct
+        import tempfile
+        from storage import HEADER, MazeFileWriter
+
+        with tempfile.TemporaryDirectory() as directory:
+            # an odd number of cells leaves the last byte half used
+            path = os.path.join(directory, "maze.bin")
+            maze = Maze(0, 0, 7, 9, 10, 10, seed=4)
+            maze.save(path)
+            self.assertEqual(os.path.getsize(path), 32 + (7 * 9 + 1) // 2)
+
+            # the loaded maze has the same walls and the same solution
+            loaded = Maze.load(path)
+            self.assertEqual(bytes(loaded._Maze__grid.walls[:]), bytes(maze._Maze__grid.walls))
+            self.assertEqual(loaded.search("bfs").path, maze.search("bfs").path)
+
+            # edits to the loaded maze stay in memory and never reach the file
+            loaded._Maze__grid.walls[0] = ALL_WALLS
+            self.assertEqual(loaded._Maze__grid.walls[0], ALL_WALLS)
+            self.assertNotEqual(maze._Maze__grid.walls[0], ALL_WALLS)
+            self.assertEqual(bytes(Maze.load(path)._Maze__grid.walls[:]), bytes(maze._Maze__grid.walls))
+
+            # a custom entrance and exit are saved with the walls, and asking for others is rejected
+            custom = Maze(0, 0, 4, 6, 10, 10, seed=4, entrance=(0, 3), exit=(5, 2))
+            custom.save(path)
+            loaded = Maze.load(path)
+            self.assertEqual((loaded.entrance, loaded.exit), ((0, 3), (5, 2)))
+            self.assertEqual(loaded.search("bfs").path, custom.search("bfs").path)
+            self.assertEqual(Maze.load(path, entrance=(0, 3)).exit, (5, 2))
+            self.assertEqual(Maze.load(path, exit=None).exit, (5, 2))
+            with self.assertRaises(ValueError):
+                Maze.load(path, entrance=(0, 0))
+
+            # the header holds the exit of a grid with more than 2^32 cells
+            huge = os.path.join(directory, "huge.bin")
+            with self.assertRaisesRegex(ValueError, "cells missing"):
+                MazeFileWriter(huge, 100000, 1000000).close()
+            with open(huge, "rb") as file:
+                self.assertEqual(HEADER.unpack(file.read())[2:], (100000, 1000000, 0, 100000 * 1000000 - 1))
+
+            # files from before the entrance and exit were saved open the corners
+            with open(path, "wb") as file:
+                file.write(struct.pack("<4sB3xII", b"MAZE", 1, 9, 7))
+                file.write(bytes(maze._Maze__grid.walls[:]))
+            self.assertEqual((Maze.load(path).entrance, Maze.load(path).exit), ((0, 0), (8, 6)))
+
+            # files that are not mazes are rejected
+            with open(path, "wb") as file:
+                file.write(b"not a maze file at all")
+            with self.assertRaises(ValueError):
+                Maze.load(path)
+
+    # test the benchmark suite reports every benchmark in a comparable form
+    def test_benchmark_suite(self):
+        from benchmark import compare_suites, percentile, run_suite
+
+        # percentiles pick the nearest measurement
+        self.assertEqual(percentile([3, 1, 2], 0.5), 2)
+        self.assertEqual(percentile([3, 1, 2], 0.99), 3)
+
+        # a tiny suite covers generation, every solver and rendering
+        results = run_suite([(5, 5)], repeats=2)
+        names = {(result["benchmark"], result["variant"]) for result in results}
+        self.assertIn(("generate", "backtracker"), names)
+        self.assertIn(("solve", "bidirectional"), names)
+        self.assertIn(("render", "draw_grid"), names)
+        self.assertTrue(all(result["peak_memory"] > 0 for result in results))
+
+        # a suite compared against itself shows no change
+        suite = {"results": results}
+        self.assertTrue(all(ratio == 1 for _, _, _, ratio in compare_suites(suite, suite)))
+
+    # test observers see every generation and solve event
+    def test_observers(self):
+        from observers import ProfileCollector, StatsCollector
+
+        # attach the collectors before generation
+        stats = StatsCollector()
+        profile = ProfileCollector()
+        maze = Maze(0, 0, 6, 7, 10, 10, seed=8, observers=[stats, profile])
+
+        # the backtracker visits and leaves every cell once and breaks one wall per extra cell
+        self.assertEqual(stats.counters["generate", "cell_visited"], 42)
+        self.assertEqual(stats.counters["generate", "wall_broken"], 41)
+        self.assertEqual(stats.counters["generate", "backtrack"], 42)
+        self.assertIn("generate", stats.timings)
+
+        # solving reports the same counts as the result it returns
+        result = maze.search("dfs")
+        self.assertEqual(stats.counters["solve", "cell_visited"], result.nodes_expanded)
+        self.assertEqual(stats.peak_frontier["solve"], result.peak_frontier)
+        self.assertIn("solve", stats.as_dict()["timings"])
+        self.assertIn("solve_dfs", profile.report())
+
+        # a detached observer hears nothing more
+        maze.remove_observer(stats)
+        maze.search("bfs")
+        self.assertEqual(stats.counters["solve", "cell_visited"], result.nodes_expanded)
+
+    # test wall edits repair the cached solution to match a fresh search
+    def test_incremental_wall_edits(self):
+        import random
+
+        # create a maze and cache its solution
+        maze = Maze(0, 0, 15, 15, 10, 10, seed=2)
+        first = maze.solution()
+        self.assertEqual(first.path, maze.search("bfs").path)
+
+        # apply random edits, checking each repaired path against BFS
+        rng = random.Random(0)
+        for _ in range(60):
+            col, row = rng.randrange(15), rng.randrange(15)
+            direction = rng.choice(["left", "right", "top", "bottom"])
+            if rng.random() < 0.5:
+                maze.open_wall(col, row, direction)
+            else:
+                maze.close_wall(col, row, direction)
+            repaired = maze.solution()
+            self.assertEqual(len(repaired.path), len(maze.search("bfs").path))
+            for (col, row), (next_col, next_row) in zip(repaired.path, repaired.path[1:]):
+                self.assertEqual(abs(col - next_col) + abs(row - next_row), 1)
+
+        # a repair with no edits expands nothing
+        self.assertEqual(maze.solution().nodes_expanded, 0)
+
+        # bad directions and cells outside the maze are rejected
+        with self.assertRaises(ValueError):
+            maze.open_wall(0, 0, "up")
+        with self.assertRaises(ValueError):
+            maze.close_wall(-1, 0, "left")
+
+    # test path queries between any two cells, on perfect and braided mazes
+    def test_path_queries(self):
+        import random
+
+        # helper to check a path is a chain of adjacent cells between two points
+        def check_path(path, a, b):
+            self.assertEqual((path[0], path[-1]), (a, b))
+            for (col, row), (next_col, next_row) in zip(path, path[1:]):
+                self.assertEqual(abs(col - next_col) + abs(row - next_row), 1)
+
+        # queries on a perfect maze agree with the distance field of their start
+        maze = Maze(0, 0, 12, 14, 10, 10, seed=6)
+        rng = random.Random(1)
+        for _ in range(30):
+            a = (rng.randrange(14), rng.randrange(12))
+            b = (rng.randrange(14), rng.randrange(12))
+            path = maze.path(a, b)
+            check_path(path, a, b)
+            self.assertEqual(len(path) - 1, maze.distance_field(a).distances[b[1] * 14 + b[0]])
+        self.assertEqual(maze.path((0, 0), (13, 11)), maze.search("bfs").path)
+
+        # opening walls adds loops, so queries fall back to per-source fields
+        for col in range(13):
+            maze.open_wall(col, 5, "right")
+        for _ in range(10):
+            a = (rng.randrange(14), rng.randrange(12))
+            b = (rng.randrange(14), rng.randrange(12))
+            path = maze.path(a, b)
+            check_path(path, a, b)
+            self.assertEqual(len(path) - 1, maze.distance_field(b).distances[a[1] * 14 + a[0]])
+
+        # cells outside the maze are rejected rather than wrapped around or left to the array
+        for outside in ((-1, 0), (0, -1), (14, 0), (10, 12)):
+            with self.assertRaises(ValueError):
+                maze.path(outside, (0, 0))
+            with self.assertRaises(ValueError):
+                maze.path((0, 0), outside)
+            with self.assertRaises(ValueError):
+                maze.distance_field(outside)
+
+    # test the distance field cache stays within its memory budget
+    def test_field_cache_budget(self):
+        from fields import FieldCache
+
+        # each field of a 10x10 grid holds 800 bytes, so only two fit
+        grid = Maze(0, 0, 10, 10, 1, 1, seed=0).grid
+        cache = FieldCache(max_bytes=1600)
+        for source in range(5):
+            cache.get(grid, source)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.nbytes, 1600)
+
+    # test streaming generation matches an in-memory Eller's maze and writes loadable files and images
+    def test_streaming_generation(self):
+        import os
+        import struct
+        import tempfile
+        import itertools
+        import zlib
+        from raster import PBMWriter
+        from storage import MazeFileWriter
+        from streaming import stream_rows, stream_to, write_maze
+
+        # the streamed rows are the walls of the same seeded maze built in memory
+        for seed in range(3):
+            maze = Maze(0, 0, 9, 11, 10, 10, seed=seed, generator="ellers")
+            self.assertEqual(b"".join(stream_rows(11, 9, seed=seed)), bytes(maze.grid.walls))
+
+        # a custom entrance and exit open the same outer walls as a Maze does
+        maze = Maze(0, 0, 9, 11, 10, 10, seed=3, generator="ellers", entrance=(0, 3), exit=(4, 0))
+        self.assertEqual(b"".join(stream_rows(11, 9, seed=3, entrance=(0, 3), exit=(4, 0))), bytes(maze.grid.walls))
+
+        with tempfile.TemporaryDirectory() as directory:
+            # a maze file written row by row loads back as a perfect maze
+            path = os.path.join(directory, "maze.bin")
+            write_maze(path, 13, 7, seed=2, image=os.path.join(directory, "maze.pbm"), cell_size=3)
+            loaded = Maze.load(path)
+            self.assertTrue(is_perfect(loaded.grid))
+            self.assertTrue(loaded.search("bfs").found)
+
+            # the PBM holds (cols * size + 1) x (rows * size + 1) pixels, each line padded to whole bytes
+            with open(os.path.join(directory, "maze.pbm"), "rb") as file:
+                data = file.read()
+            header = b"P4\n40 22\n"
+            self.assertTrue(data.startswith(header))
+            self.assertEqual(len(data), len(header) + 22 * 5)
+
+            # the PNG decompresses to one filter byte and the packed pixels per line
+            image = os.path.join(directory, "maze.png")
+            write_maze(os.path.join(directory, "other.bin"), 13, 7, seed=2, image=image, cell_size=3)
+            with open(image, "rb") as file:
+                data = file.read()
+            self.assertTrue(data.startswith(b"\x89PNG\r\n\x1a\n"))
+            self.assertEqual(struct.unpack(">II", data[16:24]), (40, 22))
+            compressed = b""
+            position = 8
+            while position < len(data):
+                length, kind = struct.unpack(">I4s", data[position:position + 8])
+                if kind == b"IDAT":
+                    compressed += data[position + 8:position + 8 + length]
+                position += length + 12
+            pixels = zlib.decompress(compressed)
+            self.assertEqual(len(pixels), 22 * 6)
+
+            # the top left corner is a wall pixel (black) and the entrance beside it is open (white)
+            self.assertEqual(pixels[1] >> 6, 0b01)
+
+            # the maze file keeps a custom entrance and exit
+            write_maze(os.path.join(directory, "custom.bin"), 13, 7, seed=2, entrance=(12, 3), exit=(0, 6))
+            custom = Maze.load(os.path.join(directory, "custom.bin"))
+            self.assertEqual((custom.entrance, custom.exit), ((12, 3), (0, 6)))
+            self.assertTrue(custom.search("bfs").found)
+
+            # an unknown image format is rejected before the maze file is created
+            with self.assertRaises(ValueError):
+                write_maze(os.path.join(directory, "rejected.bin"), 13, 7, seed=2, image=os.path.join(directory, "maze.gif"))
+            self.assertFalse(os.path.exists(os.path.join(directory, "rejected.bin")))
+
+            # an image that cannot be opened closes the maze file opened before it
+            with self.assertRaises(OSError):
+                write_maze(os.path.join(directory, "orphan.bin"), 13, 7, seed=2, image=os.path.join(directory, "missing", "maze.pbm"))
+            with open(os.path.join(directory, "orphan.bin"), "rb") as file:
+                self.assertEqual(len(file.read()), 32)
+
+            # a stream failing part way closes every writer and keeps its own error
+            def failing_rows():
+                yield from itertools.islice(stream_rows(13, 7, seed=2), 3)
+                raise RuntimeError("generator failed")
+
+            writers = [MazeFileWriter(os.path.join(directory, "partial.bin"), 13, 7), PBMWriter(os.path.join(directory, "partial.pbm"), 13, 7, 3)]
+            with self.assertRaisesRegex(RuntimeError, "generator failed"):
+                stream_to(failing_rows(), writers)
+            with open(os.path.join(directory, "partial.pbm"), "rb") as file:
+                self.assertEqual(len(file.read()), len(header) + (3 * 3 + 1) * 5)
+
+            # a stream that ends early still reports the missing cells, after closing every writer
+            writers = [MazeFileWriter(os.path.join(directory, "short.bin"), 13, 7), PBMWriter(os.path.join(directory, "short.pbm"), 13, 7, 3)]
+            with self.assertRaisesRegex(ValueError, "cells missing"):
+                stream_to(itertools.islice(stream_rows(13, 7, seed=2), 3), writers)
+            with open(os.path.join(directory, "short.pbm"), "rb") as file:
+                self.assertEqual(len(file.read()), len(header) + (3 * 3 + 1) * 5)
+
+    # test offscreen rendering of walls, the solution path and backtracks without a window
+    def test_offscreen_render(self):
+        import os
+        import tempfile
+        from raster import MazeImage, BLACK, WHITE, RED, GREY
+
+        maze = Maze(0, 0, 6, 8, 10, 10, seed=3)
+        with tempfile.TemporaryDirectory() as directory:
+            # the PPM holds a header and 3 bytes for each of (cols * size + 1) x (rows * size + 1) pixels
+            path = os.path.join(directory, "maze.ppm")
+            image = maze.render(path, algorithm="dfs", cell_size=5)
+            with open(path, "rb") as file:
+                data = file.read()
+            self.assertEqual(data, b"P6\n41 31\n255\n" + bytes(image.pixels))
+
+            # helper to read the colour of a pixel
+            def pixel(x, y, image=image):
+                start = (y * image.width + x) * 3
+                return bytes(image.pixels[start:start + 3])
+
+            # the outer corner is a wall, the entrance is open and the exit is reached in red
+            self.assertEqual(pixel(0, 0), BLACK)
+            self.assertEqual(pixel(2, 0), WHITE)
+            self.assertEqual(pixel(7 * 5 + 2, 5 * 5 + 2), RED)
+            colours = {bytes(image.pixels[i:i + 3]) for i in range(0, len(image.pixels), 3)}
+            self.assertTrue(colours <= {BLACK, WHITE, RED, GREY})
+            self.assertIn(GREY, colours)
+
+            # a path alone is drawn red from the entrance to the exit, and loaded mazes render the same walls
+            walls_only = MazeImage(maze.grid, 5)
+            walls_only.draw_path(maze.search("bfs").path)
+            self.assertEqual(pixel(2, 2, walls_only), RED)
+            self.assertEqual(pixel(7 * 5 + 2, 5 * 5 + 2, walls_only), RED)
+            maze.save(os.path.join(directory, "maze.bin"))
+            loaded = Maze.load(os.path.join(directory, "maze.bin")).render(os.path.join(directory, "maze.png"), cell_size=5)
+            self.assertEqual(loaded.pixels, MazeImage(maze.grid, 5).pixels)
+            with open(os.path.join(directory, "maze.png"), "rb") as file:
+                self.assertTrue(file.read().startswith(b"\x89PNG\r\n\x1a\n"))
+
+    # test waiting for input and solving through the event loop instead of busy polling
+    def test_event_loop_waits(self):
+        import asyncio
+        from types import SimpleNamespace
+        from unittest import mock
+        from graphics import Window
+        from observers import ProfileCollector, StatsCollector
+        from solvers import SOLVERS
+
+        # a key press ends the wait and cancels the inactivity timers
+        root = StandInRoot()
+        window = Window(200, 150, root, StandInCanvas())
+        root.after(0, lambda: root.bindings["<KeyPress>"](SimpleNamespace(keysym="Space")))
+        self.assertTrue(window.wait_for_key_press("space"))
+        self.assertEqual(root.callbacks, [])
+        self.assertNotIn("<KeyPress>", root.bindings)
+
+        # without a key press the wait gives up once the timers fire
+        self.assertFalse(window.wait_for_key_press("space", wait_time=0))
+
+        # solving in a worker thread queues the same animation and returns the same result
+        maze = Maze(0, 0, 6, 8, 10, 10, window=window, seed=2)
+        maze.flush_animation()
+        root.run_callbacks()
+        stats = StatsCollector()
+        maze.add_observer(stats)
+        result = asyncio.run(maze.search_async("dfs"))
+        self.assertEqual(result.path, Maze(0, 0, 6, 8, 10, 10, seed=2).search("dfs").path)
+        self.assertGreater(maze._Maze__scheduler.pending, 0)
+
+        # the solve phase covers the search in the worker, not only the replay of its events
+        self.assertGreaterEqual(stats.timings["solve"], result.elapsed_time)
+        self.assertEqual(stats.counters["solve", "cell_visited"], result.nodes_expanded)
+        maze.remove_observer(stats)
+        calls = []
+        class PhaseLog(StatsCollector):
+            def on_phase_start(self, phase):
+                calls.append(("start", phase))
+
+            def on_phase_end(self, phase):
+                calls.append(("end", phase))
+
+        def solver(*args):
+            calls.append("solver")
+            return SOLVERS["bfs"](*args)
+        traced = Maze(0, 0, 6, 8, 10, 10, seed=2)
+        traced.add_observer(PhaseLog())
+        with mock.patch.dict("maze.SOLVERS", traced=solver):
+            asyncio.run(traced.search_async("traced"))
+        self.assertEqual(calls, [("start", "solve"), "solver", ("end", "solve")])
+
+        # the profiler follows the search into the worker thread
+        profile = ProfileCollector(phases=("solve",))
+        profiled = Maze(0, 0, 6, 8, 10, 10, seed=2, observers=[profile])
+        asyncio.run(profiled.search_async("dfs"))
+        self.assertIn("solve_dfs", profile.report())
+
+        # the animation plays back while the asyncio loop pumps window events
+        asyncio.run(maze.wait_for_animation_async(interval=0))
+        self.assertEqual(maze._Maze__scheduler.pending, 0)
+
+        # closing the window ends the asynchronous waits
+        async def wait():
+            root.after(0, window.close)
+            await window.wait_for_close_async(interval=0)
+            return await window.wait_for_key_press_async(interval=0)
+        self.assertFalse(asyncio.run(wait()))
+
     # test key press handling in graphics module
     def test_key_press_handling(self):
         # import the graphics module
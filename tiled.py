@@ -0,0 +1,108 @@
+# import necessary modules
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+from batch import derive_seed
+from generators import GENERATORS, generate_kruskal, make_rng
+from grid import Grid, ALL_WALLS, ENTRANCE_WALLS, EXIT_WALLS, LEFT, RIGHT, TOP, BOTTOM, boundary_index, outer_wall
+
+# configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# default tile size in cells, large enough that a tile outweighs the cost of handing it to a worker
+TILE_SIZE = 256
+
+# function to split a grid into tiles, returning (col, row, tile columns, tile rows) for each, row by row
+def tile_bounds(num_cols, num_rows, tile_size=TILE_SIZE):
+    return [(col, row, min(tile_size, num_cols - col), min(tile_size, num_rows - row))
+            for row in range(0, num_rows, tile_size) for col in range(0, num_cols, tile_size)]
+
+# function to generate one tile as a standalone maze and copy it into the shared walls, run inside a worker process
+def generate_tile(job):
+    name, num_cols, col, row, tile_cols, tile_rows, seed, generator = job
+    grid = Grid(tile_cols, tile_rows)
+    GENERATORS[generator](grid, make_rng(seed))
+
+    # each tile writes only its own rows of the shared buffer, so workers never overlap
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        buffer = memory.buf
+        for tile_row in range(tile_rows):
+            start = (row + tile_row) * num_cols + col
+            buffer[start:start + tile_cols] = grid.walls[tile_row * tile_cols:(tile_row + 1) * tile_cols]
+        del buffer
+    finally:
+        memory.close()
+    return col, row
+
+# function to join the tiles along a random spanning tree of the tile grid, opening one wall per tree edge
+def stitch_tiles(grid, tile_size, rng):
+    walls = grid.walls
+    num_cols = grid.num_cols
+    tiles_x = -(-num_cols // tile_size)
+    tiles_y = -(-grid.num_rows // tile_size)
+
+    # every tile is a perfect maze, so joining them along a spanning tree leaves exactly one path between any two cells
+    edges = []
+    generate_kruskal(Grid(tiles_x, tiles_y), rng, 0, lambda tile, next_tile: edges.append((tile, next_tile)))
+    for tile, next_tile in edges:
+        col = tile % tiles_x * tile_size
+        row = tile // tiles_x * tile_size
+
+        # open a random cell of the shared border, between the tile and the one below or to its right
+        if next_tile == tile + tiles_x:
+            col += rng.randrange(min(tile_size, num_cols - col))
+            index = (row + tile_size - 1) * num_cols + col
+            walls[index] &= ~BOTTOM
+            walls[index + num_cols] &= ~TOP
+        else:
+            row += rng.randrange(min(tile_size, grid.num_rows - row))
+            index = row * num_cols + col + tile_size - 1
+            walls[index] &= ~RIGHT
+            walls[index + 1] &= ~LEFT
+    return len(edges)
+
+# function to generate one huge perfect maze by building its tiles in parallel in shared memory, then stitching them
+def generate_tiled(num_cols, num_rows, seed=None, workers=None, tile_size=TILE_SIZE, generator="backtracker", entrance=(0, 0), exit=None):
+    if generator not in GENERATORS:
+        raise ValueError(f"Unknown generator algorithm: {generator}")
+    if tile_size < 1:
+        raise ValueError("Tile size must be at least 1.")
+
+    # the entrance and exit are boundary cells, the exit defaulting to the bottom-right cell
+    if exit is None:
+        exit = (num_cols - 1, num_rows - 1)
+    entrance = boundary_index(num_cols, num_rows, entrance, "Entrance")
+    exit = boundary_index(num_cols, num_rows, exit, "Exit")
+
+    # every tile seed derives from the base seed, so the maze is the same for any number of workers
+    rng = make_rng(seed)
+    base_seed = rng.getrandbits(63) if seed is None else seed
+    tiles = tile_bounds(num_cols, num_rows, tile_size)
+    num_cells = num_cols * num_rows
+
+    memory = shared_memory.SharedMemory(create=True, size=max(1, num_cells))
+    try:
+        memory.buf[:num_cells] = bytes([ALL_WALLS]) * num_cells
+        jobs = [(memory.name, num_cols, col, row, tile_cols, tile_rows, derive_seed(base_seed, index), generator)
+                for index, (col, row, tile_cols, tile_rows) in enumerate(tiles)]
+        workers = min(workers or multiprocessing.cpu_count(), len(jobs))
+
+        # a single worker runs in this process to skip the pool start-up cost
+        if workers <= 1:
+            for job in jobs:
+                generate_tile(job)
+        else:
+            with multiprocessing.Pool(workers) as pool:
+                for _ in pool.imap_unordered(generate_tile, jobs):
+                    pass
+        grid = Grid(num_cols, num_rows, bytearray(memory.buf[:num_cells]))
+    finally:
+        memory.close()
+        memory.unlink()
+
+    # join the tiles, then break the entrance and exit, the same walls as a Maze breaks
+    stitch_tiles(grid, tile_size, rng)
+    grid.walls[entrance] &= ~outer_wall(num_cols, num_rows, entrance, ENTRANCE_WALLS)
+    grid.walls[exit] &= ~outer_wall(num_cols, num_rows, exit, EXIT_WALLS)
+    return grid